@@ -0,0 +1,3 @@
+"""
+REST API package for the Football Field Management System
+"""
@@ -0,0 +1,344 @@
+"""
+Flask REST API for the Football Field Management System
+
+Run with: python -m api.app
+"""
+import base64
+import gzip
+import json
+import zlib
+from datetime import timezone
+from bson.objectid import ObjectId
+from flask import Flask, Response, request
+from api.cache import ResponseCache
+from database import Database
+from config import (
+    API_HOST, API_PORT, API_MAX_PAGE_SIZE, API_GZIP_MIN_SIZE, PAGE_SIZE, LIST_PROJECTION,
+    SEARCH_MODE, EXPORT_CHUNK_SIZE
+)
+from utils.importer import validate_row
+
+# Keys clients may request with ?fields=
+FIELD_KEYS = ("name", "location", "capacity", "price_per_hour", "status", "description",
+              "created_at", "updated_at")
+
+# Keys stored for search and sorting only, never returned to clients
+INTERNAL_KEYS = ("name_lower", "location_lower")
+
+# Sort keys accepted by ?sort= and the indexed fields they sort on
+SORT_FIELDS = {
+    "name": "name_lower",
+    "location": "location_lower",
+    "capacity": "capacity",
+    "price_per_hour": "price_per_hour",
+    "status": "status"
+}
+
+class ApiError(Exception):
+    """Error returned to the client as a JSON body"""
+    
+    def __init__(self, message, status=400):
+        """Initialize the error"""
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+def serialize(field, drop=()):
+    """Convert a field document to JSON-compatible types, leaving out internal keys and the keys in drop"""
+    field = {key: value for key, value in field.items() if key not in drop and key not in INTERNAL_KEYS}
+    if "_id" in field:
+        field["_id"] = str(field["_id"])
+    return field
+
+def json_response(data, status=200):
+    """Build a JSON response"""
+    return Response(json.dumps(data, separators=(",", ":")), status=status, mimetype="application/json")
+
+def error_status(message):
+    """Pick the HTTP status of a Database error message"""
+    if message == "Field not found":
+        return 404
+    if message.startswith("MongoDB connection failed") or "unavailable" in message:
+        return 503
+    return 500
+
+def encode_cursor(cursor):
+    """Encode a page cursor as an opaque URL-safe token"""
+    if cursor is None:
+        return None
+    if isinstance(cursor, tuple):
+        cursor = [cursor[0], str(cursor[1])]
+    else:
+        cursor = str(cursor)
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+def decode_cursor(token):
+    """Decode a page cursor token"""
+    if not token:
+        return None
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(token.encode()))
+        if isinstance(cursor, list):
+            return cursor[0], ObjectId(cursor[1])
+        return ObjectId(cursor)
+    except Exception:
+        raise ApiError("Invalid cursor")
+
+def parse_projection(default=None):
+    """Build a projection from ?fields=name,location"""
+    fields = request.args.get("fields")
+    if not fields:
+        return default
+    
+    keys = [key.strip() for key in fields.split(",") if key.strip()]
+    unknown = [key for key in keys if key not in FIELD_KEYS]
+    if unknown:
+        raise ApiError(f"Unknown fields: {', '.join(unknown)}")
+    return {key: 1 for key in keys}
+
+def parse_limit():
+    """Get the page size from ?limit="""
+    try:
+        limit = int(request.args.get("limit", PAGE_SIZE))
+    except ValueError:
+        raise ApiError("limit must be a number")
+    if not 1 <= limit <= API_MAX_PAGE_SIZE:
+        raise ApiError(f"limit must be between 1 and {API_MAX_PAGE_SIZE}")
+    return limit
+
+def parse_query(db):
+    """Build the MongoDB query for ?status= and ?q= (search)"""
+    conditions = []
+    if request.args.get("status"):
+        conditions.append({"status": request.args["status"]})
+    if request.args.get("q"):
+        conditions.append(db.build_search_query(request.args["q"], request.args.get("mode", SEARCH_MODE)))
+    
+    if len(conditions) > 1:
+        return {"$and": conditions}
+    return conditions[0] if conditions else None
+
+def parse_field_id(field_id):
+    """Check a field ID from the URL"""
+    if not ObjectId.is_valid(field_id):
+        raise ApiError("Invalid field ID")
+    return field_id
+
+def parse_field(payload):
+    """Validate a request body and convert it to a field document"""
+    field, errors = validate_row(payload)
+    if errors:
+        raise ApiError("; ".join(errors), 422)
+    return field
+
+def accepts_gzip():
+    """Check whether the client accepts gzip responses"""
+    return "gzip" in request.headers.get("Accept-Encoding", "").lower()
+
+def is_not_modified(cached):
+    """Check the client's If-None-Match / If-Modified-Since against a cached response"""
+    if request.if_none_match:
+        return request.if_none_match.contains(cached.etag)
+    
+    since = request.if_modified_since
+    if since is None or cached.last_modified is None:
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return cached.last_modified <= since
+
+def conditional_response(cached):
+    """Answer from a cached response, with 304 Not Modified when the client's copy is current"""
+    if is_not_modified(cached):
+        response = Response(status=304)
+    elif accepts_gzip() and len(cached.body) >= API_GZIP_MIN_SIZE:
+        response = Response(cached.compressed(), mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(cached.body, mimetype="application/json")
+    
+    response.set_etag(cached.etag)
+    if cached.last_modified is not None:
+        response.last_modified = cached.last_modified
+    
+    # Clients may keep the response but must revalidate it before reuse
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+def gzip_chunks(chunks):
+    """Compress a stream of text chunks into one gzip stream"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+def json_array_chunks(cursor):
+    """Serialize a cursor as a JSON array, a batch of fields at a time"""
+    yield "["
+    first = True
+    batch = []
+    for field in cursor:
+        batch.append(json.dumps(serialize(field), separators=(",", ":")))
+        if len(batch) >= EXPORT_CHUNK_SIZE:
+            yield ("" if first else ",") + ",".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield ("" if first else ",") + ",".join(batch)
+    yield "]"
+
+def create_app(db=None, response_cache=None):
+    """Create the Flask application"""
+    app = Flask(__name__)
+    db = db or Database()
+    app.config["DATABASE"] = db
+    
+    # Reads are answered from the cache until a write invalidates them
+    response_cache = response_cache or ResponseCache()
+    db.add_write_listener(response_cache.on_write)
+    app.config["RESPONSE_CACHE"] = response_cache
+    
+    @app.errorhandler(ApiError)
+    def handle_api_error(error):
+        """Return API errors as JSON"""
+        return json_response({"error": error.message}, error.status)
+    
+    def result_or_error(success, result):
+        """Unpack a Database result, raising its error message"""
+        if not success:
+            raise ApiError(result, error_status(result))
+        return result
+    
+    def cached_json(kind, field_id, build):
+        """Serve a read from the response cache, building it with build() on a miss"""
+        key = (kind, field_id, request.full_path)
+        
+        # Other processes write to MongoDB without notifying this one
+        response_cache.revalidate(db.get_version)
+        cached = response_cache.get(key)
+        if cached is None:
+            data, documents = build()
+            cached = response_cache.put(key, json.dumps(data, separators=(",", ":")).encode(), documents)
+        return conditional_response(cached)
+    
+    @app.route("/api/fields", methods=["GET"])
+    def list_fields():
+        """List fields a page at a time, optionally filtered by ?status= and ?q="""
+        sort = request.args.get("sort")
+        if sort and sort not in SORT_FIELDS:
+            raise ApiError(f"Unknown sort key: {sort}")
+        
+        # updated_at is always fetched (the ETag is derived from it) and get_fields_page
+        # adds the sort key; neither is returned unless requested
+        projection = parse_projection(LIST_PROJECTION)
+        drop = [key for key in ("updated_at", SORT_FIELDS.get(sort)) if key and key not in projection]
+        
+        def build():
+            fields, next_cursor = result_or_error(*db.get_fields_page(
+                decode_cursor(request.args.get("cursor")),
+                page_size=parse_limit(),
+                projection=dict(projection, updated_at=1),
+                sort_field=SORT_FIELDS.get(sort),
+                descending=request.args.get("order") == "desc",
+                query=parse_query(db)
+            ))
+            data = {
+                "fields": [serialize(field, drop) for field in fields],
+                "next_cursor": encode_cursor(next_cursor)
+            }
+            return data, fields
+        
+        return cached_json("list", None, build)
+    
+    @app.route("/api/fields/search", methods=["GET"])
+    def search_fields():
+        """Search fields by name or location"""
+        if not request.args.get("q"):
+            raise ApiError("q is required")
+        return list_fields()
+    
+    @app.route("/api/fields/stream", methods=["GET"])
+    def stream_fields():
+        """Stream every matching field as one JSON array without buffering it"""
+        cursor = result_or_error(*db.get_fields_cursor(
+            parse_query(db),
+            parse_projection(),
+            batch_size=EXPORT_CHUNK_SIZE
+        ))
+        
+        chunks = json_array_chunks(cursor)
+        headers = {}
+        if accepts_gzip():
+            chunks = gzip_chunks(chunks)
+            headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+        return Response(chunks, mimetype="application/json", headers=headers)
+    
+    @app.route("/api/fields/<field_id>", methods=["GET"])
+    def get_field(field_id):
+        """Get one field"""
+        parse_field_id(field_id)
+        projection = parse_projection()
+        
+        def build():
+            field = result_or_error(*db.get_field_by_id(field_id))
+            drop = [key for key in field if projection and key not in projection and key != "_id"]
+            return serialize(field, drop), [field]
+        
+        return cached_json("field", field_id, build)
+    
+    @app.route("/api/fields", methods=["POST"])
+    def create_field():
+        """Create a field"""
+        field = parse_field(request.get_json(silent=True))
+        created = result_or_error(*db.create_field(field.to_dict()))
+        return json_response(serialize(created), 201)
+    
+    @app.route("/api/fields/<field_id>", methods=["PUT", "PATCH"])
+    def update_field(field_id):
+        """Replace (PUT) or partially update (PATCH) a field"""
+        parse_field_id(field_id)
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict):
+            raise ApiError("Request body must be a JSON object")
+        
+        if request.method == "PATCH":
+            existing = result_or_error(*db.get_field_by_id(field_id))
+            payload = dict(existing, **payload)
+        
+        field = parse_field(payload)
+        field._id = field_id  # An update keeps the original created_at
+        updated = result_or_error(*db.update_field(field_id, field.to_dict()))
+        return json_response(serialize(updated))
+    
+    @app.route("/api/fields/<field_id>", methods=["DELETE"])
+    def delete_field(field_id):
+        """Delete a field"""
+        result_or_error(*db.delete_field(parse_field_id(field_id)))
+        return Response(status=204)
+    
+    @app.after_request
+    def compress(response):
+        """Gzip buffered responses for clients that accept it"""
+        if (response.direct_passthrough or response.is_streamed or "Content-Encoding" in response.headers
+                or response.status_code != 200 or not accepts_gzip()):
+            return response
+        
+        data = response.get_data()
+        if len(data) >= API_GZIP_MIN_SIZE:
+            response.set_data(gzip.compress(data, compresslevel=6))
+            response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+    
+    return app
+
+def main():
+    """Run the API with Flask's threaded server"""
+    create_app().run(host=API_HOST, port=API_PORT, threaded=True)
+
+if __name__ == "__main__":
+    main()
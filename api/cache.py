@@ -0,0 +1,141 @@
+"""
+Response cache for the REST API
+"""
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from config import API_CACHE_SIZE, API_CACHE_TTL, API_CACHE_REVALIDATE_SECONDS
+
+def make_etag(documents):
+    """Derive an ETag from the IDs and updated_at stamps of the documents in a response"""
+    digest = hashlib.sha1()
+    for document in documents:
+        digest.update(f"{document.get('_id')}@{document.get('updated_at')};".encode())
+    return digest.hexdigest()
+
+def last_modified(documents):
+    """Get the latest updated_at of the documents in a response"""
+    stamps = [document["updated_at"] for document in documents if document.get("updated_at")]
+    if not stamps:
+        return None
+    try:
+        # updated_at is stored as local ISO time
+        return datetime.fromisoformat(max(stamps)).astimezone().replace(microsecond=0)
+    except (TypeError, ValueError):
+        return None
+
+class CachedResponse:
+    """Serialized response body with its validators"""
+    
+    __slots__ = ("body", "etag", "last_modified", "created", "gzip_body")
+    
+    def __init__(self, body, etag, last_modified):
+        """Initialize the cached response"""
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.created = time.monotonic()
+        self.gzip_body = None
+    
+    def compressed(self):
+        """Get the gzip-compressed body, compressing it once"""
+        if self.gzip_body is None:
+            self.gzip_body = gzip.compress(self.body, compresslevel=6)
+        return self.gzip_body
+
+class ResponseCache:
+    """Bounded LRU of serialized read responses, invalidated by database writes"""
+    
+    def __init__(self, max_size=API_CACHE_SIZE, ttl=API_CACHE_TTL, revalidate_seconds=API_CACHE_REVALIDATE_SECONDS):
+        """Initialize the cache"""
+        # ttl bounds staleness from writes revalidate() cannot see (e.g. an update
+        # stamped by a client whose clock is behind); 0 keeps entries until invalidated
+        self.max_size = max_size
+        self.ttl = ttl
+        self.responses = OrderedDict()
+        self.lock = threading.Lock()
+        
+        # Collection version the cached responses were built from, and when it was checked
+        self.revalidate_seconds = revalidate_seconds
+        self.version = None
+        self.checked_at = None
+        
+        # Counters for tuning the cache size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key):
+        """Get a cached response, or None"""
+        with self.lock:
+            response = self.responses.get(key)
+            if response is not None and self.ttl and time.monotonic() - response.created > self.ttl:
+                del self.responses[key]
+                response = None
+            if response is None:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self.responses.move_to_end(key)
+            return response
+    
+    def put(self, key, body, documents):
+        """Cache a serialized body with validators derived from its documents"""
+        response = CachedResponse(body, make_etag(documents), last_modified(documents))
+        with self.lock:
+            self.responses[key] = response
+            self.responses.move_to_end(key)
+            
+            # Evict the least recently used responses
+            while len(self.responses) > self.max_size:
+                self.responses.popitem(last=False)
+                self.evictions += 1
+        return response
+    
+    def revalidate(self, get_version):
+        """Drop every response when get_version() shows another process wrote since the last check"""
+        now = time.monotonic()
+        with self.lock:
+            if self.checked_at is not None and now - self.checked_at < self.revalidate_seconds:
+                return
+            self.checked_at = now
+        
+        success, version = get_version()
+        with self.lock:
+            if not success or version != self.version:
+                self.responses.clear()
+            self.version = version if success else None
+    
+    def invalidate(self, field_id=None):
+        """Drop every listing and the lookups of a field (of every field if None)"""
+        with self.lock:
+            for key in list(self.responses):
+                kind, key_field_id = key[0], key[1]
+                if kind != "field" or field_id is None or key_field_id == str(field_id):
+                    del self.responses[key]
+    
+    def on_write(self, action, field):
+        """Database write listener"""
+        self.invalidate(field.get("_id") if field else None)
+    
+    def clear(self):
+        """Remove all responses from the cache"""
+        with self.lock:
+            self.responses.clear()
+    
+    def stats(self):
+        """Get the cache counters"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.responses),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
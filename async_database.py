@@ -0,0 +1,152 @@
+"""
+Asyncio database operations for the Football Field Management System
+"""
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from pymongo.errors import OperationFailure
+from database import Database
+from config import MONGO_MAX_POOL_SIZE, PAGE_SIZE, LIST_PROJECTION, SEARCH_MODE
+
+def next_batch(cursor, batch_size):
+    """Read up to batch_size documents from a cursor"""
+    return list(itertools.islice(cursor, batch_size))
+
+class AsyncDatabase:
+    """Database operations as coroutines, for running many lookups concurrently"""
+    
+    def __init__(self, database=None, max_workers=MONGO_MAX_POOL_SIZE):
+        """Initialize the async database around a Database"""
+        # Calls run on a bounded pool sized to the connection pool, so any number of
+        # coroutines share max_workers threads and sockets
+        self.database = database or Database()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-db")
+        self.connect_lock = None
+    
+    async def run(self, func, *args, **kwargs):
+        """Run a blocking database call on the pool"""
+        if not self.database.is_connected:
+            await self.connect()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+    
+    async def connect(self):
+        """Connect to MongoDB"""
+        # One connection attempt even when many coroutines start at once
+        if self.connect_lock is None:
+            self.connect_lock = asyncio.Lock()
+        async with self.connect_lock:
+            if self.database.is_connected:
+                return True, "Connected to MongoDB successfully"
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self.database.connect)
+    
+    async def create_field(self, field_data):
+        """Create a new football field"""
+        return await self.run(self.database.create_field, field_data)
+    
+    async def bulk_create_fields(self, fields_data):
+        """Create many football fields with one unordered insert"""
+        return await self.run(self.database.bulk_create_fields, fields_data)
+    
+    async def get_all_fields(self):
+        """Get all football fields"""
+        return await self.run(self.database.get_all_fields)
+    
+    async def get_fields_page(self, cursor=None, **kwargs):
+        """Get a page of football fields and the cursor of the next page (None if last)"""
+        return await self.run(self.database.get_fields_page, cursor, **kwargs)
+    
+    async def get_field_changes(self, since, projection=None):
+        """Get the fields updated and the IDs of the fields deleted since a time"""
+        return await self.run(self.database.get_field_changes, since, projection)
+    
+    async def get_field_by_id(self, field_id):
+        """Get a football field by ID"""
+        return await self.run(self.database.get_field_by_id, field_id)
+    
+    async def update_field(self, field_id, field_data):
+        """Update a football field"""
+        return await self.run(self.database.update_field, field_id, field_data)
+    
+    async def delete_field(self, field_id):
+        """Delete a football field"""
+        return await self.run(self.database.delete_field, field_id)
+    
+    async def search_fields(self, query, mode=SEARCH_MODE, projection=None, limit=0):
+        """Search for football fields, optionally projected and returning at most limit (0 for all)"""
+        return await self.run(self.database.search_fields, query, mode, projection, limit)
+    
+    async def filter_fields_by_status(self, status):
+        """Filter fields by status"""
+        return await self.run(self.database.filter_fields_by_status, status)
+    
+    async def aggregate_fields(self, pipeline, fallback=None):
+        """Run an aggregation pipeline on the fields collection"""
+        return await self.run(self.database.aggregate_fields, pipeline, fallback)
+    
+    async def iter_fields(self, query=None, projection=None, batch_size=PAGE_SIZE):
+        """Stream football fields, fetching batch_size documents at a time"""
+        success, cursor = await self.run(self.database.get_fields_cursor, query, projection, batch_size)
+        if not success:
+            raise RuntimeError(cursor)
+        
+        try:
+            while True:
+                batch = await self.run(next_batch, cursor, batch_size)
+                if not batch:
+                    break
+                for field in batch:
+                    yield field
+        finally:
+            cursor.close()
+    
+    async def iter_pages(self, page_size=PAGE_SIZE, projection=LIST_PROJECTION, sort_field=None,
+                         descending=False):
+        """Stream pages of football fields using keyset pagination"""
+        cursor = None
+        while True:
+            success, result = await self.get_fields_page(
+                cursor,
+                page_size=page_size,
+                projection=projection,
+                sort_field=sort_field,
+                descending=descending
+            )
+            if not success:
+                raise RuntimeError(result)
+            
+            fields, cursor = result
+            if fields:
+                yield fields
+            if cursor is None:
+                break
+    
+    async def iter_search(self, query, mode=SEARCH_MODE, batch_size=PAGE_SIZE):
+        """Stream the football fields matching a search"""
+        streamed = False
+        try:
+            async for field in self.iter_fields(self.database.build_search_query(query, mode), batch_size=batch_size):
+                streamed = True
+                yield field
+        except OperationFailure:
+            if mode == "regex" or streamed:
+                raise
+            # The index this mode needs is missing, fall back to a regex search like search_fields
+            async for field in self.iter_search(query, "regex", batch_size):
+                yield field
+    
+    async def close(self):
+        """Release the worker threads"""
+        # The MongoDB client is shared by every Database in the process, so it stays open
+        self.executor.shutdown(wait=False)
+    
+    async def __aenter__(self):
+        """Connect when entering an async with block"""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, traceback):
+        """Close when leaving an async with block"""
+        await self.close()
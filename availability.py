@@ -0,0 +1,240 @@
+"""
+Field availability index for the Football Field Management System
+"""
+import bisect
+import threading
+from datetime import datetime, timedelta
+from pymongo.errors import PyMongoError
+from config import AVAILABILITY_SLOT_MINUTES, LIST_PROJECTION
+
+# Slots per day at the configured slot length
+SLOTS_PER_DAY = 24 * 60 // AVAILABILITY_SLOT_MINUTES
+
+def slot_range(start, end):
+    """Split [start, end) into (day ordinal, first slot, end slot) pieces, rounding outwards to slots"""
+    pieces = []
+    day = start.date()
+    while datetime.combine(day, datetime.min.time()) < end:
+        day_start = datetime.combine(day, datetime.min.time())
+        first = max(start, day_start)
+        last = min(end, day_start + timedelta(days=1))
+        first_slot = (first - day_start) // timedelta(minutes=AVAILABILITY_SLOT_MINUTES)
+        end_slot = -((day_start - last) // timedelta(minutes=AVAILABILITY_SLOT_MINUTES))
+        if end_slot > first_slot:
+            pieces.append((day.toordinal(), first_slot, end_slot))
+        day += timedelta(days=1)
+    return pieces
+
+class AvailabilityIndex:
+    """Bitmap index answering "which fields are free from start to end" without scanning bookings"""
+    
+    def __init__(self):
+        """Initialize an empty index"""
+        self.lock = threading.RLock()
+        self.reset()
+    
+    def reset(self):
+        """Remove every field and booking"""
+        # Each field gets a bit position; field bitmaps are Python ints over those bits
+        self.bits = {}
+        self.fields = {}
+        self.free_bits = []
+        self.next_bit = 0
+        self.all_fields = 0
+        self.status_masks = {}
+        self.location_masks = {}
+        
+        # Capacity thresholds and the fields at or above each, rebuilt on demand
+        self.capacity_levels = []
+        self.capacity_masks = []
+        self.capacity_dirty = False
+        
+        # Per-field, per-day slot bitmaps and, per day, the booked-fields bitmap of each slot
+        self.field_days = {}
+        self.day_slots = {}
+        self.booking_manager = None
+    
+    def __len__(self):
+        """Number of fields in the index"""
+        return len(self.bits)
+    
+    def load(self, db, booking_manager):
+        """Fill the index with every field and the manager's confirmed bookings"""
+        success, cursor = db.get_fields_cursor(None, LIST_PROJECTION)
+        if not success:
+            return False, cursor
+        
+        try:
+            fields = list(cursor)
+        except PyMongoError as e:
+            return False, f"Error loading fields: {str(e)}"
+        
+        success, result = booking_manager.load()
+        if not success:
+            return False, result
+        
+        with self.lock:
+            self.reset()
+            self.booking_manager = booking_manager
+            for field in fields:
+                self.upsert_field(field)
+            for booking in booking_manager.all_bookings():
+                self.update_booking(booking)
+        return True, len(self)
+    
+    def upsert_field(self, field):
+        """Add a field or update its status, capacity and location"""
+        field_id = str(field["_id"])
+        with self.lock:
+            bit = self.bits.get(field_id)
+            if bit is None:
+                bit = self.free_bits.pop() if self.free_bits else self.next_bit
+                if bit == self.next_bit:
+                    self.next_bit += 1
+                self.bits[field_id] = bit
+                self.all_fields |= 1 << bit
+            else:
+                self.clear_attributes(bit)
+            
+            self.fields[bit] = field
+            flag = 1 << bit
+            status = field.get("status")
+            self.status_masks[status] = self.status_masks.get(status, 0) | flag
+            location = str(field.get("location", "")).lower()
+            self.location_masks[location] = self.location_masks.get(location, 0) | flag
+            self.capacity_dirty = True
+    
+    def remove_field(self, field_id):
+        """Remove a field and its bookings"""
+        with self.lock:
+            bit = self.bits.pop(str(field_id), None)
+            if bit is None:
+                return
+            self.clear_attributes(bit)
+            del self.fields[bit]
+            self.all_fields &= ~(1 << bit)
+            for day in [key[1] for key in self.field_days if key[0] == bit]:
+                self.set_slots(bit, day, self.field_days[(bit, day)], booked=False)
+            self.free_bits.append(bit)
+            self.capacity_dirty = True
+    
+    def clear_attributes(self, bit):
+        """Clear a field's bit from the status and location masks"""
+        flag = 1 << bit
+        for masks in (self.status_masks, self.location_masks):
+            for key in [key for key, mask in masks.items() if mask & flag]:
+                masks[key] &= ~flag
+                if not masks[key]:
+                    del masks[key]
+    
+    def rebuild_capacity_masks(self):
+        """Rebuild the capacity threshold masks after fields changed"""
+        levels = sorted({field.get("capacity") or 0 for field in self.fields.values()})
+        masks = [0] * len(levels)
+        for bit, field in self.fields.items():
+            masks[bisect.bisect_left(levels, field.get("capacity") or 0)] |= 1 << bit
+        
+        # Each level's mask also holds the fields of every higher level
+        for index in range(len(masks) - 2, -1, -1):
+            masks[index] |= masks[index + 1]
+        
+        self.capacity_levels = levels
+        self.capacity_masks = masks
+        self.capacity_dirty = False
+    
+    def set_slots(self, bit, day, slots, booked=True):
+        """Mark slots (a bitmap) of a field on a day as booked or free"""
+        key = (bit, day)
+        slot_masks = self.day_slots.setdefault(day, [0] * SLOTS_PER_DAY)
+        flag = 1 << bit
+        if booked:
+            self.field_days[key] = self.field_days.get(key, 0) | slots
+        else:
+            remaining = self.field_days.get(key, 0) & ~slots
+            if remaining:
+                self.field_days[key] = remaining
+            else:
+                self.field_days.pop(key, None)
+        
+        slot = 0
+        while slots:
+            if slots & 1:
+                if booked:
+                    slot_masks[slot] |= flag
+                else:
+                    slot_masks[slot] &= ~flag
+            slots >>= 1
+            slot += 1
+    
+    def update_booking(self, booking, booked=True):
+        """Mark the slots of a booking as booked or free"""
+        with self.lock:
+            bit = self.bits.get(str(booking["field_id"]))
+            if bit is None:
+                return
+            for day, first_slot, end_slot in slot_range(booking["start"], booking["end"]):
+                slots = ((1 << (end_slot - first_slot)) - 1) << first_slot
+                self.set_slots(bit, day, slots, booked)
+    
+    def on_booking_change(self, action, booking):
+        """BookingManager listener keeping the booked slots current"""
+        if action == "create":
+            self.update_booking(booking)
+        elif action == "cancel":
+            with self.lock:
+                self.update_booking(booking, booked=False)
+                
+                # Slots are rounded outwards, so a neighbouring booking may share the freed edge slots
+                if self.booking_manager is not None:
+                    day_start = datetime.combine(booking["start"].date(), datetime.min.time())
+                    day_end = datetime.combine(booking["end"].date(), datetime.min.time()) + timedelta(days=1)
+                    for other in self.booking_manager.get_bookings(booking["field_id"], day_start, day_end):
+                        self.update_booking(other)
+    
+    def on_field_write(self, action, field):
+        """Database write listener keeping the field attributes current"""
+        if field is None:
+            return
+        if action == "delete":
+            self.remove_field(field["_id"])
+        else:
+            self.upsert_field(field)
+    
+    def available_fields(self, start, end, min_capacity=None, status="Available", location=None):
+        """Get the fields with no booking between start and end that match the filters, by name"""
+        with self.lock:
+            candidates = self.all_fields
+            if status:
+                candidates &= self.status_masks.get(status, 0)
+            
+            if location:
+                # Locations starting with the given text, case-insensitively
+                location = location.lower()
+                location_mask = 0
+                for key, mask in self.location_masks.items():
+                    if key.startswith(location):
+                        location_mask |= mask
+                candidates &= location_mask
+            
+            if min_capacity:
+                if self.capacity_dirty:
+                    self.rebuild_capacity_masks()
+                level = bisect.bisect_left(self.capacity_levels, min_capacity)
+                candidates &= self.capacity_masks[level] if level < len(self.capacity_masks) else 0
+            
+            # A field is taken if any slot of the range has its bit set
+            booked = 0
+            for day, first_slot, end_slot in slot_range(start, end):
+                slot_masks = self.day_slots.get(day)
+                if slot_masks:
+                    for slot in range(first_slot, end_slot):
+                        booked |= slot_masks[slot]
+            candidates &= ~booked
+            
+            fields = []
+            while candidates:
+                lowest = candidates & -candidates
+                fields.append(self.fields[lowest.bit_length() - 1])
+                candidates ^= lowest
+        
+        return sorted(fields, key=lambda field: str(field.get("name", "")).lower())
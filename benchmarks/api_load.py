@@ -0,0 +1,97 @@
+"""
+Load test for the REST API: requests/sec and latency percentiles
+
+Run with: python -m benchmarks.api_load [--requests N] [--concurrency N] [--url URL] [--standin]
+
+Without --url the API is started in-process against the MongoDB server from
+config.py (or an in-process stand-in collection with --standin).
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import WSGIRequestHandler, make_server
+from api.app import create_app
+from benchmarks.standin import StandInCollection, standin_database
+from database import Database
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler without per-request logging"""
+    
+    def log_request(self, *args, **kwargs):
+        """Skip the access log"""
+
+def start_server(db):
+    """Serve the API on a free local port in a background thread"""
+    server = make_server("127.0.0.1", 0, create_app(db), threaded=True, request_handler=QuietRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+def fetch(url):
+    """Request a URL and return its latency in seconds"""
+    started = time.perf_counter()
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+    with urllib.request.urlopen(request) as response:
+        response.read()
+    return time.perf_counter() - started
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of sorted values"""
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def main():
+    """Run the load test"""
+    parser = argparse.ArgumentParser(description="Load test the REST API")
+    parser.add_argument("--requests", type=int, default=2000, help="Total number of requests")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--url", help="Base URL of a running API")
+    parser.add_argument("--standin", action="store_true", help="Use an in-process stand-in collection")
+    args = parser.parse_args()
+    
+    server = None
+    base_url = args.url
+    if not base_url:
+        if args.standin:
+            db = standin_database(StandInCollection())
+            db.bulk_create_fields([
+                {"name": f"Field {index}", "location": f"Location {index % 50}", "capacity": 10 + index % 13,
+                 "price_per_hour": 20.0 + index % 40, "status": "Available", "description": ""}
+                for index in range(1000)
+            ])
+        else:
+            db = Database()
+            success, message = db.connect()
+            if not success:
+                parser.exit(1, message + "\n")
+        server, base_url = start_server(db)
+    
+    # One lookup target taken from the first page
+    with urllib.request.urlopen(f"{base_url}/api/fields?limit=1") as response:
+        fields = json.loads(response.read())["fields"]
+    
+    # A mix of the read paths clients use
+    paths = ["/api/fields?limit=50", "/api/fields/search?q=field&limit=20", "/api/fields?status=Available&limit=50"]
+    if fields:
+        paths.append(f"/api/fields/{fields[0]['_id']}")
+    urls = [base_url + paths[index % len(paths)] for index in range(args.requests)]
+    
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            latencies = sorted(executor.map(fetch, urls))
+        elapsed = time.perf_counter() - started
+    finally:
+        if server:
+            server.shutdown()
+    
+    print(f"{len(latencies)} requests, {args.concurrency} concurrent clients")
+    print(f"throughput: {len(latencies) / elapsed:.0f} requests/s")
+    print(f"latency:    p50 {percentile(latencies, 50) * 1000:.1f}ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.1f}ms, max {latencies[-1] * 1000:.1f}ms")
+
+if __name__ == "__main__":
+    main()
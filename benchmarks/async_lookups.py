@@ -0,0 +1,85 @@
+"""
+Concurrent lookup benchmark for AsyncDatabase against the blocking Database
+
+Run with: python -m benchmarks.async_lookups [count] [--latency MS] [--mongo]
+
+Without --mongo the lookups run against an in-process stand-in collection that
+sleeps for the given latency per round trip, like a remote server would.
+"""
+import argparse
+import asyncio
+import time
+from async_database import AsyncDatabase
+from benchmarks.standin import StandInCollection, standin_database
+from database import Database
+
+def seed(db, count):
+    """Insert count fields and return their IDs"""
+    fields = [
+        {
+            "name": f"Benchmark Field {index}",
+            "location": f"Location {index % 50}",
+            "capacity": 10 + index % 13,
+            "price_per_hour": 20.0 + index % 40,
+            "status": "Available",
+            "description": ""
+        }
+        for index in range(count)
+    ]
+    
+    # The insert sets _id on each document
+    success, result = db.bulk_create_fields(fields)
+    if not success:
+        raise RuntimeError(result)
+    return [field["_id"] for field in fields]
+
+def run_sync(db, field_ids):
+    """Look the fields up one after another"""
+    started = time.perf_counter()
+    for field_id in field_ids:
+        db.get_field_by_id(field_id)
+    return time.perf_counter() - started
+
+async def run_async(db, field_ids):
+    """Look the fields up concurrently"""
+    started = time.perf_counter()
+    results = await asyncio.gather(*(db.get_field_by_id(field_id) for field_id in field_ids))
+    elapsed = time.perf_counter() - started
+    
+    failures = sum(1 for success, result in results if not success)
+    if failures:
+        raise RuntimeError(f"{failures} lookups failed")
+    return elapsed
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Compare blocking and async field lookups")
+    parser.add_argument("count", type=int, nargs="?", default=500, help="Number of lookups")
+    parser.add_argument("--latency", type=float, default=2.0, help="Stand-in round trip latency in ms")
+    parser.add_argument("--mongo", action="store_true", help="Use the MongoDB server from config.py")
+    args = parser.parse_args()
+    
+    if args.mongo:
+        db = Database()
+        success, message = db.connect()
+        if not success:
+            parser.exit(1, message + "\n")
+    else:
+        db = standin_database(StandInCollection(latency=args.latency / 1000))
+    
+    field_ids = seed(db, args.count)
+    try:
+        sync_seconds = run_sync(db, field_ids)
+        async_seconds = asyncio.run(run_async(AsyncDatabase(db), field_ids))
+    finally:
+        if args.mongo:
+            db.collection.delete_many({"_id": {"$in": field_ids}})
+            db.close()
+    
+    print(f"{len(field_ids)} lookups")
+    print(f"Database (sequential):    {sync_seconds:.3f}s, {len(field_ids) / sync_seconds:.0f} lookups/s")
+    print(f"AsyncDatabase (gather):   {async_seconds:.3f}s, {len(field_ids) / async_seconds:.0f} lookups/s")
+    print(f"speedup:                  {sync_seconds / async_seconds:.1f}x")
+
+if __name__ == "__main__":
+    main()
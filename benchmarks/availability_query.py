@@ -0,0 +1,76 @@
+"""
+Availability query benchmark: bitmap index against a per-field booking check
+
+Run with: python -m benchmarks.availability_query [fields] [bookings per field]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from availability import AvailabilityIndex
+from benchmarks.standin import StandInCollection, standin_database
+from bookings import BookingManager
+
+def seed(db, manager, field_count, bookings_per_field, day, seed=7):
+    """Insert fields and random bookings on one day"""
+    rng = random.Random(seed)
+    fields = [
+        {
+            "name": f"Field {index}",
+            "location": rng.choice(["Casablanca", "Rabat", "Marrakech", "Tangier"]),
+            "capacity": rng.choice([10, 14, 22]),
+            "price_per_hour": 20.0 + index % 40,
+            "status": rng.choice(["Available", "Available", "Available", "Under Maintenance"])
+        }
+        for index in range(field_count)
+    ]
+    db.bulk_create_fields(fields)
+    
+    for field in fields:
+        for _ in range(bookings_per_field):
+            start = day + timedelta(hours=rng.randrange(8, 23), minutes=rng.choice((0, 30)))
+            manager.create_booking(field["_id"], "Benchmark", start, start + timedelta(hours=1))
+    return fields
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Compare the availability index with per-field booking checks")
+    parser.add_argument("fields", type=int, nargs="?", default=5000, help="Number of fields")
+    parser.add_argument("bookings", type=int, nargs="?", default=8, help="Bookings per field")
+    args = parser.parse_args()
+    field_count, bookings_per_field = args.fields, args.bookings
+    day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    
+    db = standin_database(StandInCollection())
+    manager = BookingManager(db)
+    fields = seed(db, manager, field_count, bookings_per_field, day)
+    
+    index = AvailabilityIndex()
+    started = time.perf_counter()
+    index.load(db, manager)
+    print(f"{field_count} fields, {len(manager.all_bookings())} bookings, index built in "
+          f"{time.perf_counter() - started:.2f}s")
+    
+    start, end = day + timedelta(hours=18), day + timedelta(hours=20)
+    runs = 100
+    started = time.perf_counter()
+    for _ in range(runs):
+        free = index.available_fields(start, end, min_capacity=14, location="casa")
+    index_seconds = (time.perf_counter() - started) / runs
+    
+    # The same question answered field by field
+    started = time.perf_counter()
+    expected = [
+        field for field in fields
+        if field["status"] == "Available" and field["capacity"] >= 14
+        and field["location"].lower().startswith("casa")
+        and manager.is_available(field["_id"], start, end)
+    ]
+    scan_seconds = time.perf_counter() - started
+    
+    print(f"free fields: {len(free)} (per-field check found {len(expected)})")
+    print(f"bitmap index:      {index_seconds * 1000:.2f}ms per query")
+    print(f"per-field checks:  {scan_seconds * 1000:.2f}ms per query")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Booking creation throughput under contention
+
+Run with: python -m benchmarks.booking_throughput [--bookings N] [--fields N] [--threads N] [--latency MS] [--mongo]
+
+Without --mongo the bookings are written to an in-process stand-in collection
+that sleeps for the given latency per round trip, like a remote server would.
+"""
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from benchmarks.standin import StandInCollection, standin_database
+from bookings import BookingManager
+from database import Database
+from utils.interval_tree import IntervalTree
+
+def random_slots(count, fields, days, seed=42):
+    """Random one or two hour bookings on the hour, spread over fields and days"""
+    rng = random.Random(seed)
+    first_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    slots = []
+    for _ in range(count):
+        start = first_day + timedelta(days=rng.randrange(days), hours=rng.randrange(8, 23))
+        slots.append((rng.randrange(fields), start, start + timedelta(hours=rng.choice((1, 2)))))
+    return slots
+
+def overlap_check_cost(count, lookups=10000):
+    """Time one overlap check against a tree and against a list scan of count bookings"""
+    rng = random.Random(1)
+    tree = IntervalTree()
+    intervals = []
+    for index in range(count):
+        start = index * 60 + rng.randrange(30)
+        tree.insert(start, start + 30, index)
+        intervals.append((start, start + 30))
+    queries = [(start, start + 45) for start in (rng.randrange(count * 60) for _ in range(lookups))]
+    
+    started = time.perf_counter()
+    for start, end in queries:
+        tree.find_overlap(start, end)
+    tree_seconds = (time.perf_counter() - started) / lookups
+    
+    started = time.perf_counter()
+    for start, end in queries[:1000]:
+        any(other_start < end and start < other_end for other_start, other_end in intervals)
+    scan_seconds = (time.perf_counter() - started) / min(lookups, 1000)
+    return tree_seconds, scan_seconds
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Measure booking creation under contention")
+    parser.add_argument("--bookings", type=int, default=5000, help="Booking attempts")
+    parser.add_argument("--fields", type=int, default=20, help="Fields being booked")
+    parser.add_argument("--days", type=int, default=14, help="Days the bookings are spread over")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--latency", type=float, default=1.0, help="Stand-in round trip latency in ms")
+    parser.add_argument("--mongo", action="store_true", help="Use the MongoDB server from config.py")
+    args = parser.parse_args()
+    
+    if args.mongo:
+        db = Database()
+        success, message = db.connect()
+        if not success:
+            parser.exit(1, message + "\n")
+    else:
+        db = standin_database(StandInCollection(latency=args.latency / 1000))
+    
+    manager = BookingManager(db)
+    manager.load()
+    field_ids = [f"benchmark-field-{index}" for index in range(args.fields)]
+    slots = random_slots(args.bookings, args.fields, args.days)
+    
+    def book(slot):
+        field, start, end = slot
+        success, result = manager.create_booking(field_ids[field], "Benchmark", start, end)
+        return success
+    
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            results = list(executor.map(book, slots))
+        elapsed = time.perf_counter() - started
+    finally:
+        if args.mongo:
+            db.bookings.delete_many({"field_id": {"$in": field_ids}})
+            db.close()
+    
+    created = sum(results)
+    print(f"{len(slots)} booking attempts on {args.fields} fields, {args.threads} threads")
+    print(f"throughput: {len(slots) / elapsed:.0f} attempts/s ({created} created, {len(slots) - created} conflicts)")
+    
+    for count in (1000, 10000, 100000):
+        tree_seconds, scan_seconds = overlap_check_cost(count)
+        print(f"overlap check with {count} bookings: tree {tree_seconds * 1e6:.1f}us, "
+              f"list scan {scan_seconds * 1e6:.1f}us")
+
+if __name__ == "__main__":
+    main()
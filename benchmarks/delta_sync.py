@@ -0,0 +1,59 @@
+"""
+Delta sync benchmark: Refresh by delta against a full reload
+
+Run with: python -m benchmarks.delta_sync [fields] [changes]
+
+The stand-in collection has no indexes, so every query scans it; on MongoDB the delta
+queries are range scans of the updated_at and deleted_at indexes. The documents
+transferred and the snapshot write are what the delta saves either way.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+from benchmarks.run import seed
+from benchmarks.standin import StandInCollection, standin_database
+from database import sync_since
+from snapshot import SnapshotStore, SYNC_PROJECTION
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Compare a delta sync with a full reload")
+    parser.add_argument("fields", type=int, nargs="?", default=100000, help="Number of fields")
+    parser.add_argument("changes", type=int, nargs="?", default=100, help="Number of fields updated by other clients")
+    args = parser.parse_args()
+    field_count, change_count = args.fields, args.changes
+    
+    db = standin_database(StandInCollection())
+    seed(db, field_count)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        store = SnapshotStore(os.path.join(directory, "snapshot.sqlite3"))
+        success, fields = db.get_all_fields()
+        store.replace_all(fields)
+        synced_at = datetime.now().isoformat()
+        
+        # Other clients update some fields and delete a tenth as many
+        ids = [field["_id"] for field in fields]
+        for field_id in ids[:change_count]:
+            db.update_field(str(field_id), {"status": "Booked"})
+        for field_id in ids[-max(1, change_count // 10):]:
+            db.delete_field(str(field_id))
+        
+        started = time.perf_counter()
+        success, fields = db.get_all_fields()
+        store.replace_all(fields)
+        full_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        success, (updated, deleted) = db.get_field_changes(sync_since(synced_at), SYNC_PROJECTION)
+        store.apply_changes(updated, deleted, datetime.now().isoformat())
+        delta_seconds = time.perf_counter() - started
+    
+    print(f"{field_count} fields, {change_count} updated and {len(deleted)} deleted since the last sync")
+    print(f"full reload: {len(fields):>8} documents {full_seconds * 1000:10.1f}ms")
+    print(f"delta sync:  {len(updated) + len(deleted):>8} documents {delta_seconds * 1000:10.1f}ms")
+
+if __name__ == "__main__":
+    main()
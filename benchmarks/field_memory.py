@@ -0,0 +1,103 @@
+"""
+Memory and conversion benchmark for the Field model
+
+Run with: python -m benchmarks.field_memory [count]
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+from models.field import Field
+
+class DictField:
+    """The Field layout before __slots__ (per-instance __dict__), for comparison"""
+    
+    def __init__(self, name, location, capacity=10, price_per_hour=20.0, status="Available",
+                 description="", _id=None):
+        """Initialize a field the way the old model did"""
+        self._id = _id
+        self.name = name
+        self.location = location
+        self.capacity = capacity
+        self.price_per_hour = price_per_hour
+        self.status = status
+        self.description = description
+        self.created_at = datetime.now().isoformat() if not _id else None
+        self.updated_at = None
+
+def make_documents(count):
+    """Build field documents as they come from MongoDB"""
+    return [
+        {
+            "_id": index + 1,
+            "name": f"Field {index}",
+            "location": f"Location {index % 50}",
+            "capacity": 10 + index % 13,
+            "price_per_hour": 20.0 + index % 40,
+            "status": "Available",
+            "description": ""
+        }
+        for index in range(count)
+    ]
+
+def positive_int(text):
+    """Parse a count of at least 1 (the per-record figures divide by it)"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return value
+
+def measure(convert, documents):
+    """Measure the time and the memory kept per record by a conversion"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    fields = convert(documents)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": elapsed, "bytes_per_record": current / len(fields)}
+
+def legacy_from_documents(documents):
+    """Convert documents one by one through keyword arguments (old from_dict)"""
+    return [
+        DictField(
+            _id=document.get("_id"),
+            name=document.get("name", ""),
+            location=document.get("location", ""),
+            capacity=document.get("capacity", 10),
+            price_per_hour=document.get("price_per_hour", 20.0),
+            status=document.get("status", "Available"),
+            description=document.get("description", "")
+        )
+        for document in documents
+    ]
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Compare the memory and conversion time of the Field layouts")
+    parser.add_argument("count", type=positive_int, nargs="?", default=100000, help="Number of records")
+    count = parser.parse_args().count
+    documents = make_documents(count)
+    
+    legacy = measure(legacy_from_documents, documents)
+    slotted = measure(Field.from_documents, documents)
+    
+    print(f"{count} records")
+    print(f"dict-based Field:  {legacy['bytes_per_record']:.0f} bytes/record, {legacy['seconds']:.3f}s")
+    print(f"slotted Field:     {slotted['bytes_per_record']:.0f} bytes/record, {slotted['seconds']:.3f}s")
+    print(f"memory saved:      {1 - slotted['bytes_per_record'] / legacy['bytes_per_record']:.0%}")
+    
+    fields = Field.from_documents(documents)
+    started = time.perf_counter()
+    [field.to_dict() for field in fields]
+    per_field = time.perf_counter() - started
+    started = time.perf_counter()
+    Field.to_documents(fields)
+    batched = time.perf_counter() - started
+    print(f"to_dict per field: {per_field:.3f}s, to_documents batch: {batched:.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Benchmark suite for the data and UI hot paths
+
+Run with: python -m benchmarks.run [--sizes N ...] [--repeat N] [--latency MS] [--mongo]
+                                   [--output FILE] [--compare FILE] [--no-ui]
+
+Seeds the same synthetic fields (fixed seed) at each size, times the Database
+reads, the in-memory report and CSV export, and FieldsListFrame loading and
+sorting, and writes the timings as JSON so runs can be compared over time.
+
+Without --mongo the fields live in an in-process stand-in collection. The Tk
+cases need a display; without DISPLAY they run under Xvfb when it is
+installed and are skipped otherwise.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from benchmarks.standin import StandInCollection, standin_database
+from config import FIELD_STATUS
+from database import Database
+from utils.export import generate_report, write_fields_csv
+
+# Fields inserted per bulk_create_fields call while seeding
+SEED_CHUNK_SIZE = 10000
+
+# Collection the --mongo runs seed and drop
+MONGO_COLLECTION = "benchmark_fields"
+
+# Building blocks of the synthetic names and locations
+NAME_PREFIXES = ["Terrain", "Stade", "Arena", "Complexe", "Club", "Parc", "Academie", "Five"]
+CITIES = ["Casablanca", "Rabat", "Marrakech", "Fes", "Tanger", "Agadir", "Meknes", "Oujda"]
+DISTRICTS = ["Centre", "Nord", "Sud", "Est", "Ouest", "Maarif", "Agdal", "Medina"]
+
+# Search term matching one name prefix in eight
+SEARCH_QUERY = "Terrain"
+
+def generate_fields(count, seed=42):
+    """Generate count field documents, the same ones for the same seed"""
+    rng = random.Random(seed)
+    created = datetime(2024, 1, 1)
+    fields = []
+    for index in range(count):
+        stamp = (created + timedelta(minutes=index)).isoformat()
+        fields.append({
+            "name": f"{rng.choice(NAME_PREFIXES)} {index}",
+            "location": f"{rng.choice(CITIES)} {rng.choice(DISTRICTS)}",
+            "capacity": rng.choice((10, 12, 14, 22)),
+            "price_per_hour": float(rng.randrange(15, 120)),
+            "status": rng.choice(FIELD_STATUS),
+            "description": rng.choice(("", "Synthetic grass", "Covered, lit at night")),
+            "created_at": stamp,
+            "updated_at": stamp
+        })
+    return fields
+
+def seed(db, count):
+    """Insert count generated fields in chunks"""
+    fields = generate_fields(count)
+    for start in range(0, count, SEED_CHUNK_SIZE):
+        success, result = db.bulk_create_fields(fields[start:start + SEED_CHUNK_SIZE])
+        if not success:
+            raise RuntimeError(result)
+
+def time_case(function, repeat):
+    """Run function repeat times and return the timings and the last result"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return timings, result
+
+def record(results, case, size, timings, count=None):
+    """Add a case's timings to the results and print them"""
+    entry = {
+        "case": case,
+        "size": size,
+        "seconds": timings,
+        "min": min(timings),
+        "median": statistics.median(timings)
+    }
+    if count is not None:
+        entry["count"] = count
+    results.append(entry)
+    print(f"{size:>9} {case:<32} min {entry['min'] * 1000:10.2f}ms  median {entry['median'] * 1000:10.2f}ms")
+
+def checked(result):
+    """Unwrap a (success, result) pair, failing the benchmark on errors"""
+    success, value = result
+    if not success:
+        raise RuntimeError(value)
+    return value
+
+def run_data_cases(db, size, repeat, results):
+    """Time the Database reads, the report and the CSV export; return all fields"""
+    timings, fields = time_case(lambda: checked(db.get_all_fields()), repeat)
+    record(results, "get_all_fields", size, timings, len(fields))
+    
+    timings, found = time_case(lambda: checked(db.search_fields(SEARCH_QUERY)), repeat)
+    record(results, "search_fields", size, timings, len(found))
+    
+    timings, found = time_case(lambda: checked(db.filter_fields_by_status(FIELD_STATUS[0])), repeat)
+    record(results, "filter_fields_by_status", size, timings, len(found))
+    
+    timings, _ = time_case(lambda: generate_report(fields, "summary"), repeat)
+    record(results, "generate_report", size, timings)
+    
+    # export_to_csv asks for a path in a dialog; this is the writing it does afterwards
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "fields.csv")
+        timings, _ = time_case(lambda: checked(write_fields_csv(fields, path)), repeat)
+        record(results, "export_to_csv", size, timings)
+    
+    return fields
+
+def run_ui_cases(root, fields, size, repeat, results):
+    """Time loading and sorting the fields list, including the redraw"""
+    from gui.fields_list import FieldsListFrame
+    
+    frame = FieldsListFrame(root)
+    frame.pack(fill="both", expand=True)
+    root.update()
+    
+    def load():
+        frame.load_fields(fields)
+        root.update()
+    
+    timings, _ = time_case(load, repeat)
+    record(results, "FieldsListFrame.load_fields", size, timings)
+    
+    # Alternate the direction so every run really reorders the list
+    directions = iter([False, True] * repeat)
+    
+    def sort():
+        frame.sort_by_column("name", next(directions))
+        root.update()
+    
+    timings, _ = time_case(sort, repeat)
+    record(results, "FieldsListFrame.sort_by_column", size, timings)
+    frame.destroy()
+
+def start_virtual_display():
+    """Start Xvfb when there is no display; return (process, reason the UI cases cannot run)"""
+    if os.environ.get("DISPLAY"):
+        return None, None
+    if not shutil.which("Xvfb"):
+        return None, "no DISPLAY and Xvfb is not installed"
+    
+    display = f":{random.randrange(100, 1000)}"
+    process = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    os.environ["DISPLAY"] = display
+    
+    # Wait for the server to accept connections
+    import tkinter as tk
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            tk.Tk().destroy()
+            return process, None
+        except tk.TclError:
+            time.sleep(0.1)
+    process.terminate()
+    return None, "Xvfb did not start"
+
+def open_database(args):
+    """Get an empty Database on a stand-in or on a benchmark collection of the server"""
+    if not args.mongo:
+        return standin_database(StandInCollection(latency=args.latency / 1000))
+    
+    db = Database()
+    checked(db.connect())
+    db.collection = db.db[MONGO_COLLECTION]
+    db.collection.drop()
+    db.ensure_indexes()
+    return db
+
+def git_revision():
+    """Get the current commit, if this is a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, path):
+    """Print the change of each median against an earlier run"""
+    with open(path, encoding="utf-8") as file:
+        previous = {(entry["case"], entry["size"]): entry for entry in json.load(file)["results"]}
+    
+    print(f"\ncompared with {path}:")
+    for entry in results:
+        before = previous.get((entry["case"], entry["size"]))
+        if before and before["median"]:
+            ratio = entry["median"] / before["median"]
+            print(f"{entry['size']:>9} {entry['case']:<32} {ratio:6.2f}x "
+                  f"({before['median'] * 1000:.2f}ms -> {entry['median'] * 1000:.2f}ms)")
+
+def main():
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description="Time the data and UI hot paths at several collection sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000], help="Field counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in round trip latency in ms")
+    parser.add_argument("--mongo", action="store_true",
+                        help=f"Use the MongoDB server from config.py (collection {MONGO_COLLECTION})")
+    parser.add_argument("--no-ui", action="store_true", help="Skip the Tk cases")
+    parser.add_argument("--output", help="JSON results file (default: benchmark-<time>.json)")
+    parser.add_argument("--compare", help="Earlier JSON results to compare with")
+    args = parser.parse_args()
+    
+    started_at = datetime.now()
+    output = args.output or f"benchmark-{started_at:%Y%m%d-%H%M%S}.json"
+    
+    display, ui_skipped = (None, "--no-ui") if args.no_ui else start_virtual_display()
+    root = None
+    if not ui_skipped:
+        import tkinter as tk
+        root = tk.Tk()
+        root.geometry("800x600")
+    
+    results = []
+    try:
+        for size in args.sizes:
+            db = open_database(args)
+            try:
+                seed(db, size)
+                fields = run_data_cases(db, size, args.repeat, results)
+                if root is not None:
+                    run_ui_cases(root, fields, size, args.repeat, results)
+            finally:
+                if args.mongo:
+                    db.collection.drop()
+                    db.close()
+    finally:
+        if root is not None:
+            root.destroy()
+        if display is not None:
+            display.terminate()
+    
+    report = {
+        "started_at": started_at.isoformat(),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "backend": "mongo" if args.mongo else f"standin ({args.latency}ms latency)",
+        "repeat": args.repeat,
+        "ui_skipped": ui_skipped,
+        "results": results
+    }
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    
+    if ui_skipped:
+        print(f"Tk cases skipped: {ui_skipped}")
+    print(f"results written to {output}")
+    
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+In-process stand-in for a MongoDB collection, for benchmarks without a server
+"""
+import re
+import threading
+import time
+from bson.objectid import ObjectId
+from connection import connection_manager
+from database import Database
+
+def get_value(document, field):
+    """Get a (possibly dotted) field of a document"""
+    for part in field.split("."):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(part)
+    return document
+
+def matches_condition(value, condition):
+    """Check a value against an operator condition such as {"$gt": 3}"""
+    for operator, operand in condition.items():
+        if operator == "$regex":
+            flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+            if not isinstance(value, str) or not re.search(operand, value, flags):
+                return False
+        elif operator == "$options":
+            continue
+        elif operator == "$in":
+            if value not in operand:
+                return False
+        elif operator == "$exists":
+            if (value is not None) != operand:
+                return False
+        elif value is None:
+            return False
+        elif operator == "$gt" and not value > operand:
+            return False
+        elif operator == "$gte" and not value >= operand:
+            return False
+        elif operator == "$lt" and not value < operand:
+            return False
+        elif operator == "$lte" and not value <= operand:
+            return False
+        elif operator == "$ne" and value == operand:
+            return False
+    return True
+
+def matches_query(document, query):
+    """Check whether a document matches the subset of the query language the app uses"""
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(matches_query(document, branch) for branch in condition):
+                return False
+        elif field == "$and":
+            if not all(matches_query(document, branch) for branch in condition):
+                return False
+        elif isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+            if not matches_condition(get_value(document, field), condition):
+                return False
+        elif get_value(document, field) != condition:
+            return False
+    return True
+
+def project(document, projection):
+    """Apply an inclusion projection"""
+    if not projection:
+        return dict(document)
+    result = {key: document[key] for key, include in projection.items() if include and key in document}
+    if projection.get("_id", 1) and "_id" in document:
+        result["_id"] = document["_id"]
+    return result
+
+class StandInCursor:
+    """Cursor over stand-in query results, paying one round trip per batch"""
+    
+    def __init__(self, collection, query, projection):
+        """Initialize the cursor"""
+        self.collection = collection
+        self.query = query or {}
+        self.projection = projection
+        self.sort_keys = []
+        self.limit_count = 0
+        self.batch = 101
+        self.results = None
+        self.position = 0
+    
+    def sort(self, keys, direction=None):
+        """Sort by a list of (field, direction) pairs"""
+        self.sort_keys = [(keys, direction or 1)] if isinstance(keys, str) else list(keys)
+        return self
+    
+    def limit(self, count):
+        """Limit the number of results"""
+        self.limit_count = count
+        return self
+    
+    def batch_size(self, size):
+        """Set the number of documents per round trip"""
+        self.batch = max(1, size)
+        return self
+    
+    def execute(self):
+        """Run the query"""
+        with self.collection.lock:
+            documents = [document for document in self.collection.documents.values()
+                         if matches_query(document, self.query)]
+        for field, direction in reversed(self.sort_keys):
+            # Missing and null values sort first, like on the server
+            documents.sort(key=lambda document: (get_value(document, field) is not None, get_value(document, field)),
+                           reverse=direction < 0)
+        if self.limit_count:
+            documents = documents[:self.limit_count]
+        return [project(document, self.projection) for document in documents]
+    
+    def __iter__(self):
+        """Iterate over the results"""
+        return self
+    
+    def __next__(self):
+        """Get the next result, paying a round trip at the start of each batch"""
+        if self.results is None:
+            self.results = self.execute()
+        if self.position >= len(self.results):
+            raise StopIteration
+        if self.position % self.batch == 0:
+            self.collection.round_trip()
+        self.position += 1
+        return self.results[self.position - 1]
+    
+    def explain(self):
+        """Report a collection scan, like a server without indexes"""
+        return {"queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}}
+    
+    def close(self):
+        """Release the cursor"""
+
+class InsertResult:
+    """Result of insert_one or insert_many"""
+    
+    def __init__(self, inserted_ids):
+        """Initialize the result"""
+        self.inserted_ids = inserted_ids
+        self.inserted_id = inserted_ids[0] if inserted_ids else None
+
+class StandInCollection:
+    """Thread-safe in-memory collection with a simulated network latency per round trip"""
+    
+    def __init__(self, latency=0.0):
+        """Initialize the collection"""
+        self.latency = latency
+        self.documents = {}
+        self.lock = threading.Lock()
+    
+    def round_trip(self):
+        """Wait like a request to a remote server would"""
+        if self.latency:
+            time.sleep(self.latency)
+    
+    def insert_one(self, document):
+        """Insert a document"""
+        self.round_trip()
+        document.setdefault("_id", ObjectId())
+        with self.lock:
+            self.documents[document["_id"]] = dict(document)
+        return InsertResult([document["_id"]])
+    
+    def insert_many(self, documents, ordered=True):
+        """Insert documents"""
+        self.round_trip()
+        with self.lock:
+            for document in documents:
+                document.setdefault("_id", ObjectId())
+                self.documents[document["_id"]] = dict(document)
+        return InsertResult([document["_id"] for document in documents])
+    
+    def find(self, query=None, projection=None):
+        """Query documents"""
+        return StandInCursor(self, query, projection)
+    
+    def find_one(self, query=None, projection=None):
+        """Get the first matching document"""
+        self.round_trip()
+        query = query or {}
+        with self.lock:
+            if set(query) == {"_id"} and not isinstance(query["_id"], dict):
+                document = self.documents.get(query["_id"])
+                return project(document, projection) if document else None
+            for document in self.documents.values():
+                if matches_query(document, query):
+                    return project(document, projection)
+        return None
+    
+    def find_one_and_update(self, query, update, return_document=False, **kwargs):
+        """Apply a $set update to the first matching document"""
+        self.round_trip()
+        with self.lock:
+            for document in self.documents.values():
+                if matches_query(document, query):
+                    before = dict(document)
+                    document.update(update.get("$set", {}))
+                    return dict(document) if return_document else before
+        return None
+    
+    def find_one_and_delete(self, query, **kwargs):
+        """Delete the first matching document"""
+        self.round_trip()
+        with self.lock:
+            for key, document in self.documents.items():
+                if matches_query(document, query):
+                    return self.documents.pop(key)
+        return None
+    
+    def delete_one(self, query):
+        """Delete the first matching document"""
+        self.find_one_and_delete(query)
+    
+    def estimated_document_count(self):
+        """Count the documents"""
+        self.round_trip()
+        with self.lock:
+            return len(self.documents)
+    
+    def create_index(self, keys, **kwargs):
+        """Accept index creation"""
+        return kwargs.get("name", "")
+    
+    def update_many(self, query, update, **kwargs):
+        """Accept the search key backfill"""
+
+def standin_database(collection, database_class=Database):
+    """Build a connected Database (or subclass) backed by stand-in collections"""
+    database = database_class()
+    database.collection = collection
+    database.bookings = StandInCollection(latency=collection.latency)
+    database.tombstones = StandInCollection(latency=collection.latency)
+    database.client = connection_manager.client
+    database.is_connected = True
+    return database
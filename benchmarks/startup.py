@@ -0,0 +1,95 @@
+"""
+Startup benchmark: import time and time to first paint
+
+Run with: python -m benchmarks.startup [--runs N] [--mongo] [--output FILE]
+
+Each run starts a fresh interpreter that builds the window like app.main and
+reports, in seconds since it was launched:
+- import: app and the GUI modules imported
+- first_paint: the window drawn (needs a display; Xvfb is used when installed)
+- first_page: the first page of fields shown (with --mongo, needs the server)
+- deferred_imports: the database layer imported afterwards, i.e. what startup saves
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from benchmarks.run import start_virtual_display
+
+# Script run in each fresh interpreter; prints its timings as JSON
+CHILD = """
+import json, os, sys, time
+launched = float(sys.argv[1])
+wait_for_page = sys.argv[2] == "1"
+marks = {}
+
+import app
+marks["import"] = time.time() - launched
+marks["pymongo_before_paint"] = "pymongo" in sys.modules
+
+if os.environ.get("DISPLAY"):
+    root, window = app.build_window()
+    root.update()
+    marks["first_paint"] = time.time() - launched
+    marks["pymongo_before_paint"] = "pymongo" in sys.modules
+    
+    if wait_for_page:
+        deadline = time.time() + 30
+        while time.time() < deadline and (window.db is None or window.worker.is_busy("list")):
+            root.update()
+            time.sleep(0.005)
+        marks["first_page"] = time.time() - launched
+
+started = time.perf_counter()
+import cache, bookings, availability
+marks["deferred_imports"] = time.perf_counter() - started
+
+print(json.dumps(marks), flush=True)
+os._exit(0)
+"""
+
+def run_once(root_directory, wait_for_page):
+    """Start the application in a fresh interpreter and return its timings"""
+    launched = time.time()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, repr(launched), "1" if wait_for_page else "0"],
+        capture_output=True, text=True, cwd=root_directory, timeout=120
+    )
+    if output.returncode != 0:
+        raise RuntimeError(output.stderr.strip())
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Measure import time and time to first paint")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start")
+    parser.add_argument("--mongo", action="store_true", help="Also wait for the first page from the server")
+    parser.add_argument("--output", help="Write the timings to this JSON file")
+    args = parser.parse_args()
+    
+    display, reason = start_virtual_display()
+    root_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        runs = [run_once(root_directory, args.mongo) for _ in range(args.runs)]
+    finally:
+        if display is not None:
+            display.terminate()
+    
+    print(f"{args.runs} cold starts (median)")
+    for mark in ("import", "first_paint", "first_page", "deferred_imports"):
+        values = [run[mark] for run in runs if mark in run]
+        if values:
+            print(f"{mark:<18} {statistics.median(values) * 1000:8.1f}ms")
+    print(f"pymongo imported before the first paint: {any(run['pymongo_before_paint'] for run in runs)}")
+    if reason:
+        print(f"first paint not measured: {reason}")
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"runs": runs, "display": reason is None}, file, indent=2)
+
+if __name__ == "__main__":
+    main()
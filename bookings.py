@@ -0,0 +1,135 @@
+"""
+Booking management for the Football Field Management System
+"""
+import threading
+from datetime import datetime, timedelta
+from pymongo.errors import PyMongoError
+from config import BOOKING_HISTORY_DAYS
+from models.booking import Booking
+from utils.interval_tree import IntervalTree
+
+class BookingManager:
+    """Field bookings with an in-memory interval tree per field for O(log n) conflict checks"""
+    
+    def __init__(self, db):
+        """Initialize the booking manager"""
+        self.db = db
+        
+        # Confirmed bookings per field ID, and a lock per field serializing its writes
+        self.trees = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+        
+        # Callables notified as listener(action, booking) after each change
+        self.listeners = []
+    
+    def add_listener(self, listener):
+        """Register a callable notified after bookings are loaded, created or cancelled"""
+        self.listeners.append(listener)
+    
+    def notify(self, action, booking):
+        """Notify the listeners of a change"""
+        for listener in self.listeners:
+            listener(action, booking)
+    
+    def field_lock(self, field_id):
+        """Get the lock of a field"""
+        with self.lock:
+            lock = self.locks.get(field_id)
+            if lock is None:
+                lock = self.locks[field_id] = threading.Lock()
+            return lock
+    
+    def load(self, since=None):
+        """Rebuild the conflict index from the confirmed bookings in MongoDB"""
+        # Bookings that ended before `since` can no longer conflict with new ones
+        if since is None:
+            since = datetime.now() - timedelta(days=BOOKING_HISTORY_DAYS)
+        
+        success, cursor = self.db.get_bookings_cursor({"status": "Confirmed", "end": {"$gt": since}})
+        if not success:
+            return False, cursor
+        
+        trees = {}
+        try:
+            for booking in cursor:
+                tree = trees.get(booking["field_id"])
+                if tree is None:
+                    tree = trees[booking["field_id"]] = IntervalTree()
+                tree.insert(booking["start"], booking["end"], str(booking["_id"]), booking)
+        except PyMongoError as e:
+            return False, f"Error loading bookings: {str(e)}"
+        
+        with self.lock:
+            self.trees = trees
+        self.notify("load", None)
+        return True, sum(len(tree) for tree in trees.values())
+    
+    def create_booking(self, field_id, customer_name, start, end):
+        """Book a field for [start, end) unless it overlaps a confirmed booking"""
+        field_id = str(field_id)
+        booking = Booking(field_id=field_id, customer_name=customer_name, start=start, end=end)
+        errors = booking.validate()
+        if errors:
+            return False, "\n".join(errors)
+        start, end = booking.start, booking.end
+        
+        # The check and the insert run under the field's lock, so concurrent
+        # bookings of one field cannot both pass the check (the database guards
+        # against bookings made by other processes)
+        with self.field_lock(field_id):
+            tree = self.trees.get(field_id)
+            conflict = tree.find_overlap(start, end) if tree else None
+            if conflict:
+                return False, f"Field is already booked from {conflict[0]:%Y-%m-%d %H:%M} to {conflict[1]:%H:%M}"
+            
+            success, result = self.db.create_booking(booking.to_dict())
+            if not success:
+                return False, result
+            
+            with self.lock:
+                tree = self.trees.setdefault(field_id, IntervalTree())
+            tree.insert(start, end, str(result["_id"]), result)
+        
+        self.notify("create", result)
+        return True, result
+    
+    def cancel_booking(self, booking_id):
+        """Cancel a booking and free its time slot"""
+        success, result = self.db.update_booking_status(booking_id, "Cancelled")
+        if not success:
+            return False, result
+        
+        with self.field_lock(result["field_id"]):
+            tree = self.trees.get(result["field_id"])
+            if tree:
+                tree.remove(result["start"], str(result["_id"]))
+        
+        self.notify("cancel", result)
+        return True, result
+    
+    def is_available(self, field_id, start, end):
+        """Check whether a field has no confirmed booking overlapping [start, end)"""
+        field_id = str(field_id)
+        with self.field_lock(field_id):
+            tree = self.trees.get(field_id)
+            return tree is None or tree.find_overlap(start, end) is None
+    
+    def get_bookings(self, field_id, start, end):
+        """Get the confirmed bookings of a field overlapping [start, end), in start order"""
+        field_id = str(field_id)
+        with self.field_lock(field_id):
+            tree = self.trees.get(field_id)
+            if tree is None:
+                return []
+            return [booking for _, _, booking in tree.find_overlapping(start, end)]
+    
+    def all_bookings(self):
+        """Get every confirmed booking in the conflict index"""
+        with self.lock:
+            trees = list(self.trees.items())
+        bookings = []
+        for field_id, tree in trees:
+            with self.field_lock(field_id):
+                bookings.extend(booking for _, _, booking in tree)
+        return bookings
@@ -0,0 +1,138 @@
+"""
+In-process field cache for the Football Field Management System
+"""
+import threading
+import time
+from collections import OrderedDict
+from database import Database
+from config import FIELD_CACHE_SIZE, FIELD_CACHE_TTL, FORM_PROJECTION
+
+class FieldCache:
+    """Bounded LRU cache of field documents keyed by _id"""
+    
+    def __init__(self, max_size=FIELD_CACHE_SIZE, ttl=FIELD_CACHE_TTL):
+        """Initialize the cache"""
+        self.max_size = max_size
+        self.ttl = ttl
+        
+        # (time stored, document) by field ID, least recently used first
+        self.documents = OrderedDict()
+        self.lock = threading.Lock()
+        
+        # Counters for tuning the cache size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, field_id):
+        """Get a copy of a cached field, or None"""
+        with self.lock:
+            entry = self.documents.get(str(field_id))
+            if entry is not None and self.ttl and time.monotonic() - entry[0] > self.ttl:
+                del self.documents[str(field_id)]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self.documents.move_to_end(str(field_id))
+            return dict(entry[1])
+    
+    def put(self, document):
+        """Add or replace a field"""
+        with self.lock:
+            key = str(document["_id"])
+            self.documents[key] = (time.monotonic(), dict(document))
+            self.documents.move_to_end(key)
+            
+            # Evict the least recently used fields
+            while len(self.documents) > self.max_size:
+                self.documents.popitem(last=False)
+                self.evictions += 1
+    
+    def remove(self, field_id):
+        """Remove a field from the cache"""
+        with self.lock:
+            self.documents.pop(str(field_id), None)
+    
+    def clear(self):
+        """Remove all fields from the cache"""
+        with self.lock:
+            self.documents.clear()
+    
+    def stats(self):
+        """Get the cache counters"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.documents),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+class CachedDatabase(Database):
+    """Database with a write-through cache for single-field reads"""
+    
+    def __init__(self, max_size=FIELD_CACHE_SIZE):
+        """Initialize the database and its cache"""
+        super().__init__()
+        
+        # Documents from lookups and writes are cached, and listed fields when they are opened
+        # (see seed_field); pushing whole listings through the LRU would only evict them
+        self.cache = FieldCache(max_size)
+    
+    def seed_field(self, field):
+        """Cache a field loaded elsewhere (e.g. a list row) if it has every form column; returns whether it did"""
+        if not all(key in field for key in FORM_PROJECTION):
+            return False
+        self.cache.put(field)
+        return True
+    
+    def create_field(self, field_data):
+        """Create a new football field and cache it"""
+        success, result = super().create_field(field_data)
+        if success:
+            self.cache.put(result)
+        return success, result
+    
+    def get_field_changes(self, since, projection=None):
+        """Get the fields changed since a time, evicting them from the cache"""
+        success, result = super().get_field_changes(since, projection)
+        if success:
+            # Other clients wrote these, so the cached copies may be stale
+            updated, deleted = result
+            for field in updated:
+                self.cache.remove(field["_id"])
+            for field_id in deleted:
+                self.cache.remove(field_id)
+        return success, result
+    
+    def get_field_by_id(self, field_id):
+        """Get a football field by ID, locally when cached"""
+        field = self.cache.get(field_id)
+        if field is not None:
+            return True, field
+        
+        success, result = super().get_field_by_id(field_id)
+        if success:
+            self.cache.put(result)
+        return success, result
+    
+    def update_field(self, field_id, field_data):
+        """Update a football field and its cached copy"""
+        success, result = super().update_field(field_id, field_data)
+        if success:
+            self.cache.put(result)
+        else:
+            self.cache.remove(field_id)
+        return success, result
+    
+    def delete_field(self, field_id):
+        """Delete a football field and evict it from the cache"""
+        success, result = super().delete_field(field_id)
+        self.cache.remove(field_id)
+        return success, result
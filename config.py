@@ -1,45 +1,201 @@
-"""
-Configuration settings for the Football Field Management System
-"""
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file if present
-load_dotenv()
-
-# Application settings
-APP_TITLE = "Football Field Management System"
-APP_SIZE = (1024, 768)
-
-# MongoDB settings
-MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
-DB_NAME = os.getenv("DB_NAME", "football_field_management")
-COLLECTION_NAME = os.getenv("COLLECTION_NAME", "fields")
-
-# Field status options
-FIELD_STATUS = ["Available", "Under Maintenance", "Booked"]
-
-# Default field values
-DEFAULT_FIELD = {
-    "name": "",
-    "location": "",
-    "capacity": 10,
-    "price_per_hour": 20.0,
-    "is_available": True,
-    "status": "Available",
-    "description": ""
-}
-
-# Color settings
-COLORS = {
-    "primary": "#3498db",    # Blue
-    "secondary": "#2ecc71",  # Green
-    "accent": "#e74c3c",     # Red
-    "bg_light": "#f5f5f5",   # Light gray
-    "bg_dark": "#34495e",    # Dark blue/gray
-    "text_primary": "#2c3e50", # Dark blue/gray
-    "text_secondary": "#7f8c8d", # Gray
-    "available": "#2ecc71",  # Green
-    "maintenance": "#f39c12", # Yellow
-    "booked": "#e74c3c"      # Red
-}
\ No newline at end of file
+"""
+Configuration settings for the Football Field Management System
+"""
+import os
+import sys
+
+def find_env_file():
+    """Find a .env file in this directory or a parent, like python-dotenv does"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, ".env")
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+# Load environment variables from .env file if present (python-dotenv is slow to import, so only then)
+ENV_FILE = find_env_file()
+if ENV_FILE:
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
+
+def user_cache_dir():
+    """Get the per-user cache directory of the platform"""
+    if sys.platform == "win32":
+        return os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches")
+    return os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+# Application settings
+APP_TITLE = "Football Field Management System"
+APP_SIZE = (1024, 768)
+
+# MongoDB settings
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+DB_NAME = os.getenv("DB_NAME", "football_field_management")
+COLLECTION_NAME = os.getenv("COLLECTION_NAME", "fields")
+BOOKINGS_COLLECTION_NAME = os.getenv("BOOKINGS_COLLECTION_NAME", "bookings")
+TOMBSTONES_COLLECTION_NAME = os.getenv("TOMBSTONES_COLLECTION_NAME", "field_tombstones")
+
+# MongoDB connection pool and timeouts (milliseconds); a down server fails fast
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "3000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "3000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "20000"))
+
+# Reconnect backoff (seconds): after CIRCUIT_BREAKER_THRESHOLD consecutive connection
+# failures calls fail fast, for a delay doubling from the base delay up to the maximum
+RECONNECT_BASE_DELAY = float(os.getenv("RECONNECT_BASE_DELAY", "1"))
+RECONNECT_MAX_DELAY = float(os.getenv("RECONNECT_MAX_DELAY", "30"))
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))
+
+# Search mode: "prefix" (indexed, matches the start of name or location),
+# "text" (text index, matches whole words) or "regex" (substring, full scan)
+SEARCH_MODE = os.getenv("SEARCH_MODE", "prefix")
+
+# Delay after the last keystroke before a search runs
+SEARCH_DEBOUNCE_MS = int(os.getenv("SEARCH_DEBOUNCE_MS", "300"))
+
+# Shortest query searched as you type, and most results the window shows for a search
+SEARCH_MIN_LENGTH = int(os.getenv("SEARCH_MIN_LENGTH", "2"))
+SEARCH_LIMIT = int(os.getenv("SEARCH_LIMIT", "500"))
+
+# Background worker settings
+DB_WORKER_THREADS = int(os.getenv("DB_WORKER_THREADS", "4"))
+WORKER_POLL_MS = 50
+
+# Maximum number of field documents kept in the in-process cache, and their maximum age
+# in seconds (bounds staleness from other processes' writes between refreshes; 0 for none)
+FIELD_CACHE_SIZE = int(os.getenv("FIELD_CACHE_SIZE", "1000"))
+FIELD_CACHE_TTL = float(os.getenv("FIELD_CACHE_TTL", "300"))
+
+# Number of fields written per batch by bulk imports
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+
+# Number of rows written at a time by CSV exports
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# Pagination settings
+PAGE_SIZE = int(os.getenv("PAGE_SIZE", "200"))
+
+# Lists longer than this only render the visible rows
+VIRTUAL_LIST_THRESHOLD = int(os.getenv("VIRTUAL_LIST_THRESHOLD", "1000"))
+
+# Columns fetched for the fields list (the ones FieldsListFrame shows)
+LIST_PROJECTION = {
+    "name": 1,
+    "location": 1,
+    "capacity": 1,
+    "price_per_hour": 1,
+    "status": 1
+}
+
+# Columns the edit form shows; the window's list pages fetch them too, so opening a listed
+# field for editing is served from the cache instead of a lookup
+FORM_PROJECTION = dict(LIST_PROJECTION, description=1)
+
+# Field status options
+FIELD_STATUS = ["Available", "Under Maintenance", "Booked"]
+
+# Booking statuses; only confirmed bookings block a time slot
+BOOKING_STATUS = ["Confirmed", "Cancelled"]
+MAX_BOOKING_HOURS = int(os.getenv("MAX_BOOKING_HOURS", "12"))
+
+# Bookings that ended more than this many days ago are not loaded into the conflict index
+BOOKING_HISTORY_DAYS = int(os.getenv("BOOKING_HISTORY_DAYS", "1"))
+
+# Length of the time slots the availability index tracks, in minutes (must divide a day)
+AVAILABILITY_SLOT_MINUTES = int(os.getenv("AVAILABILITY_SLOT_MINUTES", "30"))
+
+# Local SQLite snapshot of the fields list, shown at startup and used while the server is unavailable
+SNAPSHOT_ENABLED = os.getenv("SNAPSHOT_ENABLED", "1").lower() in ("1", "true", "yes")
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH") or os.path.join(
+    user_cache_dir(), "football_field_manager", f"{DB_NAME}-{COLLECTION_NAME}.sqlite3"
+)
+
+# Delta sync: Refresh fetches only the fields updated since the last sync and the tombstones
+# of deleted ones. updated_at comes from each client's clock, so a sync reaches back
+# DELTA_SYNC_OVERLAP_SECONDS to cover clock skew; tombstones are kept TOMBSTONE_RETENTION_DAYS,
+# and a client that last synced before that reloads everything
+DELTA_SYNC_OVERLAP_SECONDS = int(os.getenv("DELTA_SYNC_OVERLAP_SECONDS", "300"))
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30"))
+
+# Default field values
+DEFAULT_FIELD = {
+    "name": "",
+    "location": "",
+    "capacity": 10,
+    "price_per_hour": 20.0,
+    "is_available": True,
+    "status": "Available",
+    "description": ""
+}
+
+# Report settings
+REPORT_PERCENTILES = [0.25, 0.5, 0.75, 0.9, 0.99]
+REPORT_CAPACITY_BUCKETS = [1, 11, 15, 23, 101]  # 5-a-side, 7-a-side, 11-a-side, larger
+
+# Documents fetched per round trip when loading analytics snapshots
+ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "10000"))
+
+# REST API settings
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", "5000"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "1000"))
+
+# Responses smaller than this many bytes are not worth compressing
+API_GZIP_MIN_SIZE = int(os.getenv("API_GZIP_MIN_SIZE", "1024"))
+
+# API response cache: number of cached responses, and their maximum age in seconds
+# (0 keeps a response until a write invalidates it)
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "1000"))
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", "60"))
+
+# Seconds between checks for writes by other processes (e.g. the desktop application),
+# which drop the cached responses; 0 checks before every cached read
+API_CACHE_REVALIDATE_SECONDS = float(os.getenv("API_CACHE_REVALIDATE_SECONDS", "1"))
+
+# Instrumentation: per-operation latency histograms of Database calls, MongoDB commands
+# and window handlers (off by default; nothing is wrapped while off)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0").lower() in ("1", "true", "yes")
+METRICS_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]  # seconds
+
+# Prometheus text file rewritten every METRICS_DUMP_SECONDS while metrics are on ("" for none)
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_DUMP_SECONDS = float(os.getenv("METRICS_DUMP_SECONDS", "15"))
+
+# Status bar metrics summary refresh interval
+METRICS_REFRESH_MS = 1000
+
+# Profiling: wrap the next PROFILE_NEXT_OPS window operations, or the first PROFILE_SECONDS
+# seconds, in cProfile and tracemalloc from startup (0 for neither; see Tools > Profile)
+PROFILE_NEXT_OPS = int(os.getenv("PROFILE_NEXT_OPS", "0"))
+PROFILE_SECONDS = float(os.getenv("PROFILE_SECONDS", "0"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+
+# Operations and seconds profiled by the Tools menu entries
+PROFILE_MENU_OPS = 20
+PROFILE_MENU_SECONDS = 30
+
+# Functions and allocation sites listed in the text report, and traceback depth of allocations
+PROFILE_TOP = 30
+PROFILE_TRACEBACK_FRAMES = 1
+
+# Color settings
+COLORS = {
+    "primary": "#3498db",    # Blue
+    "secondary": "#2ecc71",  # Green
+    "accent": "#e74c3c",     # Red
+    "bg_light": "#f5f5f5",   # Light gray
+    "bg_dark": "#34495e",    # Dark blue/gray
+    "text_primary": "#2c3e50", # Dark blue/gray
+    "text_secondary": "#7f8c8d", # Gray
+    "available": "#2ecc71",  # Green
+    "maintenance": "#f39c12", # Yellow
+    "booked": "#e74c3c"      # Red
+}
@@ -0,0 +1,113 @@
+"""
+Shared MongoDB connection for the Football Field Management System
+"""
+import threading
+import time
+from pymongo import MongoClient, monitoring
+from pymongo.errors import ConnectionFailure, PyMongoError
+from config import (
+    MONGO_URI, MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_CONNECT_TIMEOUT_MS, MONGO_SOCKET_TIMEOUT_MS, RECONNECT_BASE_DELAY, RECONNECT_MAX_DELAY,
+    CIRCUIT_BREAKER_THRESHOLD
+)
+from utils.metrics import metrics
+
+class CircuitOpenError(ConnectionFailure):
+    """Raised without contacting the server while the circuit breaker is open"""
+
+class CommandTimer(monitoring.CommandListener):
+    """pymongo command listener recording the server time of each command (mongo.<command>)"""
+    
+    def __init__(self, registry):
+        """Initialize the listener"""
+        self.registry = registry
+    
+    def started(self, event):
+        """Ignore command starts; the finish events carry the duration"""
+    
+    def succeeded(self, event):
+        """Record a finished command"""
+        self.registry.record(f"mongo.{event.command_name}", event.duration_micros / 1e6)
+    
+    def failed(self, event):
+        """Record a failed command"""
+        self.registry.record(f"mongo.{event.command_name}", event.duration_micros / 1e6, error=True)
+
+class ConnectionManager:
+    """One pooled MongoClient per process, with reconnect backoff and a circuit breaker"""
+    
+    def __init__(self, uri=MONGO_URI):
+        """Initialize the connection manager"""
+        self.uri = uri
+        self.client = None
+        
+        # Guards the client and the breaker state; reentrant because get_client
+        # records the outcome of its connection attempt while holding it
+        self.lock = threading.RLock()
+        
+        # Consecutive connection failures and the time the circuit closes again
+        self.failures = 0
+        self.retry_at = 0.0
+    
+    def get_client(self):
+        """Get the shared client, connecting on first use"""
+        self.check()
+        with self.lock:
+            # Concurrent callers wait here for one connection attempt instead of each making a client
+            if self.client is not None:
+                return self.client
+            
+            client = MongoClient(
+                self.uri,
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                minPoolSize=MONGO_MIN_POOL_SIZE,
+                serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+                socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+                event_listeners=[CommandTimer(metrics)] if metrics.enabled else []
+            )
+            try:
+                client.admin.command('ping')
+            except PyMongoError:
+                client.close()
+                self.record_failure()
+                raise
+            
+            self.client = client
+            self.record_success()
+            return client
+    
+    def check(self):
+        """Fail fast while the circuit breaker is open"""
+        remaining = self.retry_at - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(f"MongoDB is unavailable, retrying in {remaining:.0f}s")
+    
+    def is_open(self):
+        """Check whether calls currently fail fast"""
+        return self.retry_at > time.monotonic()
+    
+    def record_failure(self):
+        """Count a connection failure and open the circuit once they pile up"""
+        with self.lock:
+            self.failures += 1
+            if self.failures >= CIRCUIT_BREAKER_THRESHOLD:
+                # Exponential backoff between attempts while the server stays down
+                delay = RECONNECT_BASE_DELAY * 2 ** min(self.failures - CIRCUIT_BREAKER_THRESHOLD, 16)
+                self.retry_at = time.monotonic() + min(delay, RECONNECT_MAX_DELAY)
+    
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self.lock:
+            self.failures = 0
+            self.retry_at = 0.0
+    
+    def close(self):
+        """Close the shared client and its pool"""
+        with self.lock:
+            if self.client is not None:
+                self.client.close()
+                self.client = None
+
+# Process-wide connection shared by every Database
+connection_manager = ConnectionManager()
@@ -1,153 +1,480 @@
-"""
-Database operations for the Football Field Management System
-"""
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, PyMongoError
-from config import MONGO_URI, DB_NAME, COLLECTION_NAME
-from bson.objectid import ObjectId
-
-class Database:
-    """Database class for MongoDB operations"""
-    
-    def __init__(self):
-        """Initialize the database connection"""
-        self.client = None
-        self.db = None
-        self.collection = None
-        self.is_connected = False
-    
-    def connect(self):
-        """Connect to MongoDB"""
-        try:
-            self.client = MongoClient(MONGO_URI)
-            # Test connection
-            self.client.admin.command('ping')
-            self.db = self.client[DB_NAME]
-            self.collection = self.db[COLLECTION_NAME]
-            self.is_connected = True
-            return True, "Connected to MongoDB successfully"
-        except ConnectionFailure as e:
-            self.is_connected = False
-            return False, f"MongoDB connection failed: {str(e)}"
-        except PyMongoError as e:
-            self.is_connected = False
-            return False, f"MongoDB error: {str(e)}"
-    
-    def create_field(self, field_data):
-        """Create a new football field"""
-        try:
-            if not self.is_connected:
-                success, message = self.connect()
-                if not success:
-                    return False, message
-            
-            result = self.collection.insert_one(field_data)
-            return True, str(result.inserted_id)
-        except PyMongoError as e:
-            return False, f"Error creating field: {str(e)}"
-    
-    def get_all_fields(self):
-        """Get all football fields"""
-        try:
-            if not self.is_connected:
-                success, message = self.connect()
-                if not success:
-                    return False, message
-            
-            fields = list(self.collection.find())
-            return True, fields
-        except PyMongoError as e:
-            return False, f"Error retrieving fields: {str(e)}"
-    
-    def get_field_by_id(self, field_id):
-        """Get a football field by ID"""
-        try:
-            if not self.is_connected:
-                success, message = self.connect()
-                if not success:
-                    return False, message
-            
-            field = self.collection.find_one({"_id": ObjectId(field_id)})
-            if field:
-                return True, field
-            else:
-                return False, "Field not found"
-        except PyMongoError as e:
-            return False, f"Error retrieving field: {str(e)}"
-    
-    def update_field(self, field_id, field_data):
-        """Update a football field"""
-        try:
-            if not self.is_connected:
-                success, message = self.connect()
-                if not success:
-                    return False, message
-            
-            result = self.collection.update_one(
-                {"_id": ObjectId(field_id)},
-                {"$set": field_data}
-            )
-            
-            if result.matched_count > 0:
-                return True, "Field updated successfully"
-            else:
-                return False, "Field not found"
-        except PyMongoError as e:
-            return False, f"Error updating field: {str(e)}"
-    
-    def delete_field(self, field_id):
-        """Delete a football field"""
-        try:
-            if not self.is_connected:
-                success, message = self.connect()
-                if not success:
-                    return False, message
-            
-            result = self.collection.delete_one({"_id": ObjectId(field_id)})
-            
-            if result.deleted_count > 0:
-                return True, "Field deleted successfully"
-            else:
-                return False, "Field not found"
-        except PyMongoError as e:
-            return False, f"Error deleting field: {str(e)}"
-    
-    def search_fields(self, query):
-        """Search for football fields"""
-        try:
-            if not self.is_connected:
-                success, message = self.connect()
-                if not success:
-                    return False, message
-            
-            # Create a query that searches in name and location fields
-            search_query = {
-                "$or": [
-                    {"name": {"$regex": query, "$options": "i"}},
-                    {"location": {"$regex": query, "$options": "i"}}
-                ]
-            }
-            
-            fields = list(self.collection.find(search_query))
-            return True, fields
-        except PyMongoError as e:
-            return False, f"Error searching fields: {str(e)}"
-    
-    def filter_fields_by_status(self, status):
-        """Filter fields by status"""
-        try:
-            if not self.is_connected:
-                success, message = self.connect()
-                if not success:
-                    return False, message
-            
-            fields = list(self.collection.find({"status": status}))
-            return True, fields
-        except PyMongoError as e:
-            return False, f"Error filtering fields: {str(e)}"
-    
-    def close(self):
-        """Close the database connection"""
-        if self.client:
-            self.client.close()
-            self.is_connected = False
\ No newline at end of file
+"""
+Database operations for the Football Field Management System
+"""
+import functools
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from pymongo import ASCENDING, DESCENDING, TEXT, ReturnDocument
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure, PyMongoError
+from config import (
+    DB_NAME, COLLECTION_NAME, BOOKINGS_COLLECTION_NAME, TOMBSTONES_COLLECTION_NAME, PAGE_SIZE,
+    LIST_PROJECTION, SEARCH_MODE, DELTA_SYNC_OVERLAP_SECONDS, TOMBSTONE_RETENTION_DAYS
+)
+from connection import CircuitOpenError, connection_manager
+from bson.objectid import ObjectId
+
+logger = logging.getLogger(__name__)
+
+# Error codes of aggregation operators the server does not know (e.g. $percentile before 7.0)
+UNKNOWN_OPERATOR_CODES = (168, 15952, 40324)
+
+# Fields the list can be sorted by on the server, each with a (field, _id) index
+SORTABLE_FIELDS = ("name_lower", "location_lower", "capacity", "price_per_hour", "status")
+
+def add_search_keys(field_data):
+    """Add the normalized lowercase keys used by prefix search"""
+    if "name" in field_data:
+        field_data["name_lower"] = str(field_data["name"]).lower()
+    if "location" in field_data:
+        field_data["location_lower"] = str(field_data["location"]).lower()
+    return field_data
+
+def stamp_updated_at(field_data):
+    """Set updated_at on a field written without one, so delta syncs see the write"""
+    field_data.setdefault("updated_at", datetime.now().isoformat())
+    return field_data
+
+def sync_since(synced_at):
+    """Get the updated_at bound of a delta sync after one at synced_at (ISO time), None if a full load is needed"""
+    if not synced_at:
+        return None
+    try:
+        since = datetime.fromisoformat(synced_at) - timedelta(seconds=DELTA_SYNC_OVERLAP_SECONDS)
+    except ValueError:
+        return None
+    
+    # Tombstones older than the retention period are gone, so deletions could be missed
+    if datetime.now() - since > timedelta(days=TOMBSTONE_RETENTION_DAYS):
+        return None
+    return since.isoformat()
+
+def matches_search(field, query, mode=SEARCH_MODE):
+    """Check locally whether a field matches a search, mirroring build_search_query"""
+    name = str(field.get("name", "")).lower()
+    location = str(field.get("location", "")).lower()
+    query = query.lower()
+    
+    if mode == "prefix":
+        return name.startswith(query) or location.startswith(query)
+    
+    if mode == "text":
+        # Whole-word match; MongoDB also applies stemming, so this is an approximation
+        words = set(re.findall(r"\w+", f"{name} {location}"))
+        return any(word in words for word in re.findall(r"\w+", query))
+    
+    return query in name or query in location
+
+def plan_stages(plan):
+    """List the stages of a MongoDB query plan, outermost first"""
+    # Servers running the slot-based engine nest the classic plan under queryPlan
+    if "queryPlan" in plan:
+        return plan_stages(plan["queryPlan"])
+    
+    stages = [plan.get("stage")]
+    if "inputStage" in plan:
+        stages.extend(plan_stages(plan["inputStage"]))
+    for input_stage in plan.get("inputStages", []):
+        stages.extend(plan_stages(input_stage))
+    return stages
+
+def with_connection(error_message):
+    """Connect before a Database method runs and turn PyMongo errors into (False, message)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # Reconnect when the shared client was closed or replaced
+            if not self.is_connected or self.client is not connection_manager.client:
+                success, message = self.connect()
+                if not success:
+                    return False, message
+            
+            try:
+                connection_manager.check()
+                result = method(self, *args, **kwargs)
+            except ConnectionFailure as e:
+                if not isinstance(e, CircuitOpenError):
+                    connection_manager.record_failure()
+                return False, f"{error_message}: {str(e)}"
+            except PyMongoError as e:
+                return False, f"{error_message}: {str(e)}"
+            
+            if connection_manager.failures:
+                connection_manager.record_success()
+            return result
+        return wrapper
+    return decorator
+
+class Database:
+    """Database class for MongoDB operations"""
+    
+    def __init__(self):
+        """Initialize the database connection"""
+        self.client = None
+        self.db = None
+        self.collection = None
+        self.bookings = None
+        self.tombstones = None
+        self.is_connected = False
+        
+        # Callables notified as listener(action, field) after each successful write
+        self.write_listeners = []
+    
+    def add_write_listener(self, listener):
+        """Register a callable notified after each successful write"""
+        self.write_listeners.append(listener)
+    
+    def notify_write(self, action, field):
+        """Notify the write listeners of a created, updated or deleted field (None for bulk writes)"""
+        for listener in self.write_listeners:
+            listener(action, field)
+    
+    def connect(self):
+        """Connect to MongoDB"""
+        try:
+            # All instances share one pooled client
+            self.client = connection_manager.get_client()
+            self.db = self.client[DB_NAME]
+            self.collection = self.db[COLLECTION_NAME]
+            self.bookings = self.db[BOOKINGS_COLLECTION_NAME]
+            self.tombstones = self.db[TOMBSTONES_COLLECTION_NAME]
+            self.is_connected = True
+            
+            # Missing indexes only slow queries down, so a failure here is not fatal
+            success, message = self.ensure_indexes()
+            if not success:
+                logger.warning(message)
+                return True, f"Connected to MongoDB successfully ({message})"
+            return True, "Connected to MongoDB successfully"
+        except ConnectionFailure as e:
+            self.is_connected = False
+            return False, f"MongoDB connection failed: {str(e)}"
+        except PyMongoError as e:
+            self.is_connected = False
+            return False, f"MongoDB error: {str(e)}"
+    
+    def ensure_indexes(self):
+        """Create the indexes used by search, filtering and sync; returns (success, message)"""
+        # (collection, keys, options) of every index
+        indexes = [
+            (self.collection, [("status", ASCENDING)], {"name": "status"}),
+            (self.collection, [("updated_at", ASCENDING)], {"name": "updated_at"}),
+            (self.collection, [("name_lower", ASCENDING)], {"name": "name_lower"}),
+            (self.collection, [("location_lower", ASCENDING)], {"name": "location_lower"}),
+            (self.collection, [("name", TEXT), ("location", TEXT)], {"name": "name_location_text"})
+        ]
+        
+        # Compound indexes for sorted pagination (usable in both directions)
+        for field in SORTABLE_FIELDS:
+            indexes.append((self.collection, [(field, ASCENDING), ("_id", ASCENDING)], {"name": f"{field}_id"}))
+        
+        # Loading the conflict index reads confirmed bookings per field in time order
+        indexes.append((
+            self.bookings,
+            [("status", ASCENDING), ("end", ASCENDING), ("field_id", ASCENDING)],
+            {"name": "status_end_field"}
+        ))
+        indexes.append((self.bookings, [("field_id", ASCENDING), ("start", ASCENDING)], {"name": "field_start"}))
+        
+        # Delta syncs read tombstones by deletion time; MongoDB expires them after the retention period
+        indexes.append((self.tombstones, [("deleted_at", ASCENDING)], {"name": "deleted_at"}))
+        indexes.append((self.tombstones, [("expires_at", ASCENDING)], {"name": "expires_at", "expireAfterSeconds": 0}))
+        
+        # Each index is created on its own, so one that conflicts with an existing
+        # index (same keys under another name, a second text index) skips nothing else
+        errors = []
+        for collection, keys, options in indexes:
+            try:
+                collection.create_index(keys, **options)
+            except ConnectionFailure:
+                raise
+            except PyMongoError as e:
+                errors.append(f"{options['name']}: {str(e)}")
+        
+        # Backfill search keys for fields written before they existed
+        try:
+            self.collection.update_many(
+                {"$or": [{"name_lower": {"$exists": False}}, {"location_lower": {"$exists": False}}]},
+                [{"$set": {
+                    "name_lower": {"$toLower": "$name"},
+                    "location_lower": {"$toLower": "$location"}
+                }}]
+            )
+        except ConnectionFailure:
+            raise
+        except PyMongoError as e:
+            errors.append(f"search key backfill: {str(e)}")
+        
+        if errors:
+            return False, f"Error creating indexes: {'; '.join(errors)}"
+        return True, "Indexes created successfully"
+    
+    @with_connection("Error creating field")
+    def create_field(self, field_data):
+        """Create a new football field"""
+        # insert_one sets _id on field_data, which becomes the created document
+        self.collection.insert_one(add_search_keys(stamp_updated_at(field_data)))
+        self.notify_write("create", field_data)
+        return True, field_data
+    
+    @with_connection("Error creating fields")
+    def bulk_create_fields(self, fields_data):
+        """Create many football fields with one unordered insert"""
+        documents = [add_search_keys(stamp_updated_at(field_data)) for field_data in fields_data]
+        
+        # Unordered: one bad document does not stop the rest of the batch
+        try:
+            result = self.collection.insert_many(documents, ordered=False)
+            summary = {"inserted": len(result.inserted_ids), "errors": []}
+        except BulkWriteError as e:
+            errors = [(error["index"], error["errmsg"]) for error in e.details.get("writeErrors", [])]
+            summary = {"inserted": e.details.get("nInserted", 0), "errors": errors}
+        
+        self.notify_write("bulk_create", None)
+        return True, summary
+    
+    @with_connection("Error retrieving fields")
+    def get_all_fields(self):
+        """Get all football fields"""
+        fields = list(self.collection.find())
+        return True, fields
+    
+    @with_connection("Error retrieving fields")
+    def get_fields_cursor(self, query=None, projection=None, batch_size=PAGE_SIZE):
+        """Get a cursor over football fields for streaming large results"""
+        # Documents are fetched lazily, batch_size at a time, while iterating
+        cursor = self.collection.find(query or {}, projection).batch_size(batch_size)
+        return True, cursor
+    
+    @with_connection("Error retrieving fields")
+    def get_fields_page(self, cursor=None, page_size=PAGE_SIZE, projection=LIST_PROJECTION,
+                        sort_field=None, descending=False, query=None):
+        """Get a page of football fields (optionally matching a query) and the cursor of the next page"""
+        direction = DESCENDING if descending else ASCENDING
+        after = "$lt" if descending else "$gt"
+        
+        # Keyset pagination: continue after the last (sort value, _id) of the previous page
+        if sort_field:
+            after_cursor = {}
+            if cursor is not None:
+                value, last_id = cursor
+                branches = [{sort_field: value, "_id": {after: last_id}}]
+                
+                # Missing and null values sort before every other value, and $gt/$lt
+                # never match across that boundary, so it is crossed explicitly
+                if value is None:
+                    if not descending:
+                        branches.append({sort_field: {"$ne": None}})
+                else:
+                    branches.append({sort_field: {after: value}})
+                    if descending:
+                        branches.append({sort_field: None})
+                after_cursor = {"$or": branches}
+            sort = [(sort_field, direction), ("_id", direction)]
+            if projection:
+                projection = dict(projection, **{sort_field: 1})
+        else:
+            after_cursor = {"_id": {after: cursor}} if cursor is not None else {}
+            sort = [("_id", direction)]
+        
+        if query and after_cursor:
+            query = {"$and": [query, after_cursor]}
+        else:
+            query = query or after_cursor
+        
+        # Fetch one extra document to know whether another page exists
+        fields = list(
+            self.collection.find(query, projection)
+            .sort(sort)
+            .limit(page_size + 1)
+        )
+        
+        next_cursor = None
+        if len(fields) > page_size:
+            fields = fields[:page_size]
+            last = fields[-1]
+            next_cursor = (last.get(sort_field), last["_id"]) if sort_field else last["_id"]
+        
+        return True, (fields, next_cursor)
+    
+    @with_connection("Error retrieving changes")
+    def get_field_changes(self, since, projection=None):
+        """Get the fields updated at or after since (ISO time) and the IDs of the fields deleted since"""
+        # Both queries are index range scans, so the cost follows the number of changes
+        updated = list(self.collection.find({"updated_at": {"$gte": since}}, projection))
+        deleted = [
+            tombstone["field_id"]
+            for tombstone in self.tombstones.find({"deleted_at": {"$gte": since}}, {"field_id": 1})
+        ]
+        return True, (updated, deleted)
+    
+    @with_connection("Error checking for changes")
+    def get_version(self):
+        """Get a marker of the collection's state that changes with every write, for cache revalidation"""
+        # The latest updated_at is read from the index alone; the counts come from collection metadata
+        latest = list(self.collection.find({}, {"updated_at": 1, "_id": 0}).sort("updated_at", DESCENDING).limit(1))
+        return True, (
+            latest[0].get("updated_at") if latest else None,
+            self.collection.estimated_document_count(),
+            self.tombstones.estimated_document_count()
+        )
+    
+    @with_connection("Error retrieving field")
+    def get_field_by_id(self, field_id):
+        """Get a football field by ID"""
+        field = self.collection.find_one({"_id": ObjectId(field_id)})
+        if field:
+            return True, field
+        else:
+            return False, "Field not found"
+    
+    @with_connection("Error updating field")
+    def update_field(self, field_id, field_data):
+        """Update a football field"""
+        # Return the updated document so callers can patch their copy
+        field = self.collection.find_one_and_update(
+            {"_id": ObjectId(field_id)},
+            {"$set": add_search_keys(stamp_updated_at(field_data))},
+            return_document=ReturnDocument.AFTER
+        )
+        
+        if field:
+            self.notify_write("update", field)
+            return True, field
+        else:
+            return False, "Field not found"
+    
+    @with_connection("Error deleting field")
+    def delete_field(self, field_id):
+        """Delete a football field"""
+        # Return the deleted document so callers can remove their copy
+        field = self.collection.find_one_and_delete({"_id": ObjectId(field_id)})
+        
+        if field:
+            # Leave a tombstone so the delta syncs of other clients remove the field too.
+            # The field is already gone, so a failed tombstone is logged, not reported
+            # as a failed delete (other clients then only drop it on a full reload)
+            try:
+                self.tombstones.insert_one({
+                    "field_id": str(field["_id"]),
+                    "deleted_at": datetime.now().isoformat(),
+                    "expires_at": datetime.now(timezone.utc) + timedelta(days=TOMBSTONE_RETENTION_DAYS)
+                })
+            except PyMongoError as e:
+                logger.warning("Field %s deleted without a tombstone: %s", field["_id"], str(e))
+            self.notify_write("delete", field)
+            return True, field
+        else:
+            return False, "Field not found"
+    
+    def build_search_query(self, query, mode=SEARCH_MODE):
+        """Build the MongoDB query for a search in name and location"""
+        if mode == "prefix":
+            # Anchored, case-sensitive regexes on the lowercase keys use their indexes
+            prefix = "^" + re.escape(query.lower())
+            return {
+                "$or": [
+                    {"name_lower": {"$regex": prefix}},
+                    {"location_lower": {"$regex": prefix}}
+                ]
+            }
+        
+        if mode == "text":
+            return {"$text": {"$search": query}}
+        
+        # Fallback: unanchored case-insensitive regex (always a collection scan)
+        pattern = re.escape(query)
+        return {
+            "$or": [
+                {"name": {"$regex": pattern, "$options": "i"}},
+                {"location": {"$regex": pattern, "$options": "i"}}
+            ]
+        }
+    
+    @with_connection("Error searching fields")
+    def search_fields(self, query, mode=SEARCH_MODE, projection=None, limit=0):
+        """Search for football fields, optionally projected and returning at most limit (0 for all)"""
+        try:
+            fields = list(self.collection.find(self.build_search_query(query, mode), projection).limit(limit))
+        except OperationFailure:
+            if mode == "regex":
+                raise
+            # The index this mode needs is missing, fall back to a regex search
+            fields = list(self.collection.find(self.build_search_query(query, "regex"), projection).limit(limit))
+        
+        return True, fields
+    
+    @with_connection("Error explaining search")
+    def explain_search(self, query, mode=SEARCH_MODE):
+        """Get the stages of the query plan MongoDB picks for a search"""
+        plan = self.collection.find(self.build_search_query(query, mode)).explain()
+        return True, plan_stages(plan["queryPlanner"]["winningPlan"])
+    
+    @with_connection("Error filtering fields")
+    def filter_fields_by_status(self, status):
+        """Filter fields by status"""
+        fields = list(self.collection.find({"status": status}))
+        return True, fields
+    
+    @with_connection("Error explaining filter")
+    def explain_filter(self, status):
+        """Get the stages of the query plan MongoDB picks for a status filter"""
+        plan = self.collection.find({"status": status}).explain()
+        return True, plan_stages(plan["queryPlanner"]["winningPlan"])
+    
+    @with_connection("Error creating booking")
+    def create_booking(self, booking_data):
+        """Create a confirmed booking unless another stored booking overlaps it"""
+        # insert_one sets _id on booking_data, which becomes the created document
+        self.bookings.insert_one(booking_data)
+        
+        # Another process may have booked the slot after this one checked its conflict index.
+        # Checking after the insert means that of two racing bookings, the one checked last
+        # sees the other: both may be refused, but both cannot stand
+        conflict = self.bookings.find_one({
+            "field_id": booking_data["field_id"],
+            "status": "Confirmed",
+            "start": {"$lt": booking_data["end"]},
+            "end": {"$gt": booking_data["start"]},
+            "_id": {"$ne": booking_data["_id"]}
+        })
+        if conflict:
+            self.bookings.delete_one({"_id": booking_data["_id"]})
+            return False, f"Field is already booked from {conflict['start']:%Y-%m-%d %H:%M} to {conflict['end']:%H:%M}"
+        
+        return True, booking_data
+    
+    @with_connection("Error retrieving bookings")
+    def get_bookings_cursor(self, query=None, batch_size=PAGE_SIZE):
+        """Get a cursor over bookings for streaming large results"""
+        return True, self.bookings.find(query or {}).batch_size(batch_size)
+    
+    @with_connection("Error updating booking")
+    def update_booking_status(self, booking_id, status):
+        """Change the status of a booking"""
+        booking = self.bookings.find_one_and_update(
+            {"_id": ObjectId(booking_id)},
+            {"$set": {"status": status, "updated_at": datetime.now().isoformat()}},
+            return_document=ReturnDocument.AFTER
+        )
+        
+        if booking:
+            return True, booking
+        else:
+            return False, "Booking not found"
+    
+    @with_connection("Error running aggregation")
+    def aggregate_fields(self, pipeline, fallback=None):
+        """Run an aggregation pipeline on the fields collection, or fallback if the server lacks one of its operators"""
+        try:
+            return True, list(self.collection.aggregate(pipeline))
+        except OperationFailure as e:
+            if fallback is None or e.code not in UNKNOWN_OPERATOR_CODES:
+                raise
+            return True, list(self.collection.aggregate(fallback))
+    
+    def close(self):
+        """Close the shared database connection"""
+        if self.client:
+            connection_manager.close()
+            self.is_connected = False
@@ -1,3 +1,3 @@
-"""
-GUI package for the Football Field Management System
-"""
\ No newline at end of file
+"""
+GUI package for the Football Field Management System
+"""
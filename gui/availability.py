@@ -0,0 +1,124 @@
+"""
+Availability search for the Football Field Management System
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import datetime, timedelta
+from config import FIELD_STATUS
+
+class AvailabilityFrame(ttk.Frame):
+    """Frame for finding the fields that are free for a time slot"""
+    
+    # Status filter choice meaning "any status"
+    ANY_STATUS = "Any"
+    
+    def __init__(self, parent, search_callback=None):
+        """Initialize the availability frame"""
+        super().__init__(parent)
+        self.parent = parent
+        self.search_callback = search_callback
+        
+        # Create UI components
+        self.create_widgets()
+    
+    def create_widgets(self):
+        """Create UI widgets"""
+        # Query frame
+        self.query_frame = ttk.Frame(self)
+        self.query_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # Date and time range, defaulting to the next full hour
+        start = (datetime.now() + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+        self.date_var = tk.StringVar(value=start.strftime("%Y-%m-%d"))
+        self.start_var = tk.StringVar(value=start.strftime("%H:%M"))
+        self.end_var = tk.StringVar(value=(start + timedelta(hours=1)).strftime("%H:%M"))
+        
+        ttk.Label(self.query_frame, text="Date:").pack(side=tk.LEFT, padx=5)
+        ttk.Entry(self.query_frame, textvariable=self.date_var, width=11).pack(side=tk.LEFT)
+        ttk.Label(self.query_frame, text="From:").pack(side=tk.LEFT, padx=5)
+        ttk.Entry(self.query_frame, textvariable=self.start_var, width=6).pack(side=tk.LEFT)
+        ttk.Label(self.query_frame, text="To:").pack(side=tk.LEFT, padx=5)
+        ttk.Entry(self.query_frame, textvariable=self.end_var, width=6).pack(side=tk.LEFT)
+        
+        # Filters
+        self.capacity_var = tk.StringVar()
+        ttk.Label(self.query_frame, text="Min. capacity:").pack(side=tk.LEFT, padx=5)
+        ttk.Spinbox(self.query_frame, from_=0, to=1000, textvariable=self.capacity_var, width=5).pack(side=tk.LEFT)
+        
+        self.location_var = tk.StringVar()
+        ttk.Label(self.query_frame, text="Location:").pack(side=tk.LEFT, padx=5)
+        ttk.Entry(self.query_frame, textvariable=self.location_var, width=15).pack(side=tk.LEFT)
+        
+        self.status_var = tk.StringVar(value="Available")
+        ttk.Label(self.query_frame, text="Status:").pack(side=tk.LEFT, padx=5)
+        ttk.Combobox(
+            self.query_frame,
+            textvariable=self.status_var,
+            values=[self.ANY_STATUS] + FIELD_STATUS,
+            state="readonly",
+            width=16
+        ).pack(side=tk.LEFT)
+        
+        # Search button
+        self.search_button = ttk.Button(self.query_frame, text="Find Free Fields", command=self.on_search)
+        self.search_button.pack(side=tk.LEFT, padx=10)
+        
+        # Results
+        columns = ("name", "location", "capacity", "price", "status")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        self.tree.heading("name", text="Name")
+        self.tree.heading("location", text="Location")
+        self.tree.heading("capacity", text="Capacity")
+        self.tree.heading("price", text="Price/Hour")
+        self.tree.heading("status", text="Status")
+        
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscroll=self.scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=5)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+    
+    def parse_query(self):
+        """Read the query from the form as (start, end, min capacity, status, location, errors)"""
+        errors = []
+        start = end = None
+        try:
+            start = datetime.strptime(f"{self.date_var.get().strip()} {self.start_var.get().strip()}", "%Y-%m-%d %H:%M")
+            end = datetime.strptime(f"{self.date_var.get().strip()} {self.end_var.get().strip()}", "%Y-%m-%d %H:%M")
+            if end <= start:
+                end += timedelta(days=1)  # e.g. 23:00 to 01:00
+        except ValueError:
+            errors.append("Enter the date as YYYY-MM-DD and the times as HH:MM")
+        
+        min_capacity = None
+        if self.capacity_var.get().strip():
+            try:
+                min_capacity = int(self.capacity_var.get())
+            except ValueError:
+                errors.append("Minimum capacity must be an integer")
+        
+        status = self.status_var.get()
+        status = None if status == self.ANY_STATUS else status
+        location = self.location_var.get().strip() or None
+        return start, end, min_capacity, status, location, errors
+    
+    def on_search(self):
+        """Handle search button click"""
+        start, end, min_capacity, status, location, errors = self.parse_query()
+        if errors:
+            messagebox.showerror("Validation Error", "\n".join(errors))
+            return
+        
+        if self.search_callback:
+            self.search_callback(start, end, min_capacity, status, location)
+    
+    def show_results(self, fields):
+        """Show the free fields"""
+        self.tree.delete(*self.tree.get_children())
+        for field in fields:
+            self.tree.insert("", tk.END, values=(
+                field.get("name", ""),
+                field.get("location", ""),
+                field.get("capacity", ""),
+                f"${field.get('price_per_hour', 0):.2f}",
+                field.get("status", "")
+            ))
@@ -0,0 +1,132 @@
+"""
+Diagnostics panel for the Football Field Management System
+"""
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from config import METRICS_REFRESH_MS
+
+class DiagnosticsWindow(tk.Toplevel):
+    """Window listing the latency, documents and bytes of each instrumented operation"""
+    
+    # Treeview columns as (column, heading, width)
+    COLUMNS = (
+        ("operation", "Operation", 220),
+        ("count", "Calls", 60),
+        ("errors", "Errors", 60),
+        ("mean", "Mean", 70),
+        ("p50", "p50", 70),
+        ("p95", "p95", 70),
+        ("p99", "p99", 70),
+        ("max", "Max", 70),
+        ("documents", "Documents", 80),
+        ("bytes", "Bytes", 90)
+    )
+    
+    def __init__(self, parent, registry, cache=None):
+        """Initialize the diagnostics window, with the counters of a FieldCache when given"""
+        super().__init__(parent)
+        self.registry = registry
+        self.cache = cache
+        self.refresh_job = None
+        self.title("Diagnostics")
+        self.geometry("900x400")
+        
+        # Create UI components
+        self.create_widgets()
+        self.refresh()
+        
+        self.protocol("WM_DELETE_WINDOW", self.close)
+    
+    def create_widgets(self):
+        """Create UI widgets"""
+        if not self.registry.enabled:
+            ttk.Label(
+                self,
+                text="Metrics are off. Start the application with METRICS_ENABLED=1 to record them."
+            ).pack(fill=tk.X, padx=10, pady=10)
+        
+        # Field cache counters
+        self.cache_label = ttk.Label(self)
+        if self.cache is not None:
+            self.cache_label.pack(fill=tk.X, padx=10, pady=(10, 0))
+        
+        # Operations table
+        self.table_frame = ttk.Frame(self)
+        self.table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        self.tree = ttk.Treeview(
+            self.table_frame,
+            columns=[column for column, _, _ in self.COLUMNS],
+            show="headings"
+        )
+        for column, heading, width in self.COLUMNS:
+            self.tree.heading(column, text=heading)
+            anchor = tk.W if column == "operation" else tk.E
+            self.tree.column(column, width=width, minwidth=50, anchor=anchor)
+        
+        self.scrollbar = ttk.Scrollbar(self.table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscroll=self.scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Buttons
+        self.button_frame = ttk.Frame(self)
+        self.button_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        ttk.Button(self.button_frame, text="Reset", command=self.reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(self.button_frame, text="Export Prometheus...", command=self.export).pack(side=tk.LEFT, padx=5)
+        ttk.Button(self.button_frame, text="Close", command=self.close).pack(side=tk.RIGHT, padx=5)
+    
+    def refresh(self):
+        """Show the current stats, and refresh them again later"""
+        rows = self.registry.snapshot()
+        self.tree.delete(*self.tree.get_children())
+        for name, row in rows.items():
+            self.tree.insert("", tk.END, values=(
+                name,
+                row["count"],
+                row["errors"],
+                f"{row['mean'] * 1000:.1f}ms",
+                f"{row['p50'] * 1000:.1f}ms",
+                f"{row['p95'] * 1000:.1f}ms",
+                f"{row['p99'] * 1000:.1f}ms",
+                f"{row['max'] * 1000:.1f}ms",
+                row["documents"],
+                row["bytes"]
+            ))
+        
+        if self.cache is not None:
+            stats = self.cache.stats()
+            self.cache_label.config(text=(
+                f"Field cache: {stats['size']}/{stats['max_size']} fields, {stats['hits']} hits, "
+                f"{stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), {stats['evictions']} evictions"
+            ))
+        
+        if self.registry.enabled or self.cache is not None:
+            self.refresh_job = self.after(METRICS_REFRESH_MS, self.refresh)
+    
+    def reset(self):
+        """Forget the recorded stats"""
+        self.registry.reset()
+        self.tree.delete(*self.tree.get_children())
+    
+    def export(self):
+        """Write the stats to a Prometheus text file"""
+        file_path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".prom",
+            filetypes=[("Prometheus text files", "*.prom"), ("All files", "*.*")],
+            initialfile="field_manager.prom"
+        )
+        if not file_path:  # User cancelled
+            return
+        
+        success, result = self.registry.write_prometheus(file_path)
+        if not success:
+            messagebox.showerror("Export Error", result, parent=self)
+    
+    def close(self):
+        """Stop refreshing and close the window"""
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+        self.destroy()
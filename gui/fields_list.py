@@ -1,193 +1,531 @@
-"""
-Fields list display for the Football Field Management System
-"""
-import tkinter as tk
-from tkinter import ttk
-from config import COLORS
-
-class FieldsListFrame(ttk.Frame):
-    """Frame for displaying the list of football fields"""
-    
-    def __init__(self, parent, edit_callback=None, delete_callback=None):
-        """Initialize the fields list frame"""
-        super().__init__(parent)
-        self.parent = parent
-        self.edit_callback = edit_callback
-        self.delete_callback = delete_callback
-        
-        # Store the fields data
-        self.fields = []
-        
-        # Create the UI components
-        self.create_widgets()
-    
-    def create_widgets(self):
-        """Create the UI widgets"""
-        # Create the treeview for displaying fields
-        columns = ("name", "location", "capacity", "price", "status")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings")
-        
-        # Configure the columns
-        self.tree.heading("name", text="Name", command=lambda: self.sort_by_column("name", False))
-        self.tree.heading("location", text="Location", command=lambda: self.sort_by_column("location", False))
-        self.tree.heading("capacity", text="Capacity", command=lambda: self.sort_by_column("capacity", False))
-        self.tree.heading("price", text="Price/Hour", command=lambda: self.sort_by_column("price", False))
-        self.tree.heading("status", text="Status", command=lambda: self.sort_by_column("status", False))
-        
-        # Configure column widths
-        self.tree.column("name", width=150, minwidth=100)
-        self.tree.column("location", width=150, minwidth=100)
-        self.tree.column("capacity", width=100, minwidth=80)
-        self.tree.column("price", width=100, minwidth=80)
-        self.tree.column("status", width=120, minwidth=100)
-        
-        # Add scrollbar
-        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=self.scrollbar.set)
-        
-        # Pack treeview and scrollbar
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Bind events
-        self.tree.bind("<Double-1>", self.on_double_click)
-        self.tree.bind("<ButtonRelease-1>", self.on_select)
-        
-        # Add a context menu
-        self.context_menu = tk.Menu(self, tearoff=0)
-        self.context_menu.add_command(label="Edit", command=self.edit_selected)
-        self.context_menu.add_command(label="Delete", command=self.delete_selected)
-        
-        self.tree.bind("<Button-3>", self.show_context_menu)
-        
-        # Add a toolbar frame for actions
-        self.toolbar = ttk.Frame(self)
-        self.toolbar.pack(side=tk.BOTTOM, fill=tk.X, pady=5)
-        
-        # Add buttons
-        self.refresh_button = ttk.Button(self.toolbar, text="Refresh", command=self.refresh)
-        self.refresh_button.pack(side=tk.LEFT, padx=5)
-        
-        self.edit_button = ttk.Button(self.toolbar, text="Edit", command=self.edit_selected, state=tk.DISABLED)
-        self.edit_button.pack(side=tk.LEFT, padx=5)
-        
-        self.delete_button = ttk.Button(self.toolbar, text="Delete", command=self.delete_selected, state=tk.DISABLED)
-        self.delete_button.pack(side=tk.LEFT, padx=5)
-        
-        # Selected item ID
-        self.selected_id = None
-    
-    def load_fields(self, fields):
-        """Load fields into the treeview"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Store the fields data
-        self.fields = fields
-        
-        # Add fields to the treeview
-        for field in fields:
-            # Set tag based on status for color coding
-            status = field.get("status", "Available")
-            tag = status.lower().replace(" ", "_")
-            
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    field.get("name", ""),
-                    field.get("location", ""),
-                    field.get("capacity", ""),
-                    f"${field.get('price_per_hour', 0):.2f}",
-                    status
-                ),
-                tags=(tag, str(field["_id"]))
-            )
-        
-        # Configure tags for color coding
-        self.tree.tag_configure("available", background=COLORS["available"])
-        self.tree.tag_configure("under_maintenance", background=COLORS["maintenance"])
-        self.tree.tag_configure("booked", background=COLORS["booked"])
-    
-    def on_select(self, event):
-        """Handle selection event"""
-        selection = self.tree.selection()
-        if selection:
-            item = selection[0]
-            item_tags = self.tree.item(item, "tags")
-            if len(item_tags) > 1:  # The second tag is the ID
-                self.selected_id = item_tags[1]
-                # Enable buttons
-                self.edit_button.config(state=tk.NORMAL)
-                self.delete_button.config(state=tk.NORMAL)
-            else:
-                self.selected_id = None
-                # Disable buttons
-                self.edit_button.config(state=tk.DISABLED)
-                self.delete_button.config(state=tk.DISABLED)
-        else:
-            self.selected_id = None
-            # Disable buttons
-            self.edit_button.config(state=tk.DISABLED)
-            self.delete_button.config(state=tk.DISABLED)
-    
-    def on_double_click(self, event):
-        """Handle double-click event"""
-        self.edit_selected()
-    
-    def show_context_menu(self, event):
-        """Show context menu on right-click"""
-        # Select the item under the mouse
-        item = self.tree.identify_row(event.y)
-        if item:
-            self.tree.selection_set(item)
-            item_tags = self.tree.item(item, "tags")
-            if len(item_tags) > 1:  # The second tag is the ID
-                self.selected_id = item_tags[1]
-                # Show context menu
-                self.context_menu.post(event.x_root, event.y_root)
-    
-    def edit_selected(self):
-        """Edit the selected field"""
-        if self.selected_id and self.edit_callback:
-            self.edit_callback(self.selected_id)
-    
-    def delete_selected(self):
-        """Delete the selected field"""
-        if self.selected_id and self.delete_callback:
-            self.delete_callback(self.selected_id)
-    
-    def refresh(self):
-        """Refresh the fields list"""
-        # This will be implemented by the parent
-        pass
-    
-    def sort_by_column(self, column, reverse):
-        """Sort treeview by column"""
-        # Get column index
-        column_index = {
-            "name": 0,
-            "location": 1,
-            "capacity": 2,
-            "price": 3,
-            "status": 4
-        }.get(column, 0)
-        
-        # Get all items with their values
-        l = [(self.tree.set(k, column), k) for k in self.tree.get_children('')]
-        
-        # Special handling for capacity and price (numeric values)
-        if column in ["capacity", "price"]:
-            # Extract numeric value for sorting
-            l = [(float(v.replace('$', '')) if v else 0, k) for v, k in l]
-        
-        # Sort the list
-        l.sort(reverse=reverse)
-        
-        # Rearrange items in sorted positions
-        for index, (val, k) in enumerate(l):
-            self.tree.move(k, '', index)
-        
-        # Reverse sort next time
-        self.tree.heading(column, command=lambda: self.sort_by_column(column, not reverse))
\ No newline at end of file
+"""
+Fields list display for the Football Field Management System
+"""
+import tkinter as tk
+from tkinter import ttk
+from config import COLORS, VIRTUAL_LIST_THRESHOLD
+
+def sort_key(value):
+    """Comparable key of a column value: missing values, then numbers, then text (as MongoDB orders types)"""
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value).lower())
+
+class FieldsListFrame(ttk.Frame):
+    """Frame for displaying the list of football fields"""
+    
+    # Rows rendered beyond the visible window in virtual mode
+    OVERSCAN_ROWS = 2
+    
+    # Fallback row height in pixels until a row can be measured
+    DEFAULT_ROW_HEIGHT = 20
+    
+    # Position of each column in the precomputed sort keys
+    SORT_COLUMNS = {"name": 0, "location": 1, "capacity": 2, "price": 3, "status": 4}
+    
+    # Position of the load sequence number, which orders the list while it is unsorted
+    LOAD_ORDER = len(SORT_COLUMNS)
+    
+    def __init__(self, parent, edit_callback=None, delete_callback=None, load_more_callback=None,
+                 sort_callback=None, refresh_callback=None):
+        """Initialize the fields list frame"""
+        super().__init__(parent)
+        self.parent = parent
+        self.edit_callback = edit_callback
+        self.delete_callback = delete_callback
+        self.load_more_callback = load_more_callback
+        self.sort_callback = sort_callback
+        self.refresh_callback = refresh_callback
+        
+        # Store the fields data, and each loaded field by ID
+        self.fields = []
+        self.field_ids = {}
+        
+        # Typed sort keys and load sequence number of each loaded field, keyed by id() of the document
+        self.sort_keys = {}
+        self.next_sequence = 0
+        
+        # Current sort column and direction, None while in load order
+        self.sort_column = None
+        self.sort_reverse = False
+        
+        # Whether more pages can be requested through load_more_callback
+        self.has_more = False
+        
+        # Virtual mode: only the visible window of self.fields exists as treeview items
+        self.virtual = False
+        self.view_offset = 0
+        self.visible_rows = 1
+        
+        # Create the UI components
+        self.create_widgets()
+    
+    def create_widgets(self):
+        """Create the UI widgets"""
+        # Create the treeview for displaying fields
+        columns = ("name", "location", "capacity", "price", "status")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        
+        # Configure the columns
+        self.tree.heading("name", text="Name", command=lambda: self.sort_by_column("name", False))
+        self.tree.heading("location", text="Location", command=lambda: self.sort_by_column("location", False))
+        self.tree.heading("capacity", text="Capacity", command=lambda: self.sort_by_column("capacity", False))
+        self.tree.heading("price", text="Price/Hour", command=lambda: self.sort_by_column("price", False))
+        self.tree.heading("status", text="Status", command=lambda: self.sort_by_column("status", False))
+        
+        # Configure column widths
+        self.tree.column("name", width=150, minwidth=100)
+        self.tree.column("location", width=150, minwidth=100)
+        self.tree.column("capacity", width=100, minwidth=80)
+        self.tree.column("price", width=100, minwidth=80)
+        self.tree.column("status", width=120, minwidth=100)
+        
+        # Add scrollbar
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.tree.configure(yscroll=self.on_tree_scroll)
+        
+        # Pack treeview and scrollbar
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Bind events
+        self.tree.bind("<Double-1>", self.on_double_click)
+        self.tree.bind("<ButtonRelease-1>", self.on_select)
+        self.tree.bind("<Configure>", self.on_resize)
+        
+        # Scrolling is handled by the frame in virtual mode
+        self.tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.tree.bind("<Button-4>", self.on_mouse_wheel)
+        self.tree.bind("<Button-5>", self.on_mouse_wheel)
+        self.tree.bind("<Up>", lambda event: self.on_key_move(-1))
+        self.tree.bind("<Down>", lambda event: self.on_key_move(1))
+        self.tree.bind("<Prior>", lambda event: self.on_key_move(-self.visible_rows))
+        self.tree.bind("<Next>", lambda event: self.on_key_move(self.visible_rows))
+        
+        # Add a context menu
+        self.context_menu = tk.Menu(self, tearoff=0)
+        self.context_menu.add_command(label="Edit", command=self.edit_selected)
+        self.context_menu.add_command(label="Delete", command=self.delete_selected)
+        
+        self.tree.bind("<Button-3>", self.show_context_menu)
+        
+        # Add a toolbar frame for actions
+        self.toolbar = ttk.Frame(self)
+        self.toolbar.pack(side=tk.BOTTOM, fill=tk.X, pady=5)
+        
+        # Add buttons
+        self.refresh_button = ttk.Button(self.toolbar, text="Refresh", command=self.refresh)
+        self.refresh_button.pack(side=tk.LEFT, padx=5)
+        
+        self.edit_button = ttk.Button(self.toolbar, text="Edit", command=self.edit_selected, state=tk.DISABLED)
+        self.edit_button.pack(side=tk.LEFT, padx=5)
+        
+        self.delete_button = ttk.Button(self.toolbar, text="Delete", command=self.delete_selected, state=tk.DISABLED)
+        self.delete_button.pack(side=tk.LEFT, padx=5)
+        
+        # Configure tags for color coding
+        self.tree.tag_configure("available", background=COLORS["available"])
+        self.tree.tag_configure("under_maintenance", background=COLORS["maintenance"])
+        self.tree.tag_configure("booked", background=COLORS["booked"])
+        
+        # Selected item ID
+        self.selected_id = None
+    
+    def load_fields(self, fields, has_more=False, sort=None):
+        """Load fields into the treeview, optionally already sorted as (column, reverse)"""
+        # Clear existing items
+        self.tree.delete(*self.tree.get_children())
+        
+        # Store the fields data
+        self.fields = []
+        self.field_ids = {}
+        self.sort_keys = {}
+        self.next_sequence = 0
+        self.sort_column, self.sort_reverse = sort if sort else (None, False)
+        self.virtual = False
+        self.view_offset = 0
+        self.append_fields(fields, has_more)
+    
+    def append_fields(self, fields, has_more=False):
+        """Append a page of fields to the treeview"""
+        # Skip fields already added, e.g. created while the list was paged
+        fields = [field for field in fields if str(field["_id"]) not in self.field_ids]
+        for field in fields:
+            self.field_ids[str(field["_id"])] = field
+            self.sort_keys[id(field)] = self.make_sort_keys(field, self.next_sequence)
+            self.next_sequence += 1
+        self.fields.extend(fields)
+        self.has_more = has_more
+        
+        # Switch to virtual mode once the list grows past the threshold
+        if not self.virtual and len(self.fields) > VIRTUAL_LIST_THRESHOLD:
+            self.virtual = True
+            self.tree.delete(*self.tree.get_children())
+            self.tree.yview_moveto(0)
+        
+        if self.virtual:
+            self.render_window()
+            return
+        
+        # Add fields to the treeview, using the field ID as item ID
+        for field in fields:
+            self.tree.insert(
+                "",
+                tk.END,
+                iid=str(field["_id"]),
+                values=self.row_values(field),
+                tags=self.row_tags(field)
+            )
+    
+    def upsert_field(self, field):
+        """Insert or update a single field, keeping the current sort order"""
+        field_id = str(field["_id"])
+        index = self.index_of(field_id)
+        if index is not None:
+            # The replacement keeps the load position of the field it replaces
+            sequence = self.sort_keys.pop(id(self.fields.pop(index)))[self.LOAD_ORDER]
+        else:
+            sequence = self.next_sequence
+            self.next_sequence += 1
+        self.field_ids[field_id] = field
+        self.sort_keys[id(field)] = self.make_sort_keys(field, sequence)
+        
+        # Place the field where the current sort puts it, otherwise keep its position
+        if self.sort_column:
+            position = self.insert_position(field)
+        elif index is not None:
+            position = index
+        else:
+            position = len(self.fields)
+        self.fields.insert(position, field)
+        
+        if self.virtual:
+            self.render_window()
+        elif self.tree.exists(field_id):
+            self.tree.item(field_id, values=self.row_values(field), tags=self.row_tags(field))
+            self.tree.move(field_id, "", position)
+        else:
+            self.tree.insert(
+                "",
+                position,
+                iid=field_id,
+                values=self.row_values(field),
+                tags=self.row_tags(field)
+            )
+    
+    def remove_field(self, field_id):
+        """Remove a single field from the list"""
+        index = self.index_of(field_id)
+        if index is None:
+            return
+        
+        del self.field_ids[field_id]
+        del self.sort_keys[id(self.fields.pop(index))]
+        
+        if self.selected_id == field_id:
+            self.selected_id = None
+            self.update_buttons()
+        
+        if self.virtual:
+            self.render_window()
+        elif self.tree.exists(field_id):
+            self.tree.delete(field_id)
+    
+    def order_index(self):
+        """Get the position in the sort keys of what the list is ordered by"""
+        return self.SORT_COLUMNS[self.sort_column] if self.sort_column else self.LOAD_ORDER
+    
+    def insert_position(self, field):
+        """Find where a field belongs in the current order, by sort key then load sequence (binary search)"""
+        column_index = self.order_index()
+        keys = self.sort_keys[id(field)]
+        key, sequence = keys[column_index], keys[self.LOAD_ORDER]
+        low, high = 0, len(self.fields)
+        while low < high:
+            middle = (low + high) // 2
+            middle_keys = self.sort_keys[id(self.fields[middle])]
+            middle_key = middle_keys[column_index]
+            if middle_key == key:
+                before = middle_keys[self.LOAD_ORDER] < sequence
+            else:
+                before = (middle_key > key) if self.sort_reverse else (middle_key < key)
+            if before:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def row_values(self, field):
+        """Get the displayed column values of a field"""
+        return (
+            field.get("name", ""),
+            field.get("location", ""),
+            field.get("capacity", ""),
+            f"${field.get('price_per_hour', 0):.2f}",
+            field.get("status", "Available")
+        )
+    
+    def row_tags(self, field):
+        """Get the tags of a field row (status tag for color coding, then the ID)"""
+        status = field.get("status", "Available")
+        return (status.lower().replace(" ", "_"), str(field["_id"]))
+    
+    def render_window(self):
+        """Render the visible window of fields in virtual mode"""
+        total = len(self.fields)
+        max_offset = max(0, total - self.visible_rows)
+        self.view_offset = max(0, min(self.view_offset, max_offset))
+        
+        window = self.fields[self.view_offset:self.view_offset + self.visible_rows + self.OVERSCAN_ROWS]
+        items = self.tree.get_children()
+        
+        # Reuse the existing items and only add or remove the difference
+        for index, field in enumerate(window):
+            if index < len(items):
+                self.tree.item(items[index], values=self.row_values(field), tags=self.row_tags(field))
+            else:
+                self.tree.insert("", tk.END, values=self.row_values(field), tags=self.row_tags(field))
+        
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+        
+        # Keep the treeview itself at the top; the offset does the scrolling
+        self.tree.yview_moveto(0)
+        
+        # Restore the selection if the selected field is in the window
+        selected_item = None
+        for item in self.tree.get_children():
+            item_tags = self.tree.item(item, "tags")
+            if len(item_tags) > 1 and item_tags[1] == self.selected_id:
+                selected_item = item
+                break
+        
+        if selected_item:
+            self.tree.selection_set(selected_item)
+        else:
+            self.tree.selection_set(())
+        
+        # Re-render if the measured window size changed
+        previous_rows = self.visible_rows
+        self.update_visible_rows()
+        if self.visible_rows != previous_rows:
+            self.after_idle(self.render_window)
+        
+        # Map the scrollbar onto the full result set
+        if total:
+            self.scrollbar.set(self.view_offset / total, min(1.0, (self.view_offset + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        
+        # Request the next page when the window reaches the end of the loaded fields
+        if self.view_offset + self.visible_rows >= total:
+            self.request_more()
+    
+    def scroll_to(self, offset):
+        """Scroll the virtual window to the given row offset"""
+        self.view_offset = int(offset)
+        self.render_window()
+    
+    def update_visible_rows(self):
+        """Compute how many rows fit in the treeview"""
+        height = self.tree.winfo_height()
+        items = self.tree.get_children()
+        bbox = self.tree.bbox(items[0]) if items else None
+        
+        if bbox:
+            top, row_height = bbox[1], bbox[3]
+        else:
+            top, row_height = self.DEFAULT_ROW_HEIGHT, self.DEFAULT_ROW_HEIGHT
+        
+        self.visible_rows = max(1, (height - top) // max(1, row_height))
+    
+    def request_more(self):
+        """Ask the parent for the next page of fields"""
+        if self.has_more and self.load_more_callback:
+            # Only one request at a time; append_fields re-enables paging
+            self.has_more = False
+            self.after_idle(self.load_more_callback)
+    
+    def on_tree_scroll(self, first, last):
+        """Update the scrollbar and request the next page near the end of the list"""
+        if self.virtual:
+            # The scrollbar reflects the virtual window, see render_window
+            return
+        
+        self.scrollbar.set(first, last)
+        
+        if float(last) >= 1.0:
+            self.request_more()
+    
+    def on_scrollbar(self, *args):
+        """Handle scrollbar commands"""
+        if not self.virtual:
+            self.tree.yview(*args)
+            return
+        
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.fields))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.scroll_to(self.view_offset + int(args[1]) * step)
+    
+    def on_mouse_wheel(self, event):
+        """Handle mouse wheel scrolling in virtual mode"""
+        if not self.virtual:
+            return None
+        
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.view_offset - 3)
+        else:
+            self.scroll_to(self.view_offset + 3)
+        return "break"
+    
+    def on_key_move(self, step):
+        """Move the selection with the keyboard in virtual mode"""
+        if not self.virtual or not self.fields:
+            return None
+        
+        # Rendered rows map directly onto the loaded fields
+        selection = self.tree.selection()
+        if selection:
+            index = self.view_offset + self.tree.index(selection[0])
+        else:
+            index = self.index_of(self.selected_id)
+        index = 0 if index is None else max(0, min(len(self.fields) - 1, index + step))
+        self.select_index(index)
+        return "break"
+    
+    def on_resize(self, event):
+        """Recompute the window size when the treeview is resized"""
+        self.update_visible_rows()
+        if self.virtual:
+            self.render_window()
+    
+    def index_of(self, field_id):
+        """Get the position of a loaded field, or None"""
+        field = self.field_ids.get(field_id)
+        if field is None:
+            return None
+        
+        # The list is ordered by the sort column, then by load sequence among equal keys
+        index = self.insert_position(field)
+        if index < len(self.fields) and self.fields[index] is field:
+            return index
+        
+        # A server sort can disagree with the local keys (e.g. on missing values)
+        for index, loaded in enumerate(self.fields):
+            if loaded is field:
+                return index
+        return None
+    
+    def get_field(self, field_id):
+        """Get a loaded field by ID, or None"""
+        return self.field_ids.get(field_id)
+    
+    def select_index(self, index):
+        """Select the field at a position, scrolling it into view"""
+        self.selected_id = str(self.fields[index]["_id"])
+        
+        if index < self.view_offset:
+            self.view_offset = index
+        elif index >= self.view_offset + self.visible_rows:
+            self.view_offset = index - self.visible_rows + 1
+        
+        self.render_window()
+        self.update_buttons()
+    
+    def update_buttons(self):
+        """Enable the edit and delete buttons only when a field is selected"""
+        state = tk.NORMAL if self.selected_id else tk.DISABLED
+        self.edit_button.config(state=state)
+        self.delete_button.config(state=state)
+    
+    def on_select(self, event):
+        """Handle selection event"""
+        selection = self.tree.selection()
+        if selection:
+            item = selection[0]
+            item_tags = self.tree.item(item, "tags")
+            if len(item_tags) > 1:  # The second tag is the ID
+                self.selected_id = item_tags[1]
+            else:
+                self.selected_id = None
+        else:
+            self.selected_id = None
+        
+        # Enable or disable buttons
+        self.update_buttons()
+    
+    def on_double_click(self, event):
+        """Handle double-click event"""
+        self.edit_selected()
+    
+    def show_context_menu(self, event):
+        """Show context menu on right-click"""
+        # Select the item under the mouse
+        item = self.tree.identify_row(event.y)
+        if item:
+            self.tree.selection_set(item)
+            item_tags = self.tree.item(item, "tags")
+            if len(item_tags) > 1:  # The second tag is the ID
+                self.selected_id = item_tags[1]
+                self.update_buttons()
+                # Show context menu
+                self.context_menu.post(event.x_root, event.y_root)
+    
+    def edit_selected(self):
+        """Edit the selected field"""
+        if self.selected_id and self.edit_callback:
+            self.edit_callback(self.selected_id)
+    
+    def delete_selected(self):
+        """Delete the selected field"""
+        if self.selected_id and self.delete_callback:
+            self.delete_callback(self.selected_id)
+    
+    def refresh(self):
+        """Refresh the fields list"""
+        if self.refresh_callback:
+            self.refresh_callback()
+    
+    def sort_by_column(self, column, reverse):
+        """Sort by column, on the server when the parent pages the list"""
+        if not (self.sort_callback and self.sort_callback(column, reverse)):
+            self.sort_fields(column, reverse)
+        
+        self.sort_column = column
+        self.sort_reverse = reverse
+        
+        # Reverse sort next time
+        self.tree.heading(column, command=lambda: self.sort_by_column(column, not reverse))
+    
+    def sort_fields(self, column, reverse):
+        """Sort the loaded fields by their precomputed keys"""
+        keys = self.sort_keys
+        column_index = self.SORT_COLUMNS[column]
+        
+        # Equal keys stay in load order in both directions (sorts are stable)
+        self.fields.sort(key=lambda field: keys[id(field)][self.LOAD_ORDER])
+        self.fields.sort(key=lambda field: keys[id(field)][column_index], reverse=reverse)
+        
+        if self.virtual:
+            self.view_offset = 0
+            self.render_window()
+        else:
+            # Rearrange items in sorted positions
+            for index, field in enumerate(self.fields):
+                self.tree.move(str(field["_id"]), "", index)
+    
+    def make_sort_keys(self, field, sequence):
+        """Compute the typed sort keys of a field, in SORT_COLUMNS order, then its load sequence"""
+        # A missing or null value (or a number stored as text) must not make the sort raise
+        return (
+            sort_key(field.get("name")),
+            sort_key(field.get("location")),
+            sort_key(field.get("capacity")),
+            sort_key(field.get("price_per_hour")),
+            sort_key(field.get("status")),
+            sequence
+        )
@@ -1,211 +1,853 @@
-"""
-Main window for the Football Field Management System
-"""
-import tkinter as tk
-from tkinter import ttk, messagebox
-from gui.fields_list import FieldsListFrame
-from gui.form import AddEditFieldFrame
-from gui.search import SearchFilterFrame
-from database import Database
-
-class MainWindow(ttk.Frame):
-    """Main application window"""
-    
-    def __init__(self, parent):
-        """Initialize the main window"""
-        super().__init__(parent)
-        self.parent = parent
-        
-        # Initialize database
-        self.db = Database()
-        success, message = self.db.connect()
-        if not success:
-            messagebox.showerror("Database Error", message)
-        
-        # Create UI components
-        self.create_widgets()
-        
-        # Default state - no selected field
-        self.selected_field_id = None
-        
-        # When the window is closed, close the database connection
-        self.parent.protocol("WM_DELETE_WINDOW", self.on_close)
-    
-    def create_widgets(self):
-        """Create UI widgets"""
-        # Main title
-        self.title_frame = ttk.Frame(self)
-        self.title_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.title_label = ttk.Label(
-            self.title_frame, 
-            text="Football Field Management System",
-            font=('Helvetica', 16, 'bold')
-        )
-        self.title_label.pack(side=tk.LEFT)
-        
-        # Create a notebook (tabbed interface)
-        self.notebook = ttk.Notebook(self)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # Tab 1: Fields List
-        self.fields_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.fields_tab, text="Fields")
-        
-        # Search and filter frame
-        self.search_filter_frame = SearchFilterFrame(
-            self.fields_tab,
-            search_callback=self.search_fields,
-            filter_callback=self.filter_fields,
-            reset_callback=self.reset_fields
-        )
-        self.search_filter_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        # Fields list frame
-        self.fields_list_frame = FieldsListFrame(
-            self.fields_tab,
-            edit_callback=self.edit_field,
-            delete_callback=self.confirm_delete_field
-        )
-        self.fields_list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # Tab 2: Add/Edit Field
-        self.add_edit_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.add_edit_tab, text="Add/Edit Field")
-        
-        # Add/Edit form
-        self.add_edit_form = AddEditFieldFrame(
-            self.add_edit_tab,
-            save_callback=self.save_field,
-            cancel_callback=self.cancel_edit
-        )
-        self.add_edit_form.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Status bar
-        self.status_bar = ttk.Label(
-            self,
-            text="Ready",
-            relief=tk.SUNKEN,
-            anchor=tk.W
-        )
-        self.status_bar.pack(fill=tk.X, side=tk.BOTTOM, padx=5, pady=2)
-        
-        # Load fields on startup
-        self.load_fields()
-    
-    def load_fields(self):
-        """Load all fields from the database"""
-        success, result = self.db.get_all_fields()
-        if success:
-            self.fields_list_frame.load_fields(result)
-            self.status_bar.config(text=f"Loaded {len(result)} fields")
-        else:
-            messagebox.showerror("Error", result)
-            self.status_bar.config(text="Error loading fields")
-    
-    def search_fields(self, query):
-        """Search fields by query"""
-        if not query:
-            self.load_fields()
-            return
-        
-        success, result = self.db.search_fields(query)
-        if success:
-            self.fields_list_frame.load_fields(result)
-            self.status_bar.config(text=f"Found {len(result)} fields matching '{query}'")
-        else:
-            messagebox.showerror("Error", result)
-            self.status_bar.config(text="Error searching fields")
-    
-    def filter_fields(self, status):
-        """Filter fields by status"""
-        success, result = self.db.filter_fields_by_status(status)
-        if success:
-            self.fields_list_frame.load_fields(result)
-            self.status_bar.config(text=f"Found {len(result)} fields with status '{status}'")
-        else:
-            messagebox.showerror("Error", result)
-            self.status_bar.config(text="Error filtering fields")
-    
-    def reset_fields(self):
-        """Reset fields to show all"""
-        self.load_fields()
-        self.search_filter_frame.reset()
-    
-    def edit_field(self, field_id):
-        """Edit a field"""
-        success, field = self.db.get_field_by_id(field_id)
-        if success:
-            self.selected_field_id = field_id
-            self.add_edit_form.set_field_data(field)
-            self.notebook.select(1)  # Switch to Add/Edit tab
-            self.status_bar.config(text=f"Editing field: {field['name']}")
-        else:
-            messagebox.showerror("Error", field)
-            self.status_bar.config(text="Error loading field for editing")
-    
-    def save_field(self, field_data):
-        """Save a field (create or update)"""
-        if self.selected_field_id:  # Update existing field
-            success, message = self.db.update_field(self.selected_field_id, field_data)
-            if success:
-                messagebox.showinfo("Success", "Field updated successfully")
-                self.selected_field_id = None
-                self.add_edit_form.clear()
-                self.notebook.select(0)  # Switch to Fields tab
-                self.load_fields()
-                self.status_bar.config(text="Field updated successfully")
-            else:
-                messagebox.showerror("Error", message)
-                self.status_bar.config(text="Error updating field")
-        else:  # Create new field
-            success, message = self.db.create_field(field_data)
-            if success:
-                messagebox.showinfo("Success", "Field created successfully")
-                self.add_edit_form.clear()
-                self.notebook.select(0)  # Switch to Fields tab
-                self.load_fields()
-                self.status_bar.config(text="Field created successfully")
-            else:
-                messagebox.showerror("Error", message)
-                self.status_bar.config(text="Error creating field")
-    
-    def confirm_delete_field(self, field_id):
-        """Confirm field deletion"""
-        success, field = self.db.get_field_by_id(field_id)
-        if success:
-            confirm = messagebox.askyesno(
-                "Confirm Delete",
-                f"Are you sure you want to delete the field '{field['name']}'?"
-            )
-            if confirm:
-                self.delete_field(field_id)
-        else:
-            messagebox.showerror("Error", field)
-    
-    def delete_field(self, field_id):
-        """Delete a field"""
-        success, message = self.db.delete_field(field_id)
-        if success:
-            messagebox.showinfo("Success", "Field deleted successfully")
-            self.load_fields()
-            self.status_bar.config(text="Field deleted successfully")
-        else:
-            messagebox.showerror("Error", message)
-            self.status_bar.config(text="Error deleting field")
-    
-    def cancel_edit(self):
-        """Cancel field editing"""
-        self.selected_field_id = None
-        self.add_edit_form.clear()
-        self.notebook.select(0)  # Switch to Fields tab
-        self.status_bar.config(text="Edit cancelled")
-    
-    def on_close(self):
-        """Handle window close event"""
-        # Close database connection
-        if self.db:
-            self.db.close()
-        
-        # Destroy the window
-        self.parent.destroy()
\ No newline at end of file
+"""
+Main window for the Football Field Management System
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+import time
+from datetime import datetime
+from gui.availability import AvailabilityFrame
+from gui.diagnostics import DiagnosticsWindow
+from gui.fields_list import FieldsListFrame
+from gui.form import AddEditFieldFrame
+from gui.search import SearchFilterFrame
+from gui.worker import DatabaseWorker
+from utils.metrics import metrics
+from utils.profiling import profiler
+from snapshot import SnapshotStore, SYNC_PROJECTION
+from config import (
+    SEARCH_MODE, METRICS_FILE, METRICS_DUMP_SECONDS, METRICS_REFRESH_MS, PROFILE_NEXT_OPS,
+    PROFILE_SECONDS, PROFILE_MENU_OPS, PROFILE_MENU_SECONDS, SNAPSHOT_ENABLED, FORM_PROJECTION,
+    SEARCH_LIMIT
+)
+
+class MainWindow(ttk.Frame):
+    """Main application window"""
+    
+    # Database field behind each sortable list column
+    SORT_FIELDS = {
+        "name": "name_lower",
+        "location": "location_lower",
+        "capacity": "capacity",
+        "price": "price_per_hour",
+        "status": "status"
+    }
+    
+    # Methods run on worker threads; the Database calls inside them are recorded as db.*
+    WORKER_METHODS = ("connect_database", "sync_snapshot")
+    
+    # Handlers that are not operations worth timing (the refresh timer would only add noise)
+    METRICS_EXCLUDE = ("refresh_metrics",) + WORKER_METHODS
+    
+    # Handlers that are not operations worth profiling (timers and the profiling controls)
+    PROFILER_EXCLUDE = WORKER_METHODS + (
+        "refresh_metrics",
+        "set_busy",
+        "profile_next_operations",
+        "profile_next_seconds",
+        "start_profiling",
+        "stop_profiling",
+        "on_profile_finished",
+        "on_profile_written"
+    )
+    
+    def __init__(self, parent):
+        """Initialize the main window"""
+        super().__init__(parent)
+        self.parent = parent
+        
+        # Time the handlers when metrics are on
+        metrics.instrument(self, "ui", cls=MainWindow, exclude=self.METRICS_EXCLUDE)
+        self.metrics_dumped_at = time.monotonic()
+        
+        # Handlers can be profiled on demand; each one counts towards "the next N operations"
+        profiler.instrument(self, "ui", cls=MainWindow, counts=True, exclude=self.PROFILER_EXCLUDE)
+        profiler.on_finish = self.on_profile_finished
+        self.profile_job = None
+        if PROFILE_NEXT_OPS or PROFILE_SECONDS:
+            self.start_profiling(PROFILE_NEXT_OPS, PROFILE_SECONDS)
+        
+        # Cursor of the next page of fields, None when everything is loaded
+        self.next_cursor = None
+        
+        # What the fields list shows: ("all", None), ("search", query) or ("status", status)
+        self.list_view = ("all", None)
+        
+        # Server-side sort of the paged list as (column, reverse), None for _id order
+        self.list_sort = None
+        
+        # When the server was asked for what the list shows (ISO time), the base of the
+        # next delta refresh; None while the list comes from the local snapshot
+        self.list_synced_at = None
+        
+        # Server results of the last search, narrowed locally while the query grows
+        self.search_base_query = None
+        self.search_base_results = None
+        
+        # Database calls run in the background so the UI never blocks
+        self.worker = DatabaseWorker(self, busy_callback=self.set_busy)
+        
+        # The database layer is imported and connected in the background once the
+        # window is shown (see start_backend), so pymongo never delays the first paint
+        self.db = None
+        self.bookings = None
+        self.availability = None
+        self.availability_loaded = False
+        
+        # Local copy of the fields list, shown until the server answers and whenever it cannot
+        self.snapshot = SnapshotStore() if SNAPSHOT_ENABLED else None
+        
+        # Create UI components
+        self.create_widgets()
+        
+        # Default state - no selected field
+        self.selected_field_id = None
+        
+        # When the window is closed, close the database connection
+        self.parent.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Show the local snapshot right away, and connect once the window has been drawn
+        self.show_snapshot("all", None)
+        self.after_idle(self.start_backend)
+    
+    def create_widgets(self):
+        """Create UI widgets"""
+        # Menu bar
+        self.menu_bar = tk.Menu(self.parent)
+        self.tools_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.tools_menu.add_command(label="Diagnostics...", command=self.show_diagnostics)
+        self.tools_menu.add_separator()
+        self.tools_menu.add_command(
+            label=f"Profile Next {PROFILE_MENU_OPS} Operations",
+            command=self.profile_next_operations
+        )
+        self.tools_menu.add_command(
+            label=f"Profile Next {PROFILE_MENU_SECONDS} Seconds",
+            command=self.profile_next_seconds
+        )
+        self.tools_menu.add_command(label="Stop Profiling", command=self.stop_profiling)
+        self.menu_bar.add_cascade(label="Tools", menu=self.tools_menu)
+        self.parent.config(menu=self.menu_bar)
+        
+        # Main title
+        self.title_frame = ttk.Frame(self)
+        self.title_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.title_label = ttk.Label(
+            self.title_frame, 
+            text="Football Field Management System",
+            font=('Helvetica', 16, 'bold')
+        )
+        self.title_label.pack(side=tk.LEFT)
+        
+        # Create a notebook (tabbed interface)
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Tab 1: Fields List
+        self.fields_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.fields_tab, text="Fields")
+        
+        # Search and filter frame
+        self.search_filter_frame = SearchFilterFrame(
+            self.fields_tab,
+            search_callback=self.search_fields,
+            filter_callback=self.filter_fields,
+            reset_callback=self.reset_fields
+        )
+        self.search_filter_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        # Fields list frame
+        self.fields_list_frame = FieldsListFrame(
+            self.fields_tab,
+            edit_callback=self.edit_field,
+            delete_callback=self.confirm_delete_field,
+            load_more_callback=self.load_more_fields,
+            sort_callback=self.sort_fields,
+            refresh_callback=self.refresh_fields
+        )
+        self.fields_list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Tab 2: Availability
+        self.availability_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.availability_tab, text="Availability")
+        
+        self.availability_frame = AvailabilityFrame(
+            self.availability_tab,
+            search_callback=self.find_available_fields
+        )
+        self.availability_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Tab 3: Add/Edit Field
+        self.add_edit_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.add_edit_tab, text="Add/Edit Field")
+        
+        # Add/Edit form
+        self.add_edit_form = AddEditFieldFrame(
+            self.add_edit_tab,
+            save_callback=self.save_field,
+            cancel_callback=self.cancel_edit
+        )
+        self.add_edit_form.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Status bar with a busy indicator for background requests
+        self.status_frame = ttk.Frame(self)
+        self.status_frame.pack(fill=tk.X, side=tk.BOTTOM, padx=5, pady=2)
+        
+        self.status_bar = ttk.Label(
+            self.status_frame,
+            text="Starting...",
+            relief=tk.SUNKEN,
+            anchor=tk.W
+        )
+        self.status_bar.pack(fill=tk.X, side=tk.LEFT, expand=True)
+        
+        self.busy_indicator = ttk.Progressbar(self.status_frame, mode="indeterminate", length=100)
+        
+        # Live latency summary when metrics are on
+        if metrics.enabled:
+            self.metrics_label = ttk.Label(self.status_frame, relief=tk.SUNKEN, anchor=tk.E)
+            self.metrics_label.pack(side=tk.RIGHT, padx=(5, 0))
+            self.after(METRICS_REFRESH_MS, self.refresh_metrics)
+    
+    def start_backend(self):
+        """Import the database layer and connect on a worker thread"""
+        self.status_bar.config(text="Connecting to the database...")
+        self.worker.submit("startup", self.connect_database, callback=self.on_database_connected)
+    
+    def connect_database(self):
+        """Create and connect the database (runs on a worker thread)"""
+        from cache import CachedDatabase
+        from database import Database
+        from utils.metrics import result_size
+        
+        # Single-field reads are served from a local cache
+        db = metrics.instrument(CachedDatabase(), "db", cls=Database, measure=result_size)
+        profiler.instrument(db, "db", cls=Database)
+        connected, message = db.connect()
+        return True, (db, connected, message)
+    
+    def on_database_connected(self, success, result):
+        """Set up bookings and availability and load the first page of fields"""
+        if not success:
+            messagebox.showerror("Database Error", result)
+            self.status_bar.config(text="Database unavailable")
+            return
+        
+        self.db, connected, message = result
+        
+        from availability import AvailabilityIndex
+        from bookings import BookingManager
+        
+        # Bookings and the index of free time slots, kept current by their writes
+        self.bookings = BookingManager(self.db)
+        self.availability = AvailabilityIndex()
+        self.bookings.add_listener(self.availability.on_booking_change)
+        self.db.add_write_listener(self.availability.on_field_write)
+        if self.snapshot:
+            self.db.add_write_listener(self.snapshot.on_field_write)
+        
+        if not connected:
+            # Work from the local snapshot; later requests try the server again
+            if self.show_snapshot("all", None, message):
+                return
+            messagebox.showerror("Database Error", message)
+        
+        # Load fields on startup
+        self.load_fields()
+        self.load_availability()
+        
+        # Bring the local snapshot up to date in the background
+        if connected and self.snapshot:
+            self.worker.submit("snapshot", self.sync_snapshot, callback=self.on_snapshot_synced)
+    
+    def sync_snapshot(self):
+        """Bring the local snapshot up to date with the server (runs on a worker thread)"""
+        from database import sync_since
+        
+        # Only the changes since the last sync, unless it never synced or too long ago
+        synced_at = datetime.now().isoformat()
+        since = sync_since(self.snapshot.read_synced_at())
+        if since is None:
+            success, fields = self.db.get_all_fields()
+            if not success:
+                return False, fields
+            return self.snapshot.replace_all(fields, synced_at)
+        
+        success, result = self.db.get_field_changes(since, SYNC_PROJECTION)
+        if not success:
+            return False, result
+        updated, deleted = result
+        return self.snapshot.apply_changes(updated, deleted, synced_at)
+    
+    def on_snapshot_synced(self, success, result):
+        """Report a failed snapshot update"""
+        if not success:
+            self.status_bar.config(text=result)
+    
+    def show_snapshot(self, view, value, error=None):
+        """Show a list view from the local snapshot, e.g. because of a server error; returns whether there is one"""
+        if self.snapshot is None:
+            return False
+        
+        if view == "search":
+            func, args = self.snapshot.search_fields, (value,)
+        elif view == "status":
+            func, args = self.snapshot.filter_fields_by_status, (value,)
+        else:
+            func, args = self.snapshot.load_fields, ()
+        
+        self.worker.submit(
+            "list",
+            func,
+            *args,
+            callback=lambda success, result: self.on_snapshot_shown(view, value, error, success, result)
+        )
+        return True
+    
+    def on_snapshot_shown(self, view, value, error, success, result):
+        """Show fields read from the local snapshot"""
+        if not success or (view == "all" and not result):
+            # No snapshot to show; at startup the server's answer is coming anyway
+            if error:
+                messagebox.showerror("Error", error)
+                self.status_bar.config(text="Database unavailable")
+            return
+        
+        self.next_cursor = None
+        self.list_view = (view, value)
+        self.list_synced_at = None
+        self.search_base_results = None
+        self.fields_list_frame.load_fields(result)
+        
+        synced_at = (self.snapshot.synced_at or "")[:16].replace("T", " ")
+        source = f"from the local snapshot of {synced_at}" if synced_at else "from the local snapshot"
+        if view == "search":
+            found = f"{len(result)} fields matching '{value}'"
+        elif view == "status":
+            found = f"{len(result)} fields with status '{value}'"
+        else:
+            found = f"{len(result)} fields"
+        state = "Connecting" if not error and self.worker.is_busy("startup") else "Offline"
+        self.status_bar.config(text=f"{state}: {found} {source}")
+    
+    def database_ready(self):
+        """Check whether the database is set up, asking the user to wait otherwise"""
+        if self.db is None:
+            self.status_bar.config(text="Still connecting to the database, try again in a moment")
+            return False
+        return True
+    
+    def load_fields(self, sort=None):
+        """Load the first page of fields from the database, optionally sorted as (column, reverse)"""
+        if self.db is None and self.show_snapshot("all", None):
+            return
+        
+        if not self.database_ready():
+            return
+        
+        self.next_cursor = None
+        self.list_sort = sort
+        self.list_synced_at = datetime.now().isoformat()
+        self.status_bar.config(text="Loading fields...")
+        self.worker.submit(
+            "list",
+            self.db.get_fields_page,
+            projection=FORM_PROJECTION,
+            callback=self.on_fields_loaded,
+            **self.sort_arguments()
+        )
+    
+    def sort_arguments(self):
+        """Get the get_fields_page arguments for the current server-side sort"""
+        if not self.list_sort:
+            return {}
+        column, reverse = self.list_sort
+        return {"sort_field": self.SORT_FIELDS[column], "descending": reverse}
+    
+    def sort_fields(self, column, reverse):
+        """Sort on the server while the list is paged; returns whether it did"""
+        if self.list_view[0] != "all" or self.next_cursor is None:
+            return False  # Everything is loaded, the list sorts locally
+        
+        self.load_fields(sort=(column, reverse))
+        return True
+    
+    def on_fields_loaded(self, success, result):
+        """Show the first page of fields"""
+        if success:
+            fields, self.next_cursor = result
+            self.list_view = ("all", None)
+            self.fields_list_frame.load_fields(
+                fields,
+                has_more=self.next_cursor is not None,
+                sort=self.list_sort
+            )
+            self.update_loaded_status()
+        elif not self.show_snapshot("all", None, result):
+            messagebox.showerror("Error", result)
+            self.status_bar.config(text="Error loading fields")
+    
+    def load_more_fields(self):
+        """Load the next page of fields from the database"""
+        if self.next_cursor is None:
+            return
+        
+        self.worker.submit(
+            "list",
+            self.db.get_fields_page,
+            cursor=self.next_cursor,
+            projection=FORM_PROJECTION,
+            callback=self.on_more_fields_loaded,
+            **self.sort_arguments()
+        )
+    
+    def on_more_fields_loaded(self, success, result):
+        """Append the next page of fields"""
+        if success:
+            fields, self.next_cursor = result
+            self.fields_list_frame.append_fields(fields, has_more=self.next_cursor is not None)
+            self.update_loaded_status()
+        else:
+            messagebox.showerror("Error", result)
+            self.status_bar.config(text="Error loading fields")
+    
+    def update_loaded_status(self):
+        """Show how many fields are loaded in the status bar"""
+        count = len(self.fields_list_frame.fields)
+        if self.next_cursor is not None:
+            self.status_bar.config(text=f"Loaded {count} fields (scroll down for more)")
+        else:
+            self.status_bar.config(text=f"Loaded {count} fields")
+    
+    def search_fields(self, query):
+        """Search fields by query"""
+        if not query:
+            self.load_fields()
+            return
+        
+        if self.db is None and self.show_snapshot("search", query):
+            return
+        
+        if not self.database_ready():
+            return
+        
+        from database import matches_search
+        
+        # A longer query only matches a subset of the previous results, so
+        # narrow them in memory instead of asking the server again
+        if self.can_narrow_search(query):
+            self.worker.cancel("list")
+            result = [field for field in self.search_base_results if matches_search(field, query)]
+            self.show_search_results(query, result)
+            return
+        
+        self.list_synced_at = datetime.now().isoformat()
+        self.status_bar.config(text=f"Searching for '{query}'...")
+        # One more than is shown, to know whether the results were cut off
+        self.worker.submit(
+            "list",
+            self.db.search_fields,
+            query,
+            SEARCH_MODE,
+            FORM_PROJECTION,
+            SEARCH_LIMIT + 1,
+            callback=lambda success, result: self.on_search_done(query, success, result)
+        )
+    
+    def can_narrow_search(self, query):
+        """Check whether a search can be answered from the previous results"""
+        return (
+            SEARCH_MODE != "text"  # Word matches do not shrink as the query grows
+            and self.search_base_results is not None
+            and self.list_view[0] == "search"
+            and query.lower().startswith(self.search_base_query.lower())
+        )
+    
+    def on_search_done(self, query, success, result):
+        """Show search results from the server"""
+        if success:
+            # Cut-off results cannot be narrowed locally: a longer query may match fields not fetched
+            truncated = len(result) > SEARCH_LIMIT
+            result = result[:SEARCH_LIMIT]
+            self.search_base_query = query
+            self.search_base_results = None if truncated else result
+            self.show_search_results(query, result, truncated)
+        elif not self.show_snapshot("search", query, result):
+            messagebox.showerror("Error", result)
+            self.status_bar.config(text="Error searching fields")
+    
+    def show_search_results(self, query, result, truncated=False):
+        """Show search results in the fields list"""
+        self.next_cursor = None
+        self.list_view = ("search", query)
+        self.fields_list_frame.load_fields(result)
+        if truncated:
+            self.status_bar.config(text=f"Showing the first {len(result)} fields matching '{query}', refine the search for more")
+        else:
+            self.status_bar.config(text=f"Found {len(result)} fields matching '{query}'")
+    
+    def filter_fields(self, status):
+        """Filter fields by status"""
+        if self.db is None and self.show_snapshot("status", status):
+            return
+        
+        if not self.database_ready():
+            return
+        
+        self.list_synced_at = datetime.now().isoformat()
+        self.status_bar.config(text=f"Filtering by status '{status}'...")
+        self.worker.submit(
+            "list",
+            self.db.filter_fields_by_status,
+            status,
+            callback=lambda success, result: self.on_filter_done(status, success, result)
+        )
+    
+    def on_filter_done(self, status, success, result):
+        """Show filter results"""
+        if success:
+            self.next_cursor = None
+            self.list_view = ("status", status)
+            self.fields_list_frame.load_fields(result)
+            self.status_bar.config(text=f"Found {len(result)} fields with status '{status}'")
+        elif not self.show_snapshot("status", status, result):
+            messagebox.showerror("Error", result)
+            self.status_bar.config(text="Error filtering fields")
+    
+    def refresh_fields(self):
+        """Merge the fields changed on the server since the list was loaded"""
+        if self.db is None or self.list_synced_at is None:
+            self.reload_fields()
+            return
+        
+        from database import sync_since
+        
+        since = sync_since(self.list_synced_at)
+        if since is None:
+            self.reload_fields()  # Too long ago for the tombstones to cover
+            return
+        
+        # Only documents written since the last load or refresh are fetched
+        base = self.list_synced_at
+        synced_at = datetime.now().isoformat()
+        self.status_bar.config(text="Refreshing fields...")
+        self.worker.submit(
+            "refresh",
+            self.db.get_field_changes,
+            since,
+            SYNC_PROJECTION,
+            callback=lambda success, result: self.on_fields_refreshed(base, synced_at, success, result)
+        )
+        
+        if self.snapshot:
+            self.worker.submit("snapshot", self.sync_snapshot, callback=self.on_snapshot_synced)
+    
+    def reload_fields(self):
+        """Load the current list view again"""
+        view, value = self.list_view
+        self.search_base_results = None
+        
+        # Cached fields may have changed on the server too (a delta refresh evicts only what it returns)
+        if self.db is not None:
+            self.db.cache.clear()
+        if view == "search":
+            self.search_fields(value)
+        elif view == "status":
+            self.filter_fields(value)
+        else:
+            self.load_fields(sort=self.list_sort)
+    
+    def on_fields_refreshed(self, base, synced_at, success, result):
+        """Merge changed and deleted fields into the list and the availability index"""
+        if self.list_synced_at != base:
+            return  # The list was loaded again meanwhile
+        
+        if not success:
+            if not self.show_snapshot(*self.list_view, result):
+                messagebox.showerror("Error", result)
+                self.status_bar.config(text="Error refreshing fields")
+            return
+        
+        updated, deleted = result
+        
+        # Fields beyond the loaded pages arrive with the page they belong to
+        complete = self.next_cursor is None
+        for field in updated:
+            if complete or str(field["_id"]) in self.fields_list_frame.field_ids:
+                self.patch_fields_list(field)
+            self.availability.on_field_write("update", field)
+        for field_id in deleted:
+            self.fields_list_frame.remove_field(field_id)
+            self.availability.on_field_write("delete", {"_id": field_id})
+        
+        self.list_synced_at = synced_at
+        self.status_bar.config(text=f"Refreshed: {len(updated)} changed and {len(deleted)} deleted fields merged")
+    
+    def reset_fields(self):
+        """Reset fields to show all"""
+        self.load_fields()
+        self.search_filter_frame.reset()
+    
+    def edit_field(self, field_id):
+        """Edit a field"""
+        if not self.database_ready():
+            return
+        
+        # A listed field is as current as the list, so it is cached instead of looked up again
+        field = self.fields_list_frame.get_field(field_id)
+        if field is not None:
+            self.db.seed_field(field)
+        
+        self.worker.submit(
+            "lookup",
+            self.db.get_field_by_id,
+            field_id,
+            callback=lambda success, field: self.on_edit_field_loaded(field_id, success, field)
+        )
+    
+    def on_edit_field_loaded(self, field_id, success, field):
+        """Show a field in the edit form"""
+        if success:
+            self.selected_field_id = field_id
+            self.add_edit_form.set_field_data(field)
+            self.notebook.select(self.add_edit_tab)
+            self.status_bar.config(text=f"Editing field: {field['name']}")
+        else:
+            messagebox.showerror("Error", field)
+            self.status_bar.config(text="Error loading field for editing")
+    
+    def save_field(self, field_data):
+        """Save a field (create or update)"""
+        if not self.database_ready():
+            return
+        
+        if self.selected_field_id:  # Update existing field
+            self.status_bar.config(text="Updating field...")
+            self.worker.submit(
+                None,
+                self.db.update_field,
+                self.selected_field_id,
+                field_data,
+                callback=self.on_field_updated
+            )
+        else:  # Create new field
+            self.status_bar.config(text="Creating field...")
+            self.worker.submit(None, self.db.create_field, field_data, callback=self.on_field_created)
+    
+    def on_field_updated(self, success, result):
+        """Handle the result of a field update"""
+        if success:
+            messagebox.showinfo("Success", "Field updated successfully")
+            self.selected_field_id = None
+            self.add_edit_form.clear()
+            self.notebook.select(self.fields_tab)
+            self.patch_fields_list(result)
+            self.status_bar.config(text="Field updated successfully")
+        else:
+            messagebox.showerror("Error", result)
+            self.status_bar.config(text="Error updating field")
+    
+    def on_field_created(self, success, result):
+        """Handle the result of a field creation"""
+        if success:
+            messagebox.showinfo("Success", "Field created successfully")
+            self.add_edit_form.clear()
+            self.notebook.select(self.fields_tab)
+            self.patch_fields_list(result)
+            self.status_bar.config(text="Field created successfully")
+        else:
+            messagebox.showerror("Error", result)
+            self.status_bar.config(text="Error creating field")
+    
+    def confirm_delete_field(self, field_id):
+        """Confirm field deletion"""
+        if not self.database_ready():
+            return
+        
+        # The listed document already has the name to confirm with
+        field = self.fields_list_frame.get_field(field_id)
+        if field is not None:
+            self.on_delete_field_loaded(field_id, True, field)
+            return
+        
+        self.worker.submit(
+            "lookup",
+            self.db.get_field_by_id,
+            field_id,
+            callback=lambda success, field: self.on_delete_field_loaded(field_id, success, field)
+        )
+    
+    def on_delete_field_loaded(self, field_id, success, field):
+        """Ask for confirmation before deleting a field"""
+        if success:
+            confirm = messagebox.askyesno(
+                "Confirm Delete",
+                f"Are you sure you want to delete the field '{field['name']}'?"
+            )
+            if confirm:
+                self.delete_field(field_id)
+        else:
+            messagebox.showerror("Error", field)
+    
+    def delete_field(self, field_id):
+        """Delete a field"""
+        self.status_bar.config(text="Deleting field...")
+        self.worker.submit(None, self.db.delete_field, field_id, callback=self.on_field_deleted)
+    
+    def on_field_deleted(self, success, result):
+        """Handle the result of a field deletion"""
+        if success:
+            messagebox.showinfo("Success", "Field deleted successfully")
+            self.fields_list_frame.remove_field(str(result["_id"]))
+            self.status_bar.config(text="Field deleted successfully")
+        else:
+            messagebox.showerror("Error", result)
+            self.status_bar.config(text="Error deleting field")
+    
+    def field_in_view(self, field):
+        """Check whether a field belongs in the current list view"""
+        from database import matches_search
+        
+        view, value = self.list_view
+        if view == "search":
+            return matches_search(field, value)
+        if view == "status":
+            return field.get("status") == value
+        return True
+    
+    def patch_fields_list(self, field):
+        """Update the row of a written field instead of reloading the list"""
+        # Local search results no longer reflect the server
+        self.search_base_results = None
+        
+        if self.field_in_view(field):
+            self.fields_list_frame.upsert_field(field)
+        else:
+            self.fields_list_frame.remove_field(str(field["_id"]))
+    
+    def set_busy(self, busy):
+        """Show or hide the busy indicator in the status bar"""
+        if busy:
+            self.busy_indicator.pack(side=tk.RIGHT, padx=5)
+            self.busy_indicator.start(10)
+        else:
+            self.busy_indicator.stop()
+            self.busy_indicator.pack_forget()
+    
+    def cancel_edit(self):
+        """Cancel field editing"""
+        self.selected_field_id = None
+        self.add_edit_form.clear()
+        self.notebook.select(self.fields_tab)
+        self.status_bar.config(text="Edit cancelled")
+    
+    def load_availability(self):
+        """Build the availability index from the fields and bookings in the background"""
+        self.worker.submit(
+            "availability",
+            self.availability.load,
+            self.db,
+            self.bookings,
+            callback=self.on_availability_loaded
+        )
+    
+    def on_availability_loaded(self, success, result):
+        """Enable availability searches once the index is built"""
+        if success:
+            self.availability_loaded = True
+        else:
+            self.status_bar.config(text=f"Error loading bookings: {result}")
+    
+    def find_available_fields(self, start, end, min_capacity, status, location):
+        """Show the fields free from start to end"""
+        if not self.database_ready():
+            return
+        
+        if not self.availability_loaded:
+            if not self.worker.is_busy("availability"):
+                self.load_availability()  # The last load failed, try again
+            self.status_bar.config(text="Availability is still loading, try again in a moment")
+            return
+        
+        fields = self.availability.available_fields(start, end, min_capacity, status, location)
+        self.availability_frame.show_results(fields)
+        self.status_bar.config(text=f"{len(fields)} fields free on {start:%Y-%m-%d} from {start:%H:%M} to {end:%H:%M}")
+    
+    def show_diagnostics(self):
+        """Open the diagnostics panel"""
+        DiagnosticsWindow(self.parent, metrics, self.db.cache if self.db is not None else None)
+    
+    def profile_next_operations(self):
+        """Profile the next PROFILE_MENU_OPS operations"""
+        if self.start_profiling(PROFILE_MENU_OPS):
+            self.status_bar.config(text=f"Profiling the next {PROFILE_MENU_OPS} operations...")
+    
+    def profile_next_seconds(self):
+        """Profile the operations of the next PROFILE_MENU_SECONDS seconds"""
+        if self.start_profiling(seconds=PROFILE_MENU_SECONDS):
+            self.status_bar.config(text=f"Profiling for {PROFILE_MENU_SECONDS} seconds...")
+    
+    def start_profiling(self, operations=0, seconds=0):
+        """Start a profiling session ending after operations handlers or seconds; returns whether it started"""
+        success, result = profiler.start(operations)
+        if not success:
+            messagebox.showinfo("Profiling", result)
+            return False
+        
+        if seconds:
+            self.profile_job = self.after(int(seconds * 1000), self.stop_profiling)
+        return True
+    
+    def stop_profiling(self):
+        """End the profiling session and write its reports"""
+        if self.profile_job:
+            self.after_cancel(self.profile_job)
+            self.profile_job = None
+        
+        if profiler.is_running():
+            self.on_profile_written(*profiler.stop())
+    
+    def on_profile_finished(self, success, result):
+        """Show the report of a session that ran out of operations, on the Tk thread"""
+        # The profiler calls this from whichever thread ran the last operation,
+        # which may be a worker thread where Tk must not be called
+        self.worker.post(self.on_profile_written, success, result)
+    
+    def on_profile_written(self, success, result):
+        """Show where the profile of a finished session was written"""
+        if self.profile_job:
+            self.after_cancel(self.profile_job)
+            self.profile_job = None
+        
+        if success:
+            self.status_bar.config(text=f"Profile written to {result[1]}")
+        else:
+            messagebox.showerror("Profiling Error", result)
+    
+    def refresh_metrics(self):
+        """Update the status bar summary and periodically rewrite the Prometheus file"""
+        self.metrics_label.config(text=metrics.group_summary())
+        if METRICS_FILE and time.monotonic() - self.metrics_dumped_at >= METRICS_DUMP_SECONDS:
+            self.metrics_dumped_at = time.monotonic()
+            metrics.write_prometheus(METRICS_FILE)
+        self.after(METRICS_REFRESH_MS, self.refresh_metrics)
+    
+    def on_close(self):
+        """Handle window close event"""
+        # Stop background requests
+        self.worker.shutdown()
+        
+        # Keep the final numbers for the scraper
+        if metrics.enabled and METRICS_FILE:
+            metrics.write_prometheus(METRICS_FILE)
+        
+        # Write what a running profiling session collected so far
+        if profiler.is_running():
+            profiler.stop()
+        
+        # Close database connection
+        if self.db:
+            self.db.close()
+        
+        # Destroy the window
+        self.parent.destroy()
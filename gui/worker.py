@@ -0,0 +1,144 @@
+"""
+Background database worker for the Football Field Management System
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config import DB_WORKER_THREADS, WORKER_POLL_MS
+
+logger = logging.getLogger(__name__)
+
+class DatabaseWorker:
+    """Run database calls on worker threads and deliver results on the Tk thread"""
+    
+    def __init__(self, widget, max_workers=DB_WORKER_THREADS, busy_callback=None):
+        """Initialize the worker"""
+        self.widget = widget
+        self.busy_callback = busy_callback
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        
+        # Finished requests, filled by worker threads and drained by poll()
+        self.results = queue.Queue()
+        
+        # Callbacks posted from any thread, run by poll() on the Tk thread
+        self.posted = queue.Queue()
+        self.thread = threading.get_ident()
+        
+        # Latest generation and future per request key
+        self.generations = {}
+        self.futures = {}
+        
+        self.pending = 0
+        self.polling = False
+        self.closed = False
+    
+    def submit(self, key, func, *args, callback=None, **kwargs):
+        """Run func in the background and pass its (success, result) to callback"""
+        # Requests sharing a key replace each other: the older one is cancelled
+        # if still queued and its result is dropped otherwise. None never replaces.
+        generation = None
+        if key is not None:
+            generation = self.generations.get(key, 0) + 1
+            self.generations[key] = generation
+            
+            # Cancel the superseded request if it is still queued
+            previous = self.futures.get(key)
+            if previous is not None:
+                previous.cancel()
+        
+        future = self.executor.submit(func, *args, **kwargs)
+        future.add_done_callback(lambda done: self.results.put((key, generation, callback, done)))
+        if key is not None:
+            self.futures[key] = future
+        
+        self.set_pending(self.pending + 1)
+        self.start_polling()
+        return future
+    
+    def post(self, callback, *args):
+        """Run callback(*args) on the Tk thread (callable from any thread)"""
+        self.posted.put((callback, args))
+        
+        # A worker thread posts from inside a request, which keeps the poll running
+        # until its result is delivered; Tk must not be touched from here
+        if threading.get_ident() == self.thread:
+            self.start_polling()
+    
+    def cancel(self, key):
+        """Drop the result of the in-flight request for a key"""
+        self.generations[key] = self.generations.get(key, 0) + 1
+        previous = self.futures.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+    
+    def is_busy(self, key):
+        """Check whether a request for a key is in flight"""
+        return key in self.futures
+    
+    def start_polling(self):
+        """Start polling for finished requests"""
+        if not self.polling and not self.closed:
+            self.polling = True
+            self.widget.after(WORKER_POLL_MS, self.poll)
+    
+    def poll(self):
+        """Deliver finished requests on the Tk thread"""
+        self.polling = False
+        if self.closed:
+            return
+        
+        while True:
+            try:
+                key, generation, callback, future = self.results.get_nowait()
+            except queue.Empty:
+                break
+            
+            self.set_pending(self.pending - 1)
+            
+            # Skip cancelled requests and results replaced by a newer request
+            if future.cancelled():
+                continue
+            if key is not None:
+                if generation != self.generations.get(key):
+                    continue
+                self.futures.pop(key, None)
+            
+            if callback:
+                try:
+                    success, result = future.result()
+                except Exception as e:
+                    success, result = False, f"Unexpected error: {str(e)}"
+                self.run_callback(callback, success, result)
+        
+        # After the results, so a callback posted during a delivered request is not missed
+        while True:
+            try:
+                callback, args = self.posted.get_nowait()
+            except queue.Empty:
+                break
+            self.run_callback(callback, *args)
+        
+        if self.pending > 0:
+            self.start_polling()
+    
+    def run_callback(self, callback, *args):
+        """Run a result callback; one that raises is logged so the results after it still arrive"""
+        try:
+            callback(*args)
+        except Exception:
+            logger.exception("Error in worker result callback %r", callback)
+    
+    def set_pending(self, pending):
+        """Update the number of requests in flight and notify busy changes"""
+        was_busy = self.pending > 0
+        self.pending = max(0, pending)
+        if self.busy_callback and was_busy != (self.pending > 0):
+            self.busy_callback(self.pending > 0)
+    
+    def shutdown(self):
+        """Stop delivering results and release the worker threads"""
+        self.closed = True
+        for future in self.futures.values():
+            future.cancel()
+        self.executor.shutdown(wait=False)
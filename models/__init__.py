@@ -1,3 +1,3 @@
-"""
-Models package for the Football Field Management System
-"""
\ No newline at end of file
+"""
+Models package for the Football Field Management System
+"""
@@ -0,0 +1,106 @@
+"""
+Booking data model for Football Field Management System
+"""
+from datetime import datetime
+from config import BOOKING_STATUS, MAX_BOOKING_HOURS
+
+def to_milliseconds(value):
+    """Truncate a datetime to the millisecond precision MongoDB stores"""
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+class Booking:
+    """Time-slot booking of a football field"""
+    
+    __slots__ = (
+        "_id",
+        "field_id",
+        "customer_name",
+        "start",
+        "end",
+        "status",
+        "created_at",
+        "updated_at"
+    )
+    
+    def __init__(self,
+                 field_id,
+                 customer_name,
+                 start,
+                 end,
+                 status="Confirmed",
+                 _id=None,
+                 created_at=None):
+        """Initialize a new booking of [start, end)"""
+        self._id = _id
+        self.field_id = field_id
+        self.customer_name = customer_name
+        self.start = start
+        self.end = end
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = None
+    
+    def to_dict(self, now=None):
+        """Convert the booking to a dictionary for MongoDB"""
+        if now is None:
+            now = datetime.now().isoformat()
+        
+        booking_dict = {
+            "field_id": str(self.field_id),
+            "customer_name": self.customer_name,
+            "start": self.start,
+            "end": self.end,
+            "status": self.status,
+            "updated_at": now
+        }
+        
+        # Include created_at only for new bookings
+        if self.created_at:
+            booking_dict["created_at"] = self.created_at
+        elif not self._id:
+            self.created_at = now
+            booking_dict["created_at"] = now
+        
+        return booking_dict
+    
+    @classmethod
+    def from_dict(cls, booking_dict):
+        """Create a Booking object from a dictionary from MongoDB"""
+        return cls(
+            _id=booking_dict.get("_id"),
+            field_id=booking_dict.get("field_id", ""),
+            customer_name=booking_dict.get("customer_name", ""),
+            start=booking_dict.get("start"),
+            end=booking_dict.get("end"),
+            status=booking_dict.get("status", "Confirmed"),
+            created_at=booking_dict.get("created_at")
+        )
+    
+    def validate(self):
+        """Validate the booking data"""
+        errors = []
+        
+        if not self.field_id:
+            errors.append("Field is required")
+        
+        if not self.customer_name:
+            errors.append("Customer name is required")
+        
+        if not isinstance(self.start, datetime) or not isinstance(self.end, datetime):
+            errors.append("Start and end must be date-times")
+        elif self.start.tzinfo is not None or self.end.tzinfo is not None:
+            # MongoDB returns naive datetimes, which cannot be compared with aware ones
+            errors.append("Start and end must be local date-times without a time zone")
+        else:
+            # Keep the times as they read back from MongoDB, so the conflict index matches them
+            self.start = to_milliseconds(self.start)
+            self.end = to_milliseconds(self.end)
+            if self.end <= self.start:
+                errors.append("End must be after start")
+            elif (self.end - self.start).total_seconds() > MAX_BOOKING_HOURS * 3600:
+                errors.append(f"A booking cannot be longer than {MAX_BOOKING_HOURS} hours")
+        
+        if self.status not in BOOKING_STATUS:
+            errors.append(f"Status must be one of: {', '.join(BOOKING_STATUS)}")
+        
+        return errors
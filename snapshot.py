@@ -0,0 +1,199 @@
+"""
+Local snapshot of the fields list for the Football Field Management System
+"""
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from config import SNAPSHOT_PATH, SEARCH_MODE, LIST_PROJECTION
+
+# Bump when the table layout changes; older snapshots are rebuilt
+SCHEMA_VERSION = 1
+
+# Stored columns: the fields list columns plus what search and sync need
+COLUMNS = ("_id", "name", "location", "capacity", "price_per_hour", "status", "updated_at")
+
+# Projection of the delta syncs that keep the snapshot current
+SYNC_PROJECTION = dict(LIST_PROJECTION, updated_at=1)
+
+def like_pattern(text, prefix_only):
+    """Build a LIKE pattern matching text literally, at the start or anywhere"""
+    text = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{text}%" if prefix_only else f"%{text}%"
+
+class SnapshotStore:
+    """SQLite copy of the fields list, read at startup and when the server is unavailable"""
+    
+    def __init__(self, path=SNAPSHOT_PATH):
+        """Initialize the store; the file is created on first write"""
+        self.path = path
+        
+        # Serializes writers; SQLite itself allows readers alongside
+        self.lock = threading.Lock()
+        
+        # When the snapshot was last filled from the server (ISO time), once known
+        self.synced_at = None
+    
+    def connect(self):
+        """Open a connection (one per call, so any thread can use the store)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        connection = sqlite3.connect(self.path, timeout=10)
+        if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.create_schema(connection)
+        return connection
+    
+    def create_schema(self, connection):
+        """Create the tables, dropping a snapshot of an older layout"""
+        with connection:
+            connection.execute("DROP TABLE IF EXISTS fields")
+            connection.execute("DROP TABLE IF EXISTS meta")
+            connection.execute(
+                "CREATE TABLE fields ("
+                "id TEXT PRIMARY KEY, name TEXT, location TEXT, capacity INTEGER, price_per_hour REAL, "
+                "status TEXT, updated_at TEXT, name_lower TEXT, location_lower TEXT)"
+            )
+            connection.execute("CREATE INDEX fields_status ON fields (status)")
+            connection.execute("CREATE INDEX fields_name_lower ON fields (name_lower)")
+            connection.execute("CREATE INDEX fields_location_lower ON fields (location_lower)")
+            connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    def query(self, where="", parameters=()):
+        """Get the stored fields matching a WHERE clause, in the order they were stored"""
+        try:
+            connection = self.connect()
+            try:
+                rows = connection.execute(
+                    f"SELECT id, name, location, capacity, price_per_hour, status, updated_at "
+                    f"FROM fields {where} ORDER BY rowid",
+                    parameters
+                ).fetchall()
+                synced = connection.execute("SELECT value FROM meta WHERE key = 'synced_at'").fetchone()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            return False, f"Error reading the local snapshot: {str(e)}"
+        
+        self.synced_at = synced[0] if synced else None
+        return True, [dict(zip(COLUMNS, row)) for row in rows]
+    
+    def load_fields(self):
+        """Get every stored field"""
+        return self.query()
+    
+    def search_fields(self, query, mode=SEARCH_MODE):
+        """Search the stored fields by name and location, like Database.search_fields"""
+        if mode == "text":
+            # Any word of the query as a whole word of name or location
+            from database import matches_search
+            words = query.lower().split()
+            clauses = " OR ".join(["name_lower LIKE ? ESCAPE '\\' OR location_lower LIKE ? ESCAPE '\\'"] * len(words))
+            parameters = [like_pattern(word, False) for word in words for _ in range(2)]
+            success, fields = self.query(f"WHERE {clauses}", parameters) if words else (True, [])
+            if not success:
+                return False, fields
+            return True, [field for field in fields if matches_search(field, query, mode)]
+        
+        pattern = like_pattern(query.lower(), prefix_only=mode == "prefix")
+        return self.query(
+            "WHERE name_lower LIKE ? ESCAPE '\\' OR location_lower LIKE ? ESCAPE '\\'",
+            (pattern, pattern)
+        )
+    
+    def filter_fields_by_status(self, status):
+        """Get the stored fields with a status"""
+        return self.query("WHERE status = ?", (status,))
+    
+    def rows(self, fields):
+        """Convert field documents into table rows"""
+        for field in fields:
+            yield (
+                str(field["_id"]),
+                field.get("name"),
+                field.get("location"),
+                field.get("capacity"),
+                field.get("price_per_hour"),
+                field.get("status"),
+                field.get("updated_at"),
+                str(field.get("name", "")).lower(),
+                str(field.get("location", "")).lower()
+            )
+    
+    def write(self, statements):
+        """Run (sql, parameters or rows) statements in one transaction"""
+        try:
+            with self.lock:
+                connection = self.connect()
+                try:
+                    with connection:
+                        for sql, parameters in statements:
+                            if isinstance(parameters, tuple):
+                                connection.execute(sql, parameters)
+                            else:
+                                connection.executemany(sql, parameters)
+                finally:
+                    connection.close()
+        except (sqlite3.Error, OSError) as e:
+            return False, f"Error writing the local snapshot: {str(e)}"
+        return True, None
+    
+    def read_synced_at(self):
+        """Get when the snapshot was last filled from the server (ISO time), None if never"""
+        try:
+            connection = self.connect()
+            try:
+                synced = connection.execute("SELECT value FROM meta WHERE key = 'synced_at'").fetchone()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError):
+            return None
+        
+        self.synced_at = synced[0] if synced else None
+        return self.synced_at
+    
+    def replace_all(self, fields, synced_at=None):
+        """Replace the stored fields with a full copy from the server, read at synced_at (default now)"""
+        synced_at = synced_at or datetime.now().isoformat()
+        success, result = self.write([
+            ("DELETE FROM fields", ()),
+            ("INSERT OR REPLACE INTO fields VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.rows(fields)),
+            ("INSERT OR REPLACE INTO meta VALUES ('synced_at', ?)", (synced_at,))
+        ])
+        if not success:
+            return False, result
+        
+        self.synced_at = synced_at
+        return True, len(fields)
+    
+    def apply_changes(self, updated, deleted, synced_at):
+        """Merge a delta sync read at synced_at: upsert the updated fields and remove the deleted IDs"""
+        success, result = self.write([
+            ("INSERT OR REPLACE INTO fields VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.rows(updated)),
+            ("DELETE FROM fields WHERE id = ?", [(str(field_id),) for field_id in deleted]),
+            ("INSERT OR REPLACE INTO meta VALUES ('synced_at', ?)", (synced_at,))
+        ])
+        if not success:
+            return False, result
+        
+        self.synced_at = synced_at
+        return True, (len(updated), len(deleted))
+    
+    def upsert_fields(self, fields):
+        """Add or replace stored fields"""
+        return self.write([("INSERT OR REPLACE INTO fields VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.rows(fields))])
+    
+    def remove_fields(self, field_ids):
+        """Remove stored fields"""
+        return self.write([("DELETE FROM fields WHERE id = ?", [(str(field_id),) for field_id in field_ids])])
+    
+    def on_field_write(self, action, field):
+        """Database write listener keeping the snapshot current"""
+        if field is None:
+            return  # Bulk writes are picked up by the next sync
+        if action == "delete":
+            self.remove_fields([field["_id"]])
+        else:
+            self.upsert_fields([field])
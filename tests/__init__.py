@@ -0,0 +1,3 @@
+"""
+Tests for the Football Field Management System
+"""
@@ -0,0 +1,210 @@
+"""
+AsyncDatabase tests against the in-process stand-in collection (no server needed)
+"""
+import asyncio
+import time
+import pytest
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+from async_database import AsyncDatabase
+from benchmarks.standin import StandInCollection, StandInCursor, standin_database
+
+FIELD_COUNT = 250
+
+def make_fields(count):
+    """Build fields with fixed IDs and timestamps, so two databases can hold the same ones"""
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"Field {index}",
+            "location": f"Location {index % 7}",
+            "capacity": 10 + index % 13,
+            "price_per_hour": 20.0 + index % 40,
+            "status": ("Available", "Booked", "Under Maintenance")[index % 3],
+            "description": "",
+            "updated_at": "2024-01-01T00:00:00"
+        }
+        for index in range(count)
+    ]
+
+class NoTextIndexCursor(StandInCursor):
+    """Stand-in cursor failing text searches when read, like a server without the text index"""
+    
+    def execute(self):
+        """Run the query"""
+        if "$text" in self.query:
+            raise OperationFailure("text index required for $text query", code=27)
+        return super().execute()
+
+class NoTextIndexCollection(StandInCollection):
+    """Stand-in collection without a text index"""
+    
+    def find(self, query=None, projection=None):
+        """Query documents"""
+        return NoTextIndexCursor(self, query, projection)
+
+def seeded_database(fields, latency=0.0, collection_class=StandInCollection):
+    """Build a stand-in Database holding copies of fields"""
+    database = standin_database(collection_class(latency=latency))
+    success, result = database.bulk_create_fields([dict(field) for field in fields])
+    assert success, result
+    return database
+
+def run(coroutine):
+    """Run a coroutine to completion"""
+    return asyncio.run(coroutine)
+
+@pytest.fixture
+def fields():
+    """The fields both databases start with"""
+    return make_fields(FIELD_COUNT)
+
+@pytest.fixture
+def databases(fields):
+    """A blocking Database and an AsyncDatabase over separate copies of the same fields"""
+    return seeded_database(fields), AsyncDatabase(seeded_database(fields))
+
+def test_reads_match_database(databases, fields):
+    """Lookups, pages, searches and filters return what Database returns"""
+    db, async_db = databases
+    field_id = str(fields[42]["_id"])
+    
+    async def reads():
+        return [
+            await async_db.get_all_fields(),
+            await async_db.get_field_by_id(field_id),
+            await async_db.get_field_by_id(str(ObjectId())),
+            await async_db.get_fields_page(page_size=20),
+            await async_db.get_fields_page(page_size=20, sort_field="capacity", descending=True),
+            await async_db.search_fields("field 1", "prefix"),
+            await async_db.search_fields("location 3", "regex"),
+            await async_db.filter_fields_by_status("Booked")
+        ]
+    
+    expected = [
+        db.get_all_fields(),
+        db.get_field_by_id(field_id),
+        db.get_field_by_id(str(ObjectId())),
+        db.get_fields_page(page_size=20),
+        db.get_fields_page(page_size=20, sort_field="capacity", descending=True),
+        db.search_fields("field 1", "prefix"),
+        db.search_fields("location 3", "regex"),
+        db.filter_fields_by_status("Booked")
+    ]
+    assert run(reads()) == expected
+
+def test_writes_match_database(databases, fields):
+    """Creates, updates and deletes return and store what Database does"""
+    db, async_db = databases
+    created = {"_id": ObjectId(), "name": "New Field", "location": "Rabat", "capacity": 10,
+               "price_per_hour": 30.0, "status": "Available", "updated_at": "2024-01-02T00:00:00"}
+    bulk = make_fields(5)
+    update = {"status": "Booked", "updated_at": "2024-01-03T00:00:00"}
+    updated_id = str(fields[1]["_id"])
+    deleted_id = str(fields[2]["_id"])
+    
+    async def writes():
+        results = [
+            await async_db.create_field(dict(created)),
+            await async_db.bulk_create_fields([dict(field) for field in bulk]),
+            await async_db.update_field(updated_id, dict(update)),
+            await async_db.delete_field(deleted_id),
+            await async_db.delete_field(deleted_id)
+        ]
+        return results, await async_db.get_all_fields()
+    
+    expected = [
+        db.create_field(dict(created)),
+        db.bulk_create_fields([dict(field) for field in bulk]),
+        db.update_field(updated_id, dict(update)),
+        db.delete_field(deleted_id),
+        db.delete_field(deleted_id)
+    ]
+    results, stored = run(writes())
+    assert results == expected
+    assert stored == db.get_all_fields()
+
+def test_iter_fields_streams_everything(databases, fields):
+    """iter_fields yields every field once, across many batches"""
+    _, async_db = databases
+    
+    async def collect():
+        return [field async for field in async_db.iter_fields(batch_size=16)]
+    
+    streamed = run(collect())
+    assert len(streamed) == FIELD_COUNT
+    assert {field["_id"] for field in streamed} == {field["_id"] for field in fields}
+
+def test_iter_pages_streams_everything(databases, fields):
+    """iter_pages yields every field once, in sort order, in full pages but the last"""
+    _, async_db = databases
+    
+    async def collect():
+        return [page async for page in async_db.iter_pages(page_size=40, sort_field="price_per_hour")]
+    
+    pages = run(collect())
+    streamed = [field for page in pages for field in page]
+    assert [len(page) for page in pages[:-1]] == [40] * (len(pages) - 1)
+    assert len(streamed) == FIELD_COUNT
+    assert {field["_id"] for field in streamed} == {field["_id"] for field in fields}
+    assert [field["price_per_hour"] for field in streamed] == sorted(field["price_per_hour"] for field in fields)
+
+def test_iter_search_streams_every_match(databases):
+    """iter_search yields the same fields as search_fields"""
+    db, async_db = databases
+    
+    async def collect():
+        return [field async for field in async_db.iter_search("field 1", "prefix", batch_size=8)]
+    
+    success, expected = db.search_fields("field 1", "prefix")
+    assert success, expected
+    streamed = run(collect())
+    assert len(streamed) > 8
+    assert sorted(field["_id"] for field in streamed) == sorted(field["_id"] for field in expected)
+
+def test_iter_search_falls_back_without_text_index(fields):
+    """Like search_fields, iter_search falls back to a regex search when the text index is missing"""
+    db = seeded_database(fields, collection_class=NoTextIndexCollection)
+    
+    async def collect():
+        return [field async for field in AsyncDatabase(db).iter_search("field 1", "text", batch_size=8)]
+    
+    success, expected = db.search_fields("field 1", "text")
+    assert success, expected
+    streamed = run(collect())
+    assert expected
+    assert sorted(field["_id"] for field in streamed) == sorted(field["_id"] for field in expected)
+
+def test_close_leaves_shared_client_open(databases, fields, monkeypatch):
+    """Closing an AsyncDatabase releases its threads but not the connection other Databases use"""
+    db, async_db = databases
+    closed = []
+    monkeypatch.setattr(async_db.database, "close", lambda: closed.append(True))
+    
+    async def close():
+        await async_db.close()
+    
+    run(close())
+    assert closed == []
+    assert async_db.database.get_field_by_id(str(fields[0]["_id"])) == db.get_field_by_id(str(fields[0]["_id"]))
+
+def test_gathered_lookups_beat_sequential_lookups(fields):
+    """With a round trip latency, concurrent lookups finish several times faster"""
+    db = seeded_database(fields, latency=0.01)
+    field_ids = [str(field["_id"]) for field in fields[:40]]
+    
+    started = time.perf_counter()
+    sequential = [db.get_field_by_id(field_id) for field_id in field_ids]
+    sequential_seconds = time.perf_counter() - started
+    
+    async def gather():
+        async_db = AsyncDatabase(db)
+        return await asyncio.gather(*(async_db.get_field_by_id(field_id) for field_id in field_ids))
+    
+    started = time.perf_counter()
+    gathered = run(gather())
+    gathered_seconds = time.perf_counter() - started
+    
+    assert list(gathered) == sequential
+    assert all(success for success, _ in gathered)
+    assert gathered_seconds * 3 < sequential_seconds, (gathered_seconds, sequential_seconds)
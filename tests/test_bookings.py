@@ -0,0 +1,72 @@
+"""
+BookingManager tests against the in-process stand-in collection (no server needed)
+"""
+from datetime import datetime, timedelta, timezone
+import pytest
+from benchmarks.standin import StandInCollection, standin_database
+from bookings import BookingManager
+
+START = datetime(2024, 6, 1, 18, 0, 0, 123456)
+
+@pytest.fixture
+def db():
+    """A stand-in Database with no bookings"""
+    return standin_database(StandInCollection())
+
+def confirmed(db):
+    """The confirmed booking documents in the collection"""
+    success, cursor = db.get_bookings_cursor({"status": "Confirmed"})
+    assert success, cursor
+    return list(cursor)
+
+def test_times_are_stored_with_millisecond_precision(db):
+    """The conflict index holds the times as MongoDB returns them, so cancelling frees the slot"""
+    manager = BookingManager(db)
+    success, booking = manager.create_booking("field", "Team A", START, START + timedelta(hours=1))
+    assert success, booking
+    assert booking["start"] == START.replace(microsecond=123000)
+    
+    # Cancel with the document as read back, the way the GUI does
+    success, result = manager.cancel_booking(str(booking["_id"]))
+    assert success, result
+    assert manager.is_available("field", START, START + timedelta(hours=1))
+    assert manager.all_bookings() == []
+
+def test_time_zone_aware_times_are_rejected(db):
+    """Aware datetimes would come back naive from MongoDB and fail to compare in the index"""
+    manager = BookingManager(db)
+    start = datetime(2024, 6, 1, 18, tzinfo=timezone.utc)
+    success, result = manager.create_booking("field", "Team A", start, start + timedelta(hours=1))
+    assert not success
+    assert "time zone" in result
+    assert confirmed(db) == []
+
+def test_touching_bookings_are_allowed(db):
+    """A booking may start when the previous one ends"""
+    manager = BookingManager(db)
+    assert manager.create_booking("field", "Team A", START, START + timedelta(hours=1))[0]
+    assert manager.create_booking("field", "Team B", START + timedelta(hours=1), START + timedelta(hours=2))[0]
+    assert not manager.create_booking("field", "Team C", START + timedelta(minutes=30), START + timedelta(hours=1))[0]
+
+def test_other_process_booking_is_refused_on_insert(db):
+    """A manager that has not loaded another process's booking is still refused on the server side"""
+    first, second = BookingManager(db), BookingManager(db)
+    assert first.create_booking("field", "Team A", START, START + timedelta(hours=2))[0]
+    
+    # The second manager's index is empty, so only the check after the insert catches this
+    assert second.is_available("field", START + timedelta(hours=1), START + timedelta(hours=3))
+    success, result = second.create_booking("field", "Team B", START + timedelta(hours=1), START + timedelta(hours=3))
+    assert not success
+    assert "already booked" in result
+    assert [booking["customer_name"] for booking in confirmed(db)] == ["Team A"]
+    assert second.all_bookings() == []
+
+def test_insert_yields_to_stored_overlap(db):
+    """A booking that finds an overlapping one stored meanwhile removes itself"""
+    end = START + timedelta(hours=1)
+    db.bookings.insert_one({"field_id": "field", "customer_name": "Racer", "start": START, "end": end,
+                            "status": "Confirmed"})
+    success, result = db.create_booking({"field_id": "field", "customer_name": "Team A", "start": START,
+                                         "end": end, "status": "Confirmed"})
+    assert not success
+    assert [booking["customer_name"] for booking in confirmed(db)] == ["Racer"]
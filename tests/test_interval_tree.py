@@ -0,0 +1,99 @@
+"""
+IntervalTree tests: balance, max end and half-open overlaps against a brute-force list
+"""
+import random
+from utils.interval_tree import IntervalTree, height
+
+def check_invariants(node):
+    """Check the AVL balance, heights and max ends of a subtree; return its height"""
+    if node is None:
+        return 0
+    left = check_invariants(node.left)
+    right = check_invariants(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    assert node.max_end == max(
+        [node.end] + [child.max_end for child in (node.left, node.right) if child]
+    )
+    return node.height
+
+def brute_overlaps(intervals, start, end):
+    """Overlaps of [start, end) found by checking every interval, in (start, key) order like the tree"""
+    return sorted(
+        (
+            (interval_start, interval_end, key)
+            for interval_start, interval_end, key in intervals
+            if interval_start < end and start < interval_end
+        ),
+        key=lambda interval: (interval[0], interval[2])
+    )
+
+def test_sorted_inserts_stay_balanced():
+    """Inserting in start order, the worst case for an unbalanced tree, keeps the height logarithmic"""
+    tree = IntervalTree()
+    for index in range(1024):
+        tree.insert(index, index + 1, str(index), index)
+    
+    assert len(tree) == 1024
+    assert check_invariants(tree.root) <= 11
+    assert [value for _, _, value in tree] == list(range(1024))
+
+def test_touching_intervals_do_not_overlap():
+    """[10, 12) and [12, 14) share only an end point, which half-open intervals exclude"""
+    tree = IntervalTree()
+    tree.insert(10, 12, "a", "a")
+    
+    assert tree.find_overlap(12, 14) is None
+    assert tree.find_overlap(8, 10) is None
+    assert tree.find_overlapping(12, 14) == []
+    assert tree.find_overlap(11, 13) == (10, 12, "a")
+    assert tree.find_overlap(9, 11) == (10, 12, "a")
+    
+    tree.insert(12, 14, "b", "b")
+    assert [value for _, _, value in tree.find_overlapping(11, 13)] == ["a", "b"]
+
+def test_same_start_told_apart_by_key():
+    """Intervals with the same start are removed by key"""
+    tree = IntervalTree()
+    tree.insert(5, 6, "a", "a")
+    tree.insert(5, 9, "b", "b")
+    
+    assert tree.remove(5, "a")
+    assert not tree.remove(5, "a")
+    assert not tree.remove(6, "b")
+    assert list(tree) == [(5, 9, "b")]
+
+def test_random_inserts_and_removals_match_brute_force():
+    """Mixed inserts and removals keep the tree balanced and its overlap queries exact"""
+    rng = random.Random(3)
+    tree = IntervalTree()
+    intervals = []
+    
+    for step in range(2000):
+        if intervals and rng.random() < 0.4:
+            start, end, key = intervals.pop(rng.randrange(len(intervals)))
+            assert tree.remove(start, key)
+        else:
+            start = rng.randrange(1000)
+            end = start + rng.randrange(1, 30)
+            key = str(step)
+            tree.insert(start, end, key, key)
+            intervals.append((start, end, key))
+        
+        if step % 50 == 0:
+            assert len(tree) == len(intervals)
+            check_invariants(tree.root)
+            assert height(tree.root) <= 2 * max(1, len(intervals)).bit_length()
+        
+        start = rng.randrange(1000)
+        end = start + rng.randrange(1, 30)
+        expected = brute_overlaps(intervals, start, end)
+        assert [(s, e, value) for s, e, value in tree.find_overlapping(start, end)] == expected
+        found = tree.find_overlap(start, end)
+        assert (found is None) == (not expected)
+        if found:
+            assert found in expected
+    
+    for start, end, key in intervals:
+        assert tree.remove(start, key)
+    assert len(tree) == 0 and tree.root is None
@@ -0,0 +1,70 @@
+"""
+Query plan tests: search and status filtering must be served by indexes
+
+They need a MongoDB server at MONGO_URI and are skipped without one. The indexes
+and a few fields are created in a throwaway database, dropped afterwards.
+"""
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from config import MONGO_URI
+from database import Database
+
+TEST_DB_NAME = "football_field_management_test_plans"
+
+FIELDS = [
+    {"name": "Casa Arena", "location": "Casablanca Maarif", "capacity": 22, "price_per_hour": 80.0, "status": "Available"},
+    {"name": "Rabat Five", "location": "Rabat Agdal", "capacity": 10, "price_per_hour": 40.0, "status": "Booked"},
+    {"name": "Atlas Park", "location": "Marrakech Gueliz", "capacity": 14, "price_per_hour": 55.0,
+     "status": "Under Maintenance"}
+]
+
+@pytest.fixture(scope="module")
+def db():
+    """A connected Database whose collections live in the throwaway database"""
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        pytest.skip(f"No MongoDB server at {MONGO_URI}")
+    finally:
+        client.close()
+    
+    database = Database()
+    success, message = database.connect()
+    assert success, message
+    
+    database.db = database.client[TEST_DB_NAME]
+    database.collection = database.db["fields"]
+    database.bookings = database.db["bookings"]
+    database.tombstones = database.db["field_tombstones"]
+    success, message = database.ensure_indexes()
+    assert success, message
+    
+    success, result = database.bulk_create_fields([dict(field) for field in FIELDS])
+    assert success, result
+    
+    yield database
+    
+    database.client.drop_database(TEST_DB_NAME)
+    database.close()
+
+@pytest.mark.parametrize("mode", ["prefix", "text"])
+def test_search_does_not_scan_the_collection(db, mode):
+    """Prefix and text searches use the search key and text indexes"""
+    success, stages = db.explain_search("casa", mode)
+    assert success, stages
+    assert "COLLSCAN" not in stages, stages
+
+def test_regex_search_scans_the_collection(db):
+    """The unanchored fallback is a scan, so the check above can fail"""
+    success, stages = db.explain_search("casa", "regex")
+    assert success, stages
+    assert "COLLSCAN" in stages, stages
+
+def test_status_filter_does_not_scan_the_collection(db):
+    """Filtering by status uses the status index"""
+    success, stages = db.explain_filter("Available")
+    assert success, stages
+    assert "COLLSCAN" not in stages, stages
+    assert "IXSCAN" in stages, stages
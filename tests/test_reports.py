@@ -0,0 +1,78 @@
+"""
+Report tests: the price percentiles agree with and without $percentile
+
+The percentile rank test needs no server. The comparison of the two paths needs a
+MongoDB 7.0+ server at MONGO_URI and is skipped without one; it uses a throwaway
+database, dropped afterwards.
+"""
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from config import MONGO_URI, REPORT_PERCENTILES
+from database import Database
+from utils.reports import percentile_rank, price_percentiles_pipeline, price_range_pipeline, read_price_ranks
+
+TEST_DB_NAME = "football_field_management_test_reports"
+
+# Prices with duplicates, plus fields without a usable price, which neither path ranks
+FIELDS = [
+    {"name": f"Field {index}", "location": "Rabat", "capacity": 10, "price_per_hour": (index * 7919 % 97) * 2.5,
+     "status": "Available"}
+    for index in range(203)
+] + [
+    {"name": "No Price", "location": "Rabat", "capacity": 10, "status": "Available"},
+    {"name": "Text Price", "location": "Rabat", "capacity": 10, "price_per_hour": "50", "status": "Available"}
+]
+
+def test_percentile_rank_is_nearest_rank():
+    """The ranks reproduce the $percentile example in the MongoDB documentation"""
+    scores = [60, 60, 69, 84, 90, 96]
+    assert [scores[percentile_rank(len(scores), p)] for p in (0.5, 0.95)] == [69, 96]
+    assert percentile_rank(len(scores), 0) == 0
+    assert percentile_rank(len(scores), 1) == len(scores) - 1
+    assert percentile_rank(1, 0.99) == 0
+
+@pytest.fixture(scope="module")
+def db():
+    """A connected Database whose fields live in the throwaway database"""
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=1000)
+    try:
+        version = client.server_info()["versionArray"]
+    except PyMongoError:
+        pytest.skip(f"No MongoDB server at {MONGO_URI}")
+    finally:
+        client.close()
+    if version < [7]:
+        pytest.skip("$percentile needs MongoDB 7.0")
+    
+    database = Database()
+    success, message = database.connect()
+    assert success, message
+    
+    database.db = database.client[TEST_DB_NAME]
+    database.collection = database.db["fields"]
+    success, result = database.bulk_create_fields([dict(field) for field in FIELDS])
+    assert success, result
+    
+    yield database
+    
+    database.client.drop_database(TEST_DB_NAME)
+    database.close()
+
+def test_percentile_paths_agree(db):
+    """$percentile and the rank fallback report the same count, range and percentiles"""
+    success, result = db.aggregate_fields(price_percentiles_pipeline())
+    assert success, result
+    primary = result[0]
+    
+    success, result = db.aggregate_fields(price_range_pipeline())
+    assert success, result
+    fallback = result[0]
+    success, fallback["percentiles"] = read_price_ranks(db, fallback["count"])
+    assert success, fallback["percentiles"]
+    
+    prices = sorted(field["price_per_hour"] for field in FIELDS if isinstance(field.get("price_per_hour"), float))
+    assert primary["count"] == fallback["count"] == len(prices)
+    assert (primary["min"], primary["max"]) == (fallback["min"], fallback["max"]) == (prices[0], prices[-1])
+    assert primary["percentiles"] == fallback["percentiles"]
+    assert fallback["percentiles"] == [prices[percentile_rank(len(prices), p)] for p in REPORT_PERCENTILES]
@@ -1,3 +1,3 @@
-"""
-Utilities package for the Football Field Management System
-"""
\ No newline at end of file
+"""
+Utilities package for the Football Field Management System
+"""
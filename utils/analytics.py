@@ -0,0 +1,164 @@
+"""
+NumPy analytics for the Football Field Management System
+"""
+from array import array
+from config import ANALYTICS_BATCH_SIZE
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, only needed for analytics
+    np = None
+
+# Only the columns the snapshot keeps are fetched
+ANALYTICS_PROJECTION = {"_id": 0, "capacity": 1, "price_per_hour": 1, "status": 1, "location": 1}
+
+# Numeric columns of a snapshot
+VALUE_COLUMNS = ("capacity", "price_per_hour")
+
+class FieldSnapshot:
+    """Columnar snapshot of football fields held in NumPy arrays"""
+    
+    def __init__(self, capacity, price_per_hour, status_codes, status_labels, location_codes, location_labels):
+        """Initialize the snapshot from its columns"""
+        self.capacity = capacity
+        self.price_per_hour = price_per_hour
+        self.status_codes = status_codes
+        self.status_labels = status_labels
+        self.location_codes = location_codes
+        self.location_labels = location_labels
+    
+    @classmethod
+    def from_documents(cls, documents):
+        """Build a snapshot from an iterable of field documents (e.g. a cursor)"""
+        if np is None:
+            raise ImportError("NumPy is required for analytics: pip install numpy")
+        
+        # Typed arrays keep the load compact; no per-field Python objects are kept
+        capacity = array("d")
+        price_per_hour = array("d")
+        status_codes = array("q")
+        location_codes = array("q")
+        statuses = {}
+        locations = {}
+        
+        for document in documents:
+            capacity.append(document.get("capacity") or 0)
+            price_per_hour.append(document.get("price_per_hour") or 0)
+            status_codes.append(statuses.setdefault(document.get("status", "Unknown"), len(statuses)))
+            location_codes.append(locations.setdefault(document.get("location", ""), len(locations)))
+        
+        return cls(
+            np.frombuffer(capacity, dtype=np.float64),
+            np.frombuffer(price_per_hour, dtype=np.float64),
+            np.frombuffer(status_codes, dtype=np.int64),
+            list(statuses),
+            np.frombuffer(location_codes, dtype=np.int64),
+            list(locations)
+        )
+    
+    def __len__(self):
+        """Number of fields in the snapshot"""
+        return len(self.capacity)
+    
+    def column(self, name):
+        """Get a numeric column"""
+        if name not in VALUE_COLUMNS:
+            raise ValueError(f"Unknown column: {name}")
+        return getattr(self, name)
+    
+    def codes(self, name):
+        """Get the codes and labels of a categorical column"""
+        if name == "status":
+            return self.status_codes, self.status_labels
+        if name == "location":
+            return self.location_codes, self.location_labels
+        raise ValueError(f"Unknown group column: {name}")
+    
+    def mask(self, status=None, location=None):
+        """Boolean mask of the fields matching a status and/or location"""
+        selected = np.ones(len(self), dtype=bool)
+        for name, value in (("status", status), ("location", location)):
+            if value is not None:
+                codes, labels = self.codes(name)
+                selected &= codes == (labels.index(value) if value in labels else -1)
+        return selected
+    
+    def group_by(self, key="status", value="price_per_hour", agg="mean"):
+        """Aggregate a numeric column per status or location"""
+        codes, labels = self.codes(key)
+        values = self.column(value)
+        groups = len(labels)
+        
+        counts = np.bincount(codes, minlength=groups)
+        if agg == "count":
+            result = counts
+        elif agg == "sum":
+            result = np.bincount(codes, weights=values, minlength=groups)
+        elif agg == "mean":
+            sums = np.bincount(codes, weights=values, minlength=groups)
+            result = np.divide(sums, counts, out=np.zeros(groups), where=counts > 0)
+        elif agg == "min":
+            result = np.full(groups, np.inf)
+            np.minimum.at(result, codes, values)
+        elif agg == "max":
+            result = np.full(groups, -np.inf)
+            np.maximum.at(result, codes, values)
+        else:
+            raise ValueError(f"Unknown aggregation: {agg}")
+        
+        return dict(zip(labels, result.tolist()))
+    
+    def percentiles(self, value="price_per_hour", q=(25, 50, 75, 90, 99), by=None):
+        """Percentiles of a numeric column, overall or per status/location"""
+        values = self.column(value)
+        if by is None:
+            if not len(values):
+                return {}
+            return dict(zip(q, np.percentile(values, q).tolist()))
+        
+        # Sort once by group, then split into contiguous slices
+        codes, labels = self.codes(by)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(labels)))[:-1]
+        result = {}
+        for label, group in zip(labels, np.split(values[order], bounds)):
+            if len(group):
+                result[label] = dict(zip(q, np.percentile(group, q).tolist()))
+        return result
+    
+    def histogram(self, value="capacity", bins=10):
+        """Histogram of a numeric column as (counts, bin edges)"""
+        counts, edges = np.histogram(self.column(value), bins=bins)
+        return counts.tolist(), edges.tolist()
+    
+    def what_if_pricing(self, change=0.10, status=None, location=None, utilization=1.0, elasticity=0.0):
+        """Project hourly revenue after changing prices by a fraction (0.10 = +10%)"""
+        # Selected fields are booked for `utilization` of their hours; `elasticity`
+        # lowers that share as prices rise and raises it as they fall
+        selected = self.mask(status, location)
+        prices = self.price_per_hour[selected]
+        
+        new_prices = prices * (1.0 + change)
+        new_utilization = np.clip(utilization * (1.0 - elasticity * change), 0.0, 1.0)
+        
+        current = float(prices.sum() * utilization)
+        projected = float(new_prices.sum() * new_utilization)
+        return {
+            "fields": int(selected.sum()),
+            "average_price_before": float(prices.mean()) if len(prices) else 0.0,
+            "average_price_after": float(new_prices.mean()) if len(prices) else 0.0,
+            "revenue_per_hour_before": current,
+            "revenue_per_hour_after": projected,
+            "revenue_change": projected - current
+        }
+
+def load_snapshot(db, query=None):
+    """Load a columnar snapshot of the fields collection"""
+    success, cursor = db.get_fields_cursor(query, ANALYTICS_PROJECTION, batch_size=ANALYTICS_BATCH_SIZE)
+    if not success:
+        return False, cursor
+    
+    try:
+        return True, FieldSnapshot.from_documents(cursor)
+    except Exception as e:
+        return False, f"Error loading snapshot: {str(e)}"
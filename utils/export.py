@@ -1,82 +1,138 @@
-"""
-Export utilities for the Football Field Management System
-"""
-import csv
-import os
-import tkinter as tk
-from tkinter import filedialog, messagebox
-
-def export_to_csv(fields, default_filename="football_fields.csv"):
-    """Export fields data to CSV file"""
-    if not fields:
-        messagebox.showerror("Export Error", "No data to export")
-        return False
-    
-    # Ask for file location
-    file_path = filedialog.asksaveasfilename(
-        defaultextension=".csv",
-        filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-        initialfile=default_filename
-    )
-    
-    if not file_path:  # User cancelled
-        return False
-    
-    try:
-        with open(file_path, 'w', newline='') as csvfile:
-            # Get field keys from first record (assuming all records have same structure)
-            fieldnames = list(fields[0].keys())
-            
-            # Remove MongoDB ObjectId from fieldnames
-            if '_id' in fieldnames:
-                fieldnames.remove('_id')
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for field in fields:
-                # Create a new dict without _id
-                field_data = {k: v for k, v in field.items() if k != '_id'}
-                writer.writerow(field_data)
-        
-        messagebox.showinfo("Export Successful", f"Data exported to {os.path.basename(file_path)}")
-        return True
-    except Exception as e:
-        messagebox.showerror("Export Error", f"An error occurred: {str(e)}")
-        return False
-
-def generate_report(fields, report_type="summary"):
-    """Generate a report about the fields"""
-    if not fields:
-        return "No data available for report"
-    
-    if report_type == "summary":
-        # Count by status
-        status_counts = {}
-        for field in fields:
-            status = field.get("status", "Unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # Calculate average price
-        total_price = sum(field.get("price_per_hour", 0) for field in fields)
-        avg_price = total_price / len(fields) if fields else 0
-        
-        # Calculate total capacity
-        total_capacity = sum(field.get("capacity", 0) for field in fields)
-        
-        # Generate report
-        report = [
-            "Football Fields Summary Report",
-            "==============================",
-            f"Total fields: {len(fields)}",
-            f"Average price per hour: ${avg_price:.2f}",
-            f"Total capacity: {total_capacity}",
-            "\nStatus Distribution:",
-        ]
-        
-        for status, count in status_counts.items():
-            report.append(f"- {status}: {count}")
-        
-        return "\n".join(report)
-    
-    return "Unknown report type"
\ No newline at end of file
+"""
+Export utilities for the Football Field Management System
+"""
+import argparse
+import csv
+import gzip
+import io
+import itertools
+import os
+from config import EXPORT_CHUNK_SIZE
+from utils.reports import format_summary_report
+
+# Columns written by CSV exports, in order; missing values are left empty
+EXPORT_COLUMNS = [
+    "name",
+    "location",
+    "capacity",
+    "price_per_hour",
+    "status",
+    "description",
+    "created_at",
+    "updated_at"
+]
+
+def write_fields_csv(fields, file_path, columns=EXPORT_COLUMNS, compress=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Stream fields from any iterable (list, cursor, generator) into a CSV file"""
+    # Compress when asked, or when the file name ends with .gz
+    if compress is None:
+        compress = file_path.endswith(".gz")
+    
+    try:
+        if compress:
+            output = io.TextIOWrapper(gzip.open(file_path, "wb"), newline="", encoding="utf-8")
+        else:
+            output = open(file_path, "w", newline="", encoding="utf-8")
+        
+        count = 0
+        with output:
+            writer = csv.writer(output)
+            writer.writerow(columns)
+            
+            # Write in chunks so memory stays flat whatever the number of fields
+            iterator = iter(fields)
+            while True:
+                chunk = [
+                    [field.get(column, "") for column in columns]
+                    for field in itertools.islice(iterator, chunk_size)
+                ]
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+                count += len(chunk)
+        
+        return True, count
+    except Exception as e:
+        return False, f"Error exporting fields: {str(e)}"
+
+def export_to_csv(fields, default_filename="football_fields.csv"):
+    """Export fields data to CSV file"""
+    from tkinter import filedialog, messagebox
+    
+    # Peek at the first field so iterators can be checked for data too
+    iterator = iter(fields)
+    first = next(iterator, None)
+    if first is None:
+        messagebox.showerror("Export Error", "No data to export")
+        return False
+    
+    # Ask for file location
+    file_path = filedialog.asksaveasfilename(
+        defaultextension=".csv",
+        filetypes=[("CSV files", "*.csv"), ("Compressed CSV files", "*.csv.gz"), ("All files", "*.*")],
+        initialfile=default_filename
+    )
+    
+    if not file_path:  # User cancelled
+        return False
+    
+    success, result = write_fields_csv(itertools.chain([first], iterator), file_path)
+    if success:
+        messagebox.showinfo("Export Successful", f"Data exported to {os.path.basename(file_path)}")
+        return True
+    else:
+        messagebox.showerror("Export Error", result)
+        return False
+
+def generate_report(fields, report_type="summary"):
+    """Generate a report about an in-memory list of fields (see utils.reports.run_report for the database)"""
+    if not fields:
+        return "No data available for report"
+    
+    if report_type == "summary":
+        # Count by status
+        status_counts = {}
+        for field in fields:
+            status = field.get("status", "Unknown")
+            status_counts[status] = status_counts.get(status, 0) + 1
+        
+        # Calculate average price
+        total_price = sum(field.get("price_per_hour", 0) for field in fields)
+        avg_price = total_price / len(fields) if fields else 0
+        
+        # Calculate total capacity
+        total_capacity = sum(field.get("capacity", 0) for field in fields)
+        
+        # Generate report
+        return format_summary_report(len(fields), avg_price, total_capacity, status_counts)
+    
+    return "Unknown report type"
+
+def main():
+    """Command line entry point for headless (e.g. scheduled) exports"""
+    from database import Database
+    
+    parser = argparse.ArgumentParser(description="Export football fields to CSV")
+    parser.add_argument("path", help="Output file; a .gz extension compresses it")
+    parser.add_argument("--status", help="Only export fields with this status")
+    args = parser.parse_args()
+    
+    db = Database()
+    success, message = db.connect()
+    if not success:
+        parser.exit(1, message + "\n")
+    
+    try:
+        query = {"status": args.status} if args.status else {}
+        success, result = db.get_fields_cursor(query)
+        if success:
+            success, result = write_fields_csv(result, args.path)
+    finally:
+        db.close()
+    
+    if not success:
+        parser.exit(1, result + "\n")
+    print(f"Exported {result} fields to {args.path}")
+
+if __name__ == "__main__":
+    main()
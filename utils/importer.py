@@ -0,0 +1,214 @@
+"""
+Bulk import utilities for the Football Field Management System
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from config import FIELD_STATUS, DEFAULT_FIELD, IMPORT_BATCH_SIZE
+from models.field import Field
+from utils.validation import validate_field_form
+
+def read_rows(path):
+    """Stream (row number, row, error) tuples from a CSV, JSON or NDJSON file"""
+    extension = os.path.splitext(path)[1].lower()
+    
+    if extension == ".csv":
+        # utf-8-sig drops the byte order mark Excel writes, which would otherwise prefix the first header
+        with open(path, newline="", encoding="utf-8-sig") as csvfile:
+            for row_number, row in enumerate(csv.DictReader(csvfile), start=1):
+                yield row_number, row, None
+    
+    elif extension in (".ndjson", ".jsonl"):
+        with open(path, encoding="utf-8") as jsonfile:
+            for row_number, line in enumerate(jsonfile, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield row_number, json.loads(line), None
+                except ValueError as e:
+                    yield row_number, None, f"Invalid JSON: {str(e)}"
+    
+    elif extension == ".json":
+        # A JSON array has to be parsed whole; use NDJSON for very large files
+        with open(path, encoding="utf-8") as jsonfile:
+            for row_number, row in enumerate(json.load(jsonfile), start=1):
+                yield row_number, row, None
+    
+    else:
+        raise ValueError(f"Unsupported file type: {extension}")
+
+def validate_row(row):
+    """Validate an imported row and convert it to a Field"""
+    if not isinstance(row, dict):
+        return None, ["Row must be an object"]
+    
+    name = str(row.get("name") or "").strip()
+    location = str(row.get("location") or "").strip()
+    status = str(row.get("status") or DEFAULT_FIELD["status"]).strip()
+    
+    # Missing numbers take the form defaults
+    capacity = row.get("capacity")
+    if capacity in (None, ""):
+        capacity = DEFAULT_FIELD["capacity"]
+    price_per_hour = row.get("price_per_hour")
+    if price_per_hour in (None, ""):
+        price_per_hour = DEFAULT_FIELD["price_per_hour"]
+    
+    # Same rules as the Add/Edit form
+    try:
+        errors = validate_field_form(name, location, capacity, price_per_hour, status, FIELD_STATUS)
+    except TypeError:
+        errors = ["Capacity and price per hour must be numbers"]
+    if errors:
+        return None, errors
+    
+    field = Field(
+        name=name,
+        location=location,
+        capacity=int(capacity),
+        price_per_hour=float(price_per_hour),
+        status=status,
+        description=str(row.get("description") or "").strip()
+    )
+    
+    errors = field.validate()
+    if errors:
+        return None, errors
+    
+    return field, []
+
+def load_checkpoint(checkpoint_path, path):
+    """Get the number of rows already imported from a file"""
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return 0
+    
+    with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+        checkpoint = json.load(checkpoint_file)
+    
+    # A checkpoint of another file does not apply
+    if checkpoint.get("path") != os.path.abspath(path):
+        return 0
+    return checkpoint.get("rows_done", 0)
+
+def save_checkpoint(checkpoint_path, path, rows_done):
+    """Record the number of rows imported from a file"""
+    if not checkpoint_path:
+        return
+    
+    temp_path = checkpoint_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+        json.dump({"path": os.path.abspath(path), "rows_done": rows_done}, checkpoint_file)
+    os.replace(temp_path, checkpoint_path)
+
+def import_fields(db, path, batch_size=IMPORT_BATCH_SIZE, checkpoint_path=None, error_path=None,
+                  progress_callback=None):
+    """Import fields from a file with batched unordered inserts"""
+    # Resume after the last written batch. A crash between a batch insert and
+    # its checkpoint re-imports that batch.
+    start_row = load_checkpoint(checkpoint_path, path)
+    stats = {"read": 0, "skipped": start_row, "inserted": 0, "errors": 0, "rows_per_second": 0.0}
+    started = time.perf_counter()
+    
+    error_file = open(error_path, "a" if start_row else "w", newline="", encoding="utf-8") if error_path else None
+    error_writer = csv.writer(error_file) if error_file else None
+    if error_writer and not start_row:
+        error_writer.writerow(["row", "errors"])
+    
+    def report_error(row_number, errors):
+        stats["errors"] += 1
+        if error_writer:
+            error_writer.writerow([row_number, "; ".join(errors)])
+    
+    batch = []
+    batch_rows = []
+    last_row = start_row
+    
+    def flush():
+        if batch:
+            # One timestamp per batch instead of one per field
+            success, result = db.bulk_create_fields(Field.to_documents(batch))
+            if not success:
+                raise RuntimeError(result)
+            
+            stats["inserted"] += result["inserted"]
+            for index, message in result["errors"]:
+                report_error(batch_rows[index], [message])
+        
+        save_checkpoint(checkpoint_path, path, last_row)
+        batch.clear()
+        batch_rows.clear()
+        
+        elapsed = time.perf_counter() - started
+        stats["rows_per_second"] = stats["read"] / elapsed if elapsed else 0.0
+        if progress_callback:
+            progress_callback(dict(stats))
+    
+    try:
+        for row_number, row, error in read_rows(path):
+            if row_number <= start_row:
+                continue
+            
+            stats["read"] += 1
+            last_row = row_number
+            
+            if error:
+                report_error(row_number, [error])
+                continue
+            
+            field, errors = validate_row(row)
+            if errors:
+                report_error(row_number, errors)
+                continue
+            
+            batch.append(field)
+            batch_rows.append(row_number)
+            if len(batch) >= batch_size:
+                flush()
+        
+        flush()
+    finally:
+        if error_file:
+            error_file.close()
+    
+    return stats
+
+def main():
+    """Command line entry point for bulk imports"""
+    from database import Database
+    
+    parser = argparse.ArgumentParser(description="Import football fields from CSV, JSON or NDJSON")
+    parser.add_argument("path", help="File to import")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Fields per insert batch")
+    parser.add_argument("--checkpoint", help="Checkpoint file for resuming an interrupted import")
+    parser.add_argument("--errors", help="CSV file receiving rejected rows")
+    args = parser.parse_args()
+    
+    db = Database()
+    success, message = db.connect()
+    if not success:
+        parser.exit(1, message + "\n")
+    
+    def show_progress(stats):
+        print(f"{stats['read']} rows read, {stats['inserted']} inserted, "
+              f"{stats['errors']} errors ({stats['rows_per_second']:.0f} rows/s)")
+    
+    try:
+        stats = import_fields(
+            db,
+            args.path,
+            batch_size=args.batch_size,
+            checkpoint_path=args.checkpoint,
+            error_path=args.errors,
+            progress_callback=show_progress
+        )
+    finally:
+        db.close()
+    
+    print(f"Done: {stats['inserted']} fields imported, {stats['errors']} rows rejected, "
+          f"{stats['rows_per_second']:.0f} rows/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Interval tree for the Football Field Management System
+"""
+
+class IntervalNode:
+    """Node of an interval tree: one interval and the largest end below it"""
+    
+    __slots__ = ("start", "end", "key", "value", "max_end", "height", "left", "right")
+    
+    def __init__(self, start, end, key, value):
+        """Initialize the node"""
+        self.start = start
+        self.end = end
+        self.key = key
+        self.value = value
+        self.max_end = end
+        self.height = 1
+        self.left = None
+        self.right = None
+
+def height(node):
+    """Height of a subtree (0 when empty)"""
+    return node.height if node else 0
+
+def update(node):
+    """Recompute the height and max end of a node from its children"""
+    node.height = 1 + max(height(node.left), height(node.right))
+    node.max_end = node.end
+    if node.left and node.left.max_end > node.max_end:
+        node.max_end = node.left.max_end
+    if node.right and node.right.max_end > node.max_end:
+        node.max_end = node.right.max_end
+    return node
+
+def rotate_right(node):
+    """Rotate a subtree right"""
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = update(node)
+    return update(pivot)
+
+def rotate_left(node):
+    """Rotate a subtree left"""
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = update(node)
+    return update(pivot)
+
+def rebalance(node):
+    """Restore the AVL balance of a subtree"""
+    update(node)
+    balance = height(node.left) - height(node.right)
+    if balance > 1:
+        if height(node.left.left) < height(node.left.right):
+            node.left = rotate_left(node.left)
+        return rotate_right(node)
+    if balance < -1:
+        if height(node.right.right) < height(node.right.left):
+            node.right = rotate_right(node.right)
+        return rotate_left(node)
+    return node
+
+class IntervalTree:
+    """Balanced (AVL) tree of half-open [start, end) intervals augmented with the max end"""
+    
+    def __init__(self):
+        """Initialize an empty tree"""
+        # Insert, remove and find_overlap run in O(log n), find_overlapping in O(log n + k)
+        self.root = None
+        self.size = 0
+    
+    def __len__(self):
+        """Number of intervals in the tree"""
+        return self.size
+    
+    def __iter__(self):
+        """Iterate over (start, end, value) in start order"""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.end, node.value
+            node = node.right
+    
+    def insert(self, start, end, key, value=None):
+        """Add an interval; key tells apart intervals with the same start"""
+        if not start < end:
+            raise ValueError("An interval must end after it starts")
+        self.root = self._insert(self.root, IntervalNode(start, end, key, value))
+        self.size += 1
+    
+    def _insert(self, node, new):
+        """Insert a node into a subtree and return the subtree's new root"""
+        if node is None:
+            return new
+        if (new.start, new.key) < (node.start, node.key):
+            node.left = self._insert(node.left, new)
+        else:
+            node.right = self._insert(node.right, new)
+        return rebalance(node)
+    
+    def remove(self, start, key):
+        """Remove the interval with this start and key; return whether it was found"""
+        size = self.size
+        self.root = self._remove(self.root, start, key)
+        return self.size < size
+    
+    def _remove(self, node, start, key):
+        """Remove a node from a subtree and return the subtree's new root"""
+        if node is None:
+            return None
+        if (start, key) < (node.start, node.key):
+            node.left = self._remove(node.left, start, key)
+        elif (start, key) > (node.start, node.key):
+            node.right = self._remove(node.right, start, key)
+        else:
+            self.size -= 1
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            
+            # Replace the node with its in-order successor
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.right = self._remove_min(node.right)
+            successor.left = node.left
+            successor.right = node.right
+            node = successor
+        return rebalance(node)
+    
+    def _remove_min(self, node):
+        """Detach the smallest node of a subtree"""
+        if node.left is None:
+            return node.right
+        node.left = self._remove_min(node.left)
+        return rebalance(node)
+    
+    def find_overlap(self, start, end):
+        """Get one interval overlapping [start, end) as (start, end, value), or None"""
+        node = self.root
+        while node:
+            if node.start < end and start < node.end:
+                return node.start, node.end, node.value
+            # If the left subtree reaches past start it holds an overlap, if any exists
+            if node.left and node.left.max_end > start:
+                node = node.left
+            else:
+                node = node.right
+        return None
+    
+    def find_overlapping(self, start, end):
+        """Get every interval overlapping [start, end) as (start, end, value), in start order"""
+        result = []
+        self._collect(self.root, start, end, result)
+        return result
+    
+    def _collect(self, node, start, end, result):
+        """Collect the overlaps of a subtree"""
+        if node is None or node.max_end <= start:
+            return
+        self._collect(node.left, start, end, result)
+        if node.start < end:
+            if start < node.end:
+                result.append((node.start, node.end, node.value))
+            self._collect(node.right, start, end, result)
@@ -0,0 +1,223 @@
+"""
+Latency instrumentation for the Football Field Management System
+"""
+import bisect
+import functools
+import os
+import threading
+import time
+import types
+from config import METRICS_ENABLED, METRICS_BUCKETS
+
+# Prefix of the exported Prometheus metric names
+METRIC_PREFIX = "field_manager_operation"
+
+def result_size(result):
+    """Count the documents in a (success, result) return value and their BSON size in bytes"""
+    if not (isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], bool)):
+        return 0, 0
+    result = result[1]
+    
+    # get_fields_page returns (fields, next cursor)
+    if isinstance(result, tuple) and result and isinstance(result[0], list):
+        result = result[0]
+    
+    if isinstance(result, dict):
+        result = [result]
+    if not isinstance(result, list):
+        return 0, 0
+    
+    # Imported here so the GUI can start before bson is loaded
+    import bson
+    
+    # Only stored documents count, not summaries such as bulk insert counts
+    count = size = 0
+    for document in result:
+        if isinstance(document, dict) and "_id" in document:
+            count += 1
+            try:
+                size += len(bson.encode(document))
+            except (bson.errors.InvalidDocument, TypeError, OverflowError):
+                pass
+    return count, size
+
+class OperationStats:
+    """Latency histogram, error count, documents and bytes of one operation"""
+    
+    __slots__ = ("count", "errors", "total", "maximum", "buckets", "documents", "bytes")
+    
+    def __init__(self, bucket_count):
+        """Initialize empty stats"""
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        
+        # One counter per bucket bound plus one for anything slower
+        self.buckets = [0] * (bucket_count + 1)
+        self.documents = 0
+        self.bytes = 0
+    
+    def percentile(self, fraction, bounds):
+        """Estimate a latency percentile (seconds) by interpolating inside its bucket"""
+        if not self.count:
+            return 0.0
+        
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            if count and seen + count >= rank:
+                lower = bounds[index - 1] if index else 0.0
+                upper = bounds[index] if index < len(bounds) else self.maximum
+                return lower + (min(upper, self.maximum) - lower) * (rank - seen) / count
+            seen += count
+        return self.maximum
+
+class Metrics:
+    """Thread-safe registry of operation stats, exportable in Prometheus text format"""
+    
+    def __init__(self, enabled=METRICS_ENABLED, buckets=METRICS_BUCKETS):
+        """Initialize the registry"""
+        self.enabled = enabled
+        self.bounds = sorted(buckets)
+        self.operations = {}
+        self.lock = threading.Lock()
+    
+    def record(self, name, seconds, documents=0, size=0, error=False):
+        """Record one call of an operation"""
+        index = bisect.bisect_left(self.bounds, seconds)
+        with self.lock:
+            stats = self.operations.get(name)
+            if stats is None:
+                stats = self.operations[name] = OperationStats(len(self.bounds))
+            stats.count += 1
+            stats.total += seconds
+            stats.maximum = max(stats.maximum, seconds)
+            stats.buckets[index] += 1
+            stats.documents += documents
+            stats.bytes += size
+            if error:
+                stats.errors += 1
+    
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self.lock:
+            self.operations = {}
+    
+    def wrap(self, name, function, measure=None):
+        """Wrap a callable so each call is recorded under name"""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except Exception:
+                self.record(name, time.perf_counter() - started, error=True)
+                raise
+            elapsed = time.perf_counter() - started
+            
+            # A (False, message) return is a failed call
+            error = isinstance(result, tuple) and len(result) == 2 and result[0] is False
+            documents, size = measure(result) if measure and not error else (0, 0)
+            self.record(name, elapsed, documents, size, error)
+            return result
+        return wrapper
+    
+    def instrument(self, obj, prefix, cls=None, measure=None, exclude=()):
+        """Record every public method cls defines (default: the object's class) when enabled"""
+        # Nothing is wrapped while metrics are off, so calls cost nothing extra
+        if not self.enabled:
+            return obj
+        
+        # Instance attributes shadow the methods, so calls through super() are not counted twice
+        for name, attribute in vars(cls or type(obj)).items():
+            if name.startswith("_") or name in exclude or not isinstance(attribute, types.FunctionType):
+                continue
+            setattr(obj, name, self.wrap(f"{prefix}.{name}", getattr(obj, name), measure))
+        return obj
+    
+    def snapshot(self):
+        """Get the stats of every operation as dictionaries, by name"""
+        rows = {}
+        with self.lock:
+            for name, stats in sorted(self.operations.items()):
+                rows[name] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "mean": stats.total / stats.count if stats.count else 0.0,
+                    "p50": stats.percentile(0.5, self.bounds),
+                    "p95": stats.percentile(0.95, self.bounds),
+                    "p99": stats.percentile(0.99, self.bounds),
+                    "max": stats.maximum,
+                    "total": stats.total,
+                    "documents": stats.documents,
+                    "bytes": stats.bytes,
+                    "buckets": list(stats.buckets)
+                }
+        return rows
+    
+    def group_summary(self):
+        """Summarize the calls of each prefix (db, mongo, ui) for the status bar"""
+        with self.lock:
+            groups = {}
+            for name, stats in self.operations.items():
+                prefix = name.split(".", 1)[0]
+                group = groups.get(prefix)
+                if group is None:
+                    group = groups[prefix] = OperationStats(len(self.bounds))
+                group.count += stats.count
+                group.errors += stats.errors
+                group.total += stats.total
+                group.maximum = max(group.maximum, stats.maximum)
+                group.buckets = [a + b for a, b in zip(group.buckets, stats.buckets)]
+        
+        parts = []
+        for prefix, group in sorted(groups.items()):
+            part = f"{prefix} {group.count} calls, p95 {group.percentile(0.95, self.bounds) * 1000:.0f}ms"
+            if group.errors:
+                part += f", {group.errors} errors"
+            parts.append(part)
+        return " | ".join(parts)
+    
+    def to_prometheus(self):
+        """Render the stats in the Prometheus text exposition format"""
+        rows = self.snapshot()
+        lines = [
+            f"# HELP {METRIC_PREFIX}_seconds Latency of database calls, MongoDB commands and UI handlers",
+            f"# TYPE {METRIC_PREFIX}_seconds histogram"
+        ]
+        for name, row in rows.items():
+            label = f'operation="{name}"'
+            cumulative = 0
+            for bound, count in zip(self.bounds + [float("inf")], row["buckets"]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f'{METRIC_PREFIX}_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f"{METRIC_PREFIX}_seconds_sum{{{label}}} {row['total']!r}")
+            lines.append(f"{METRIC_PREFIX}_seconds_count{{{label}}} {row['count']}")
+        
+        for metric, key, help_text in (
+            ("errors_total", "errors", "Failed calls"),
+            ("documents_total", "documents", "Documents returned or written"),
+            ("bytes_total", "bytes", "BSON size of the documents returned or written")
+        ):
+            lines.append(f"# HELP {METRIC_PREFIX}_{metric} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{metric} counter")
+            for name, row in rows.items():
+                lines.append(f'{METRIC_PREFIX}_{metric}{{operation="{name}"}} {row[key]}')
+        return "\n".join(lines) + "\n"
+    
+    def write_prometheus(self, path):
+        """Write the stats to a file for a scraper (e.g. the node exporter textfile collector)"""
+        # Write a temporary file and rename it, so a scraper never reads half a file
+        temporary = f"{path}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.write(self.to_prometheus())
+            os.replace(temporary, path)
+            return True, path
+        except OSError as e:
+            return False, f"Error writing metrics: {str(e)}"
+
+# Process-wide registry
+metrics = Metrics()
@@ -0,0 +1,202 @@
+"""
+On-demand profiling for the Football Field Management System
+
+cProfile, pstats and tracemalloc are imported when a session starts, not at startup.
+"""
+import functools
+import io
+import os
+import threading
+import time
+import types
+from datetime import datetime
+from config import PROFILE_DIR, PROFILE_TOP, PROFILE_TRACEBACK_FRAMES
+
+def take_snapshot():
+    """Take a tracemalloc snapshot without the profiler's own allocations"""
+    import pstats
+    import tracemalloc
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, pstats.__file__),
+        tracemalloc.Filter(False, __file__)
+    ))
+
+class ProfileSession:
+    """Profiles and allocations collected while the profiler is running"""
+    
+    def __init__(self, operations):
+        """Initialize a session ending after operations counted calls (0 to run until stopped)"""
+        self.remaining = operations
+        self.started_at = datetime.now()
+        self.started = time.perf_counter()
+        
+        # One cProfile profile for the session, enabled by one thread's call at a time,
+        # and (name, thread, seconds) of each profiled call
+        import cProfile
+        self.profile = cProfile.Profile()
+        self.owner = None
+        self.operations = []
+        
+        # Allocations are compared with the heap at the start
+        import tracemalloc
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start(PROFILE_TRACEBACK_FRAMES)
+        self.baseline = take_snapshot()
+
+class Profiler:
+    """Wrap named operations in cProfile and tracemalloc for the next N calls or a time window"""
+    
+    def __init__(self, directory=PROFILE_DIR):
+        """Initialize an idle profiler"""
+        self.directory = directory
+        self.session = None
+        self.lock = threading.Lock()
+        
+        # Per-thread nesting, so only the outermost operation of a thread is profiled
+        self.local = threading.local()
+        
+        # Called as on_finish(success, result) when a session that ran out of operations is written
+        self.on_finish = None
+    
+    def is_running(self):
+        """Check whether a session is collecting"""
+        return self.session is not None
+    
+    def start(self, operations=0):
+        """Profile the next operations counted calls, or until stop() (e.g. for a time window)"""
+        with self.lock:
+            if self.session is not None:
+                return False, "Profiling is already running"
+            self.session = ProfileSession(operations)
+        return True, self.session
+    
+    def stop(self):
+        """End the session and write its reports; returns (success, (pstats path, report path))"""
+        with self.lock:
+            session, self.session = self.session, None
+        if session is None:
+            return False, "Profiling is not running"
+        
+        snapshot = take_snapshot()
+        if session.started_tracing:
+            import tracemalloc
+            tracemalloc.stop()
+        return self.write(session, snapshot)
+    
+    def wrap(self, name, function, counts=False):
+        """Wrap a callable so it is profiled while a session runs"""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # One attribute check while idle
+            if self.session is None or getattr(self.local, "active", False):
+                return function(*args, **kwargs)
+            
+            # Only one profiler can be active (Python 3.12+ refuses a second one), so a
+            # call made while another thread is being profiled runs without profiling
+            session = self.claim()
+            if session is None:
+                return function(*args, **kwargs)
+            
+            self.local.active = True
+            started = time.perf_counter()
+            try:
+                session.profile.enable()
+            except ValueError:
+                # Another profiling tool (e.g. a debugger) is active
+                self.release(session)
+                self.local.active = False
+                return function(*args, **kwargs)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                session.profile.disable()
+                self.release(session)
+                self.local.active = False
+                self.add(name, time.perf_counter() - started, counts)
+        return wrapper
+    
+    def claim(self):
+        """Take the session profile for the current thread, or None if idle or taken"""
+        with self.lock:
+            session = self.session
+            if session is None or session.owner is not None:
+                return None
+            session.owner = threading.get_ident()
+            return session
+    
+    def release(self, session):
+        """Give the session profile back"""
+        with self.lock:
+            session.owner = None
+    
+    def instrument(self, obj, prefix, cls=None, counts=False, exclude=()):
+        """Profile every public method cls defines (default: the object's class) during sessions"""
+        for name, attribute in vars(cls or type(obj)).items():
+            if name.startswith("_") or name in exclude or not isinstance(attribute, types.FunctionType):
+                continue
+            setattr(obj, name, self.wrap(f"{prefix}.{name}", getattr(obj, name), counts))
+        return obj
+    
+    def add(self, name, seconds, counts):
+        """Merge a profiled call into the session, ending it after the last counted call"""
+        with self.lock:
+            session = self.session
+            if session is None:
+                return
+            session.operations.append((name, threading.current_thread().name, seconds))
+            
+            finished = False
+            if counts and session.remaining:
+                session.remaining -= 1
+                finished = session.remaining == 0
+        
+        if finished:
+            result = self.stop()
+            if self.on_finish:
+                self.on_finish(*result)
+    
+    def write(self, session, snapshot):
+        """Write the .pstats file and the text report of a session"""
+        elapsed = time.perf_counter() - session.started
+        base = os.path.join(self.directory, f"profile-{session.started_at:%Y%m%d-%H%M%S}")
+        pstats_path = f"{base}.pstats"
+        report_path = f"{base}.txt"
+        
+        report = io.StringIO()
+        report.write(f"Profile started {session.started_at:%Y-%m-%d %H:%M:%S}, "
+                     f"{len(session.operations)} operations in {elapsed:.1f}s\n\n")
+        
+        # No stats when no call was profiled
+        stats = None
+        if session.operations:
+            import pstats
+            stats = pstats.Stats(session.profile)
+        
+        report.write("Operations (name, thread, duration):\n")
+        for name, thread, seconds in session.operations:
+            report.write(f"  {name:<40} {thread:<16} {seconds * 1000:10.1f}ms\n")
+        
+        if stats is not None:
+            report.write(f"\nTop {PROFILE_TOP} functions by cumulative time:\n")
+            stats.stream = report
+            stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+        
+        report.write(f"\nTop {PROFILE_TOP} allocations still held (growth since the start):\n")
+        for statistic in snapshot.compare_to(session.baseline, "lineno")[:PROFILE_TOP]:
+            report.write(f"  {statistic}\n")
+        
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if stats is not None:
+                stats.dump_stats(pstats_path)
+            with open(report_path, "w", encoding="utf-8") as file:
+                file.write(report.getvalue())
+        except OSError as e:
+            return False, f"Error writing profile: {str(e)}"
+        
+        return True, (pstats_path if stats is not None else None, report_path)
+
+# Process-wide profiler
+profiler = Profiler()
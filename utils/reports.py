@@ -0,0 +1,252 @@
+"""
+Database-side reports for the Football Field Management System
+
+Run with: python -m utils.reports [summary|location|price_percentiles|capacity_distribution]
+"""
+import argparse
+import math
+from config import REPORT_CAPACITY_BUCKETS, REPORT_PERCENTILES
+
+# Report types supported by run_report
+REPORT_TYPES = ["summary", "location", "price_percentiles", "capacity_distribution"]
+
+def summary_pipeline():
+    """Totals and status distribution in one round trip"""
+    return [
+        {"$facet": {
+            "totals": [
+                {"$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "avg_price": {"$avg": "$price_per_hour"},
+                    "total_capacity": {"$sum": "$capacity"}
+                }}
+            ],
+            "statuses": [
+                {"$group": {"_id": {"$ifNull": ["$status", "Unknown"]}, "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}}
+            ]
+        }}
+    ]
+
+def location_pipeline():
+    """Per-location breakdown"""
+    return [
+        {"$group": {
+            "_id": "$location",
+            "count": {"$sum": 1},
+            "available": {"$sum": {"$cond": [{"$eq": ["$status", "Available"]}, 1, 0]}},
+            "avg_price": {"$avg": "$price_per_hour"},
+            "total_capacity": {"$sum": "$capacity"}
+        }},
+        {"$sort": {"count": -1, "_id": 1}}
+    ]
+
+def percentile_rank(count, p):
+    """Zero-based rank of percentile p among count sorted values (nearest rank, as $percentile computes it)"""
+    return max(0, math.ceil(count * p) - 1)
+
+def price_percentiles_pipeline():
+    """Price percentiles using $percentile (MongoDB 7.0+)"""
+    # Only numeric prices, which are the ones $percentile and the fallback below rank
+    return [
+        {"$match": {"price_per_hour": {"$type": "number"}}},
+        {"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "min": {"$min": "$price_per_hour"},
+            "max": {"$max": "$price_per_hour"},
+            "percentiles": {"$percentile": {
+                "input": "$price_per_hour",
+                "p": REPORT_PERCENTILES,
+                "method": "approximate"
+            }}
+        }}
+    ]
+
+def price_range_pipeline():
+    """Count, minimum and maximum price, for servers without $percentile"""
+    return [
+        {"$match": {"price_per_hour": {"$type": "number"}}},
+        {"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "min": {"$min": "$price_per_hour"},
+            "max": {"$max": "$price_per_hour"}
+        }}
+    ]
+
+def price_ranks_pipeline(count):
+    """The price at the rank of each percentile among count sorted prices (uses the price index)"""
+    # One $skip/$limit per percentile, so no stage ever holds more than one price
+    return [
+        {"$match": {"price_per_hour": {"$type": "number"}}},
+        {"$sort": {"price_per_hour": 1}},
+        {"$project": {"_id": 0, "price_per_hour": 1}},
+        {"$facet": {
+            f"p{index}": [{"$skip": percentile_rank(count, p)}, {"$limit": 1}]
+            for index, p in enumerate(REPORT_PERCENTILES)
+        }}
+    ]
+
+def read_price_ranks(db, count):
+    """Read the price at each percentile's rank among count numeric prices"""
+    success, result = db.aggregate_fields(price_ranks_pipeline(count))
+    if not success:
+        return False, result
+    
+    ranks = result[0]
+    return True, [
+        ranks[f"p{index}"][0]["price_per_hour"] if ranks[f"p{index}"] else None
+        for index in range(len(REPORT_PERCENTILES))
+    ]
+
+def capacity_distribution_pipeline():
+    """Number of fields per capacity bucket"""
+    return [
+        {"$bucket": {
+            "groupBy": "$capacity",
+            "boundaries": REPORT_CAPACITY_BUCKETS,
+            "default": "other",
+            "output": {"count": {"$sum": 1}}
+        }}
+    ]
+
+def format_summary_report(total, avg_price, total_capacity, status_counts):
+    """Format the summary report text"""
+    report = [
+        "Football Fields Summary Report",
+        "==============================",
+        f"Total fields: {total}",
+        f"Average price per hour: ${avg_price:.2f}",
+        f"Total capacity: {total_capacity}",
+        "\nStatus Distribution:",
+    ]
+    
+    for status, count in status_counts.items():
+        report.append(f"- {status}: {count}")
+    
+    return "\n".join(report)
+
+def format_location_report(rows):
+    """Format the per-location report text"""
+    report = [
+        "Football Fields by Location",
+        "===========================",
+    ]
+    
+    for row in rows:
+        report.append(
+            f"- {row['_id'] or 'Unknown'}: {row['count']} fields, {row['available']} available, "
+            f"average ${row['avg_price'] or 0:.2f}/hour, total capacity {row['total_capacity']}"
+        )
+    
+    return "\n".join(report)
+
+def format_price_percentiles_report(row):
+    """Format the price percentiles report text"""
+    report = [
+        "Price per Hour Percentiles",
+        "==========================",
+        f"Fields: {row['count']}",
+        f"Minimum: ${row['min'] or 0:.2f}",
+    ]
+    
+    for p, value in zip(REPORT_PERCENTILES, row["percentiles"]):
+        report.append(f"P{p * 100:g}: ${value or 0:.2f}")
+    
+    report.append(f"Maximum: ${row['max'] or 0:.2f}")
+    return "\n".join(report)
+
+def format_capacity_distribution_report(rows):
+    """Format the capacity distribution report text"""
+    report = [
+        "Capacity Distribution",
+        "=====================",
+    ]
+    
+    # Label each bucket by its range, e.g. "11-14"
+    upper_bounds = dict(zip(REPORT_CAPACITY_BUCKETS, REPORT_CAPACITY_BUCKETS[1:]))
+    for row in rows:
+        if row["_id"] == "other":
+            label = "Other"
+        else:
+            label = f"{row['_id']}-{upper_bounds[row['_id']] - 1}"
+        report.append(f"- {label}: {row['count']}")
+    
+    return "\n".join(report)
+
+def run_report(db, report_type="summary"):
+    """Run a report as an aggregation pipeline and return its text"""
+    if report_type == "summary":
+        success, result = db.aggregate_fields(summary_pipeline())
+        if not success:
+            return False, result
+        
+        facets = result[0]
+        if not facets["totals"]:
+            return True, "No data available for report"
+        
+        totals = facets["totals"][0]
+        status_counts = {row["_id"]: row["count"] for row in facets["statuses"]}
+        return True, format_summary_report(
+            totals["count"],
+            totals["avg_price"] or 0,
+            totals["total_capacity"],
+            status_counts
+        )
+    
+    if report_type == "location":
+        success, result = db.aggregate_fields(location_pipeline())
+        if not success:
+            return False, result
+        return True, format_location_report(result)
+    
+    if report_type == "price_percentiles":
+        # Servers without $percentile (before 7.0) return the price range instead
+        success, result = db.aggregate_fields(price_percentiles_pipeline(), fallback=price_range_pipeline())
+        if not success:
+            return False, result
+        if not result:
+            return True, "No data available for report"
+        
+        row = result[0]
+        if "percentiles" not in row:
+            success, result = read_price_ranks(db, row["count"])
+            if not success:
+                return False, result
+            row["percentiles"] = result
+        return True, format_price_percentiles_report(row)
+    
+    if report_type == "capacity_distribution":
+        success, result = db.aggregate_fields(capacity_distribution_pipeline())
+        if not success:
+            return False, result
+        return True, format_capacity_distribution_report(result)
+    
+    return False, "Unknown report type"
+
+def main():
+    """Command line entry point for reports"""
+    from database import Database
+    
+    parser = argparse.ArgumentParser(description="Print a report computed by the database server")
+    parser.add_argument("report_type", nargs="?", default="summary", choices=REPORT_TYPES, help="Report to run")
+    args = parser.parse_args()
+    
+    db = Database()
+    success, message = db.connect()
+    if not success:
+        parser.exit(1, message + "\n")
+    
+    try:
+        success, result = run_report(db, args.report_type)
+    finally:
+        db.close()
+    
+    if not success:
+        parser.exit(1, result + "\n")
+    print(result)
+
+if __name__ == "__main__":
+    main()